@@ -7,6 +7,7 @@ LLM 및 임베딩 모델 인스턴스를 생성하는 팩토리 함수를 제공
 """
 
 import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from glob import glob
@@ -53,12 +54,34 @@ class Settings:
             return f"mysql+pymysql://{self.mysql_user}:{self.mysql_password}@{self.mysql_host}:{self.mysql_port}/{self.mysql_db}"
         return f"mysql+pymysql://{self.mysql_user}@{self.mysql_host}:{self.mysql_port}/{self.mysql_db}"
 
+    @property
+    def async_database_url(self) -> str:
+        """비동기 읽기 경로(AsyncEngine)용 URL - 같은 DB를 aiomysql 드라이버로 접속"""
+        return self.database_url.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+
     # LLM 설정
     llm_provider: str = os.getenv(
         "LLM_PROVIDER", "openai"
     )  # LLM 제공자: openai, ollama, huggingface
     model_name: str = os.getenv("MODEL_NAME", "gpt-4o-mini")  # 사용할 모델 이름
 
+    # LLM HTTP 커넥션 풀 설정 (get_llm()이 공유하는 OpenAI 호환 클라이언트용)
+    llm_http_max_connections: int = int(
+        os.getenv("LLM_HTTP_MAX_CONNECTIONS", "100")
+    )  # 프로세스당 LLM 서버로 여는 최대 동시 연결 수
+    llm_http_max_keepalive_connections: int = int(
+        os.getenv("LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+    )  # 요청 후 재사용을 위해 열어 두는 연결 수
+    llm_http_keepalive_expiry_seconds: float = float(
+        os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS", "30")
+    )  # 유휴 연결을 닫기까지의 시간 (초)
+    llm_connect_timeout_seconds: float = float(
+        os.getenv("LLM_CONNECT_TIMEOUT_SECONDS", "5")
+    )  # TCP/TLS 연결 제한 시간 (초)
+    llm_request_timeout_seconds: float = float(
+        os.getenv("LLM_REQUEST_TIMEOUT_SECONDS", "60")
+    )  # 응답 읽기/전송 제한 시간 (초)
+
     # 임베딩 설정
     embedding_model_name: str = os.getenv(
         "EMBEDDING_MODEL_NAME", "text-embedding-3-small"
@@ -75,6 +98,110 @@ class Settings:
     pinecone_index_name: str = os.getenv("PINECONE_INDEX_NAME", "majors-index")
     pinecone_namespace: str = os.getenv("PINECONE_NAMESPACE", "majors")
     pinecone_dimension: int = int(os.getenv("PINECONE_DIMENSION", "0") or "0")
+    pinecone_pool_threads: int = int(
+        os.getenv("PINECONE_POOL_THREADS", "0") or "0"
+    )  # 인덱스 핸들의 요청 스레드 수 (0이면 SDK 기본값: CPU 수 x 5)
+    pinecone_connection_pool_maxsize: int = int(
+        os.getenv("PINECONE_CONNECTION_POOL_MAXSIZE", "0") or "0"
+    )  # 인덱스 핸들이 유지하는 HTTP keep-alive 연결 수 (0이면 SDK 기본값)
+
+    # 벡터 검색 백엔드 설정
+    vector_backend: str = os.getenv(
+        "VECTOR_BACKEND", "pinecone"
+    )  # 벡터 검색 백엔드: pinecone, local (NumPy 스냅샷)
+    vector_snapshot_dir: str = os.getenv(
+        "VECTOR_SNAPSHOT_DIR", "backend/data/vector_snapshot"
+    )  # local 백엔드가 읽는 네임스페이스별 스냅샷 경로
+
+    # 벡터 인덱싱(ingestion) 설정
+    ingest_batch_size: int = int(
+        os.getenv("INGEST_BATCH_SIZE", "100")
+    )  # 임베딩/업서트 한 번에 보내는 문서 수
+    ingest_max_workers: int = int(
+        os.getenv("INGEST_MAX_WORKERS", "4")
+    )  # 동시에 처리할 배치 수 (스레드 풀 크기)
+    ingest_max_retries: int = int(
+        os.getenv("INGEST_MAX_RETRIES", "3")
+    )  # 배치 실패 시 재시도 횟수 (지수 백오프)
+
+    # 전공 검색(_find_majors) 병렬 실행 설정
+    find_majors_deadline_seconds: float = float(
+        os.getenv("FIND_MAJORS_DEADLINE_SECONDS", "6")
+    )  # 요청당 제한 시간 (초). 초과한 단계(LLM 검증 등)는 건너뜀
+    find_majors_max_workers: int = int(
+        os.getenv("FIND_MAJORS_MAX_WORKERS", "8")
+    )  # 벡터 검색/LLM 검증을 실행하는 공유 스레드 풀 크기
+
+    # LLM 후보 검증(_verify_with_llm) 결과 캐시 설정
+    llm_verify_cache_enabled: bool = (
+        os.getenv("LLM_VERIFY_CACHE_ENABLED", "true").lower() == "true"
+    )  # false로 설정하면 매번 LLM에 후보 검증을 요청
+    llm_verify_cache_ttl_seconds: int = int(
+        os.getenv("LLM_VERIFY_CACHE_TTL_SECONDS", "604800")
+    )  # 후보를 선택한 결과의 보관 시간 (기본 7일)
+    llm_verify_cache_negative_ttl_seconds: int = int(
+        os.getenv("LLM_VERIFY_CACHE_NEGATIVE_TTL_SECONDS", "86400")
+    )  # LLM이 "적합한 후보 없음(0)"을 반환한 결과의 보관 시간 (기본 1일)
+    llm_verify_cache_max_entries: int = int(
+        os.getenv("LLM_VERIFY_CACHE_MAX_ENTRIES", "20000")
+    )  # 디스크 캐시 최대 항목 수
+
+    # 툴 결과 캐시 설정 (list_departments 등 @tool 함수)
+    tool_cache_enabled: bool = (
+        os.getenv("TOOL_CACHE_ENABLED", "true").lower() == "true"
+    )  # false면 실행 단위 메모만 사용 (요청 간 공유 캐시 비활성화)
+    tool_cache_max_entries: int = int(
+        os.getenv("TOOL_CACHE_MAX_ENTRIES", "20000")
+    )  # 공유 캐시(SQLite) 최대 항목 수
+
+    # 시맨틱 답변 캐시 설정 (대화 기록이 없는 첫 질문의 최종 답변 재사용)
+    answer_cache_enabled: bool = (
+        os.getenv("ANSWER_CACHE_ENABLED", "false").lower() == "true"
+    )  # 기본 비활성화 (opt-in)
+    answer_cache_similarity_threshold: float = float(
+        os.getenv("ANSWER_CACHE_SIMILARITY_THRESHOLD", "0.95")
+    )  # 질문 임베딩 코사인 유사도가 이 값 이상이면 같은 질문으로 간주
+    answer_cache_ttl_seconds: int = int(
+        os.getenv("ANSWER_CACHE_TTL_SECONDS", "86400")
+    )  # 답변 보관 시간 (초). 데이터 버전이 바뀌면 TTL과 무관하게 무효화
+    answer_cache_max_entries: int = int(
+        os.getenv("ANSWER_CACHE_MAX_ENTRIES", "5000")
+    )  # 저장할 최대 답변 수
+
+    # 온보딩 전공 추천 방식
+    recommendation_engine: str = os.getenv(
+        "RECOMMENDATION_ENGINE", "exact"
+    )  # "exact": 전체 전공 문서를 메모리에서 정확히 채점, "vector": 벡터 검색 상위 50개 문서만 집계
+
+    # 온보딩 전공 추천 결과 캐시 설정 (정규화된 답변 → 추천 결과)
+    recommendation_cache_enabled: bool = (
+        os.getenv("RECOMMENDATION_CACHE_ENABLED", "true").lower() == "true"
+    )  # false면 제출마다 임베딩/벡터 검색 실행
+    recommendation_cache_ttl_seconds: int = int(
+        os.getenv("RECOMMENDATION_CACHE_TTL_SECONDS", "604800")
+    )  # 추천 결과 보관 시간 (기본 7일). 데이터 버전이 바뀌면 TTL과 무관하게 무효화
+    recommendation_cache_max_entries: int = int(
+        os.getenv("RECOMMENDATION_CACHE_MAX_ENTRIES", "5000")
+    )  # 디스크 캐시 최대 항목 수
+
+    # 전공 카탈로그 설정 (majors 테이블 인메모리 캐시)
+    major_catalog_refresh_seconds: int = int(
+        os.getenv("MAJOR_CATALOG_REFRESH_SECONDS", "60")
+    )  # 데이터 버전 확인 주기 (초, 툴 결과 캐시도 공유). 0이면 최초 로드 후 갱신하지 않음
+
+    # 캐시 설정 (임베딩 캐시 등 로컬 캐시 파일 저장 경로)
+    cache_dir: str = os.getenv("CACHE_DIR", "backend/data/cache")
+
+    # 임베딩 캐시 설정
+    embedding_cache_enabled: bool = (
+        os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    )  # false로 설정하면 매 호출마다 임베딩 API 호출
+    embedding_cache_memory_size: int = int(
+        os.getenv("EMBEDDING_CACHE_MEMORY_SIZE", "4096")
+    )  # 프로세스 내 LRU 캐시 최대 항목 수
+    embedding_cache_max_entries: int = int(
+        os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "200000")
+    )  # 디스크(SQLite) 캐시 최대 항목 수 (초과 시 오래된 항목부터 삭제)
 
 
 def get_settings() -> Settings:
@@ -87,48 +214,122 @@ def get_settings() -> Settings:
     return Settings()
 
 
-def get_llm():
-    """
-    LLM(대형 언어 모델) 인스턴스를 생성하는 팩토리 함수
+# ==================== LLM 클라이언트 레지스트리 ====================
+# get_llm()은 (provider, model, base_url, temperature)마다 ChatModel을 한 번만 만들어 재사용합니다.
+# 요청마다 새 클라이언트를 만들면 커넥션 풀도 새로 생겨 매번 TCP/TLS 핸드셰이크를 다시 하게 되므로,
+# OpenAI 호환 클라이언트는 base_url별로 하나의 httpx 커넥션 풀(keep-alive)을 공유합니다.
+_LLM_CLIENTS: dict = {}
+_LLM_HTTP_CLIENTS: dict = {}  # base_url → (httpx.Client, httpx.AsyncClient)
+_LLM_CLIENTS_LOCK = threading.Lock()
 
-    .env 파일의 LLM_PROVIDER 설정에 따라 적절한 LangChain ChatModel을 생성합니다.
+# 재사용/연결 지표 (모니터링용)
+_LLM_STATS = {"created": 0, "reused": 0, "http_requests": 0, "new_connections": 0}
+_LLM_STATS_LOCK = threading.Lock()
 
-    지원하는 제공자:
-      - openai: OpenAI API 또는 호환 서버 (vLLM, Together AI 등)
-      - ollama: 로컬 Ollama 서버
-      - huggingface: Hugging Face Inference API
+# 제공자별 기본 temperature (get_llm(temperature=None)일 때)
+_DEFAULT_TEMPERATURES = {"openai": 0.1, "ollama": 0.7, "huggingface": None}
 
-    Returns:
-        LangChain ChatModel 인스턴스 (ChatOpenAI, ChatOllama, ChatHuggingFace 중 하나)
 
-    Raises:
-        ValueError: 지원하지 않는 LLM_PROVIDER가 설정된 경우
-    """
-    settings = get_settings()
-    provider = settings.llm_provider.lower()
+def _count_llm_stat(name: str) -> None:
+    with _LLM_STATS_LOCK:
+        _LLM_STATS[name] += 1
+
+
+def _trace_llm_connection(event_name: str, info: dict) -> None:
+    # httpcore trace: 풀에서 재사용하지 못하고 새 TCP 연결을 맺은 경우
+    if event_name == "connection.connect_tcp.complete":
+        _count_llm_stat("new_connections")
+
+
+async def _atrace_llm_connection(event_name: str, info: dict) -> None:
+    _trace_llm_connection(event_name, info)
+
+
+def _on_llm_request(request) -> None:
+    _count_llm_stat("http_requests")
+    request.extensions["trace"] = _trace_llm_connection
+
+
+async def _aon_llm_request(request) -> None:
+    _count_llm_stat("http_requests")
+    request.extensions["trace"] = _atrace_llm_connection
+
+
+def _llm_timeout(settings: Settings):
+    import httpx
+
+    return httpx.Timeout(
+        settings.llm_request_timeout_seconds,
+        connect=settings.llm_connect_timeout_seconds,
+    )
+
+
+def _llm_http_clients(settings: Settings, base_url):
+    """base_url별 공유 httpx 클라이언트 (호출자가 _LLM_CLIENTS_LOCK을 잡고 있어야 함)"""
+    key = base_url or ""
+    if key not in _LLM_HTTP_CLIENTS:
+        import httpx
+
+        limits = httpx.Limits(
+            max_connections=settings.llm_http_max_connections,
+            max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+            keepalive_expiry=settings.llm_http_keepalive_expiry_seconds,
+        )
+        timeout = _llm_timeout(settings)
+        _LLM_HTTP_CLIENTS[key] = (
+            httpx.Client(
+                limits=limits,
+                timeout=timeout,
+                follow_redirects=True,
+                event_hooks={"request": [_on_llm_request]},
+            ),
+            httpx.AsyncClient(
+                limits=limits,
+                timeout=timeout,
+                follow_redirects=True,
+                event_hooks={"request": [_aon_llm_request]},
+            ),
+        )
+    return _LLM_HTTP_CLIENTS[key]
+
+
+def _llm_base_url(provider: str):
+    if provider == "openai":
+        # OPENAI_API_BASE 지원 (vLLM, Together AI, Anyscale 등 OpenAI 호환 서버용)
+        return os.getenv("OPENAI_API_BASE", None)
+    if provider == "ollama":
+        # OLLAMA_BASE_URL 환경 변수로 원격 서버 지정 가능
+        # 로컬: http://localhost:11434 (기본값)
+        # RunPod: http://YOUR_RUNPOD_IP:11434
+        return os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    return None
+
 
+def _create_llm(settings: Settings, provider: str, base_url, temperature):
+    """레지스트리에 없을 때 실제 ChatModel을 생성합니다. (호출자가 _LLM_CLIENTS_LOCK을 잡고 있어야 함)"""
     if provider == "openai":
         # OpenAI API 또는 호환 서버 사용
         # OPENAI_API_KEY는 환경 변수에서 자동으로 읽어옵니다
         from langchain_openai import ChatOpenAI
 
-        # OPENAI_API_BASE 지원 (vLLM, Together AI, Anyscale 등 OpenAI 호환 서버용)
-        base_url = os.getenv("OPENAI_API_BASE", None)
+        http_client, http_async_client = _llm_http_clients(settings, base_url)
+        common = dict(
+            model=settings.model_name,
+            temperature=temperature,  # 기본 0.1: 툴 호출 신뢰성을 위해 낮은 온도 사용
+            timeout=_llm_timeout(settings),
+            http_client=http_client,
+            http_async_client=http_async_client,
+        )
 
         if base_url:
             # 커스텀 API 서버 사용
             return ChatOpenAI(
-                model=settings.model_name,
                 base_url=base_url,  # OpenAI 호환 API 서버 주소
                 api_key=settings.openai_api_key,
-                temperature=0.1,  # 툴 호출 신뢰성을 위해 낮은 온도 사용
-            )
-        else:
-            # 공식 OpenAI API 사용
-            return ChatOpenAI(
-                model=settings.model_name,
-                temperature=0.1,  # 툴 호출 신뢰성을 위해 낮은 온도 사용
+                **common,
             )
+        # 공식 OpenAI API 사용
+        return ChatOpenAI(**common)
 
     elif provider == "ollama":
         # 로컬 또는 원격 Ollama 서버 사용
@@ -140,14 +341,9 @@ def get_llm():
             # 폴백: 구버전 langchain_community 사용
             from langchain_community.chat_models import ChatOllama
 
-        # OLLAMA_BASE_URL 환경 변수로 원격 서버 지정 가능
-        # 로컬: http://localhost:11434 (기본값)
-        # RunPod: http://YOUR_RUNPOD_IP:11434
-        base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-
         return ChatOllama(
             model=settings.model_name,
-            temperature=0.7,  # 창의성 조절 (0.0 = 결정적, 1.0 = 창의적)
+            temperature=temperature,  # 창의성 조절 (0.0 = 결정적, 1.0 = 창의적)
             base_url=base_url,  # .env의 OLLAMA_BASE_URL 또는 기본값
         )
 
@@ -172,6 +368,94 @@ def get_llm():
         )
 
 
+def get_llm(temperature: float | None = None):
+    """
+    LLM(대형 언어 모델) 인스턴스를 반환하는 팩토리 함수
+
+    .env 파일의 LLM_PROVIDER 설정에 따라 적절한 LangChain ChatModel을 생성합니다.
+    (provider, model, base_url, temperature) 조합마다 인스턴스를 한 번만 만들고 재사용하므로
+    요청마다 호출해도 커넥션 풀이 유지됩니다. 반환된 인스턴스는 여러 스레드/요청에서 공유해도 안전합니다.
+
+    지원하는 제공자:
+      - openai: OpenAI API 또는 호환 서버 (vLLM, Together AI 등)
+      - ollama: 로컬 Ollama 서버
+      - huggingface: Hugging Face Inference API
+
+    Args:
+        temperature: None이면 제공자 기본값 (openai 0.1, ollama 0.7)
+
+    Returns:
+        LangChain ChatModel 인스턴스 (ChatOpenAI, ChatOllama, ChatHuggingFace 중 하나)
+
+    Raises:
+        ValueError: 지원하지 않는 LLM_PROVIDER가 설정된 경우
+    """
+    settings = get_settings()
+    provider = settings.llm_provider.lower()
+    if temperature is None:
+        temperature = _DEFAULT_TEMPERATURES.get(provider)
+    base_url = _llm_base_url(provider)
+    key = (provider, settings.model_name, base_url, temperature)
+
+    llm = _LLM_CLIENTS.get(key)
+    if llm is None:
+        with _LLM_CLIENTS_LOCK:
+            llm = _LLM_CLIENTS.get(key)
+            if llm is None:
+                llm = _create_llm(settings, provider, base_url, temperature)
+                _LLM_CLIENTS[key] = llm
+                _count_llm_stat("created")
+                return llm
+    _count_llm_stat("reused")
+    return llm
+
+
+def get_llm_client_stats() -> dict:
+    """
+    LLM 클라이언트 재사용/연결 지표 (모니터링용)
+
+    - created / reused: get_llm() 호출 중 새로 만든 횟수 / 기존 인스턴스를 돌려준 횟수
+    - http_requests / new_connections: 공유 풀을 거친 HTTP 요청 수 / 새로 맺은 TCP 연결 수
+    - connection_reuse_rate: keep-alive 연결을 재사용한 요청 비율
+    """
+    with _LLM_STATS_LOCK:
+        stats = dict(_LLM_STATS)
+    stats["clients"] = len(_LLM_CLIENTS)
+    stats["connection_reuse_rate"] = (
+        round(max(0.0, 1 - stats["new_connections"] / stats["http_requests"]), 4)
+        if stats["http_requests"]
+        else 0.0
+    )
+    return stats
+
+
+def reset_llm_connections() -> None:
+    """
+    fork된 워커에서 호출: 부모 프로세스가 만든 LLM HTTP 커넥션 풀을 워커 전용으로 교체합니다.
+
+    워밍업이나 preload 중 LLM 요청이 나갔다면 keep-alive 소켓이 풀에 남아 여러 워커가 공유하게 되므로,
+    base_url별 httpx 클라이언트를 새로 만듭니다. 그래프 노드 등이 ChatModel 객체를 참조하고 있으므로
+    레지스트리의 객체는 그대로 두고 내부 OpenAI 클라이언트만 새 풀을 쓰는 것으로 바꿉니다.
+    (부모의 풀은 닫지 않고 버림: 닫으면 부모와 공유하는 소켓까지 종료됨)
+    """
+    with _LLM_CLIENTS_LOCK:
+        _LLM_HTTP_CLIENTS.clear()
+        settings = get_settings()
+        for (provider, _, base_url, temperature), llm in _LLM_CLIENTS.items():
+            if provider != "openai":
+                continue
+            fresh = _create_llm(settings, provider, base_url, temperature)
+            for attr in (
+                "http_client",
+                "http_async_client",
+                "root_client",
+                "root_async_client",
+                "client",
+                "async_client",
+            ):
+                setattr(llm, attr, getattr(fresh, attr))
+
+
 def resolve_path(path_str: str) -> Path:
     """
     경로 문자열을 프로젝트 루트 기준의 절대 경로로 변환
@@ -1,44 +1,82 @@
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from backend.config import get_settings
 import json
 import logging
 import os
+import threading
 import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 settings = get_settings()
 
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    echo=False,
-    json_serializer=lambda obj: json.dumps(obj, ensure_ascii=False),
-)
+# ---------------------------------------------------------
+# 동기 엔진 (처음 사용할 때 생성)
+# ---------------------------------------------------------
+# 엔진/쿼리 로그 파일은 모듈 import 시점이 아니라 첫 세션 생성 시 만들어집니다.
+# (models.py의 Base만 필요한 import나 Django 관리 명령이 DB 드라이버/로그 파일을 건드리지 않도록)
+# 기존 코드의 `from backend.db.connection import engine`은 모듈 __getattr__로 그대로 동작합니다.
+_engine = None
+_session_factory = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """동기 Engine 싱글톤 (쿼리 로깅 리스너 포함)"""
+    global _engine, _session_factory
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_engine(
+                    settings.database_url,
+                    pool_pre_ping=True,
+                    pool_recycle=3600,
+                    echo=False,
+                    json_serializer=lambda obj: json.dumps(obj, ensure_ascii=False),
+                )
+                _setup_query_logging()
+                event.listen(engine, "before_cursor_execute", before_cursor_execute)
+                event.listen(engine, "after_cursor_execute", after_cursor_execute)
+                _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                _engine = engine
+    return _engine
+
+
+def __getattr__(name):
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ---------------------------------------------------------
 # DB 쿼리 로깅 설정
 # ---------------------------------------------------------
 
 
-# 로그 디렉토리 생성 (backend/db/logs)
+# 로그 디렉토리 (backend/db/logs)
 Current_Dir = os.path.dirname(os.path.abspath(__file__))
 Log_Dir = os.path.join(Current_Dir, "logs")
-os.makedirs(Log_Dir, exist_ok=True)
+log_file_path = os.path.join(Log_Dir, "query_log.log")
 
 # 로거 설정
 logger = logging.getLogger("sqlalchemy_custom")
 logger.setLevel(logging.INFO)
 
-# 파일 핸들러 추가
-log_file_path = os.path.join(Log_Dir, "query_log.log")
-file_handler = logging.FileHandler(log_file_path, encoding="utf-8")
-formatter = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
+
+def _setup_query_logging():
+    # 파일 핸들러 추가 (엔진을 처음 만들 때 한 번)
+    if any(isinstance(handler, logging.FileHandler) for handler in logger.handlers):
+        return
+    os.makedirs(Log_Dir, exist_ok=True)
+    file_handler = logging.FileHandler(log_file_path, encoding="utf-8")
+    formatter = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
 
 
-@event.listens_for(engine, "before_cursor_execute")
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     conn.info["query_start_time"] = time.time()
     logger.info(f"📝 QUERY: {statement}")
@@ -46,7 +84,6 @@ def before_cursor_execute(conn, cursor, statement, parameters, context, executem
         logger.info(f"🔧 PARAMS: {parameters}")
 
 
-@event.listens_for(engine, "after_cursor_execute")
 def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     total = time.time() - conn.info.get("query_start_time", time.time())
     logger.info(f"⏱️ EXECUTION TIME: {total:.4f}s")
@@ -58,7 +95,63 @@ def after_cursor_execute(conn, cursor, statement, parameters, context, executema
     logger.info("-" * 50)
 
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def SessionLocal() -> Session:
+    """동기 세션 생성 (엔진은 처음 호출할 때 생성)"""
+    get_engine()
+    return _session_factory()
+
+# ---------------------------------------------------------
+# 비동기 읽기 엔진 (async 그래프 경로용)
+# ---------------------------------------------------------
+# arun_mentor / astream_mentor 경로의 조회 쿼리가 이벤트 루프를 막지 않도록 aiomysql 드라이버를 사용합니다.
+# 쓰기(시드/인제스트)는 기존 동기 엔진을 그대로 사용하며, 비동기 엔진은 처음 사용할 때 생성합니다.
+_async_engine = None
+_async_session_factory = None
+_async_engine_lock = threading.Lock()
+
+
+def get_async_engine():
+    """AsyncEngine 싱글톤 (쿼리 로깅은 동기 엔진과 같은 핸들러 사용)"""
+    global _async_engine, _async_session_factory
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    with _async_engine_lock:
+        if _async_engine is None:
+            _async_engine = create_async_engine(
+                settings.async_database_url,
+                pool_pre_ping=True,
+                pool_recycle=3600,
+                echo=False,
+                json_serializer=lambda obj: json.dumps(obj, ensure_ascii=False),
+            )
+            _setup_query_logging()
+            event.listen(_async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+            event.listen(_async_engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+            _async_session_factory = async_sessionmaker(
+                _async_engine, class_=AsyncSession, expire_on_commit=False
+            )
+        return _async_engine
+
+
+def reset_async_engine() -> None:
+    """fork된 워커에서 호출: 부모 프로세스의 비동기 엔진을 버리고 처음 사용할 때 새로 만듭니다."""
+    global _async_engine, _async_session_factory
+    with _async_engine_lock:
+        _async_engine = None
+        _async_session_factory = None
+
+
+def reset_after_fork() -> None:
+    """fork된 워커에서 호출: 부모의 커넥션 풀을 닫지 않고 버린 뒤 새 풀로 시작 (SQLAlchemy 권장 방식)"""
+    if _engine is not None:
+        _engine.dispose(close=False)
+    reset_async_engine()
+
+
+def AsyncSessionLocal() -> "AsyncSession":
+    """비동기 읽기 세션 생성 (async with AsyncSessionLocal() as session: ...)"""
+    get_async_engine()
+    return _async_session_factory()
 
 Base = declarative_base()
 
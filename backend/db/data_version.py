@@ -0,0 +1,126 @@
+"""
+데이터 버전 관리 유틸리티
+
+시드/인제스트 스크립트가 테이블 내용을 바꾼 뒤 bump_data_version()을 호출하면
+각 프로세스의 인메모리 캐시는 get_data_version()으로 PK 한 건만 조회하여
+자신이 로드한 데이터가 최신인지 확인할 수 있습니다.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.db.connection import AsyncSessionLocal, SessionLocal
+from backend.db.models import DataVersion
+
+# 데이터셋 이름 (data_versions.name)
+MAJORS_DATASET = "majors"
+MAJOR_CATEGORIES_DATASET = "major_categories"
+UNIVERSITIES_DATASET = "universities"
+VECTOR_INDEX_DATASET = "vector_index"  # Pinecone/로컬 벡터 네임스페이스 (인제스트 스크립트가 갱신)
+
+
+def stage_data_version_bump(session, name: str) -> int:
+    """
+    데이터셋 버전 증가를 세션에 반영하고 새 버전을 반환합니다. (커밋은 호출자 책임)
+
+    데이터 변경과 같은 트랜잭션에서 커밋해야 할 때 사용합니다. bump_data_version과 달리
+    오류를 삼키지 않으므로, 호출자가 롤백하면 데이터 변경과 버전 증가가 함께 취소됩니다.
+    """
+    row = session.get(DataVersion, name)
+    if row is None:
+        row = DataVersion(name=name, version=1, updated_at=datetime.now())
+        session.add(row)
+    else:
+        row.version = (row.version or 0) + 1
+        row.updated_at = datetime.now()
+    session.flush()
+    return row.version
+
+
+def bump_data_version(name: str, session=None) -> Optional[int]:
+    """
+    데이터셋 버전을 1 증가시키고 새 버전을 반환합니다.
+
+    data_versions 테이블이 없는 환경(create_tables 미실행)에서는 경고만 출력하고
+    None을 반환하여 시드 작업 자체는 실패하지 않도록 합니다.
+
+    Args:
+        name: 데이터셋 이름 (예: "majors")
+        session: 기존 세션을 재사용할 경우 전달 (커밋은 호출자가 아닌 이 함수가 수행)
+    """
+    own_session = session is None
+    session = session or SessionLocal()
+    try:
+        version = stage_data_version_bump(session, name)
+        session.commit()
+        print(f"🔖 Data version bumped: {name} → v{version}")
+        return version
+    except SQLAlchemyError as e:
+        session.rollback()
+        print(f"⚠️ Failed to bump data version '{name}': {e}")
+        return None
+    finally:
+        if own_session:
+            session.close()
+
+
+def get_data_version(name: str) -> Optional[int]:
+    """
+    데이터셋의 현재 버전을 반환합니다.
+
+    data_versions 테이블이 아직 없거나 조회에 실패하면 None을 반환합니다.
+    """
+    session = SessionLocal()
+    try:
+        row = session.get(DataVersion, name)
+        return row.version if row is not None else 0
+    except SQLAlchemyError as e:
+        print(f"⚠️ Failed to read data version '{name}': {e}")
+        return None
+    finally:
+        session.close()
+
+
+def get_data_versions(names: Iterable[str]) -> Optional[Dict[str, int]]:
+    """
+    여러 데이터셋의 현재 버전을 한 번의 조회로 반환합니다. (없는 데이터셋은 0)
+
+    조회에 실패하면 None을 반환합니다.
+    """
+    names = list(names)
+    session = SessionLocal()
+    try:
+        rows = session.query(DataVersion).filter(DataVersion.name.in_(names)).all()
+        versions = {name: 0 for name in names}
+        versions.update({row.name: row.version for row in rows})
+        return versions
+    except SQLAlchemyError as e:
+        print(f"⚠️ Failed to read data versions {names}: {e}")
+        return None
+    finally:
+        session.close()
+
+
+async def aget_data_versions(names: Iterable[str]) -> Optional[Dict[str, int]]:
+    """
+    get_data_versions의 비동기 버전 (비동기 읽기 엔진 사용).
+
+    조회에 실패하면(드라이버 미설치 포함) None을 반환합니다.
+    """
+    names = list(names)
+    try:
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(DataVersion.name, DataVersion.version).where(
+                    DataVersion.name.in_(names)
+                )
+            )
+            versions = {name: 0 for name in names}
+            versions.update({name: version for name, version in result.all()})
+            return versions
+    except (SQLAlchemyError, ImportError) as e:
+        print(f"⚠️ Failed to read data versions {names}: {e}")
+        return None
@@ -0,0 +1,103 @@
+"""
+학과 별칭(major_aliases) 테이블 관리 유틸리티
+
+- rebuild_major_aliases(): majors.department_aliases와 major_categories.major_names로 테이블 재구성
+- load_alias_map(): 전체 별칭 매핑을 한 번의 쿼리로 읽어 인메모리 카탈로그(MajorCatalog)에 제공
+"""
+
+import json
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import load_only
+
+from backend.db.models import Major, MajorAlias, MajorCategory
+
+# 한 번에 INSERT할 행 수
+BATCH_SIZE = 1000
+
+
+def normalize_alias(value: str) -> str:
+    """별칭 비교용 정규화 (공백 제거 + 소문자, tools._normalize_major_key와 동일 규칙)"""
+    return re.sub(r"\s+", "", (value or "").lower())
+
+
+def _load_json_list(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    try:
+        loaded = json.loads(value)
+    except json.JSONDecodeError:
+        return []
+    if not isinstance(loaded, list):
+        return []
+    return [item for item in loaded if isinstance(item, str) and item.strip()]
+
+
+def rebuild_major_aliases(session) -> int:
+    """
+    major_aliases 테이블을 전체 재구성하고 저장된 별칭 수를 반환합니다. (커밋은 호출자 책임)
+
+    우선순위 (같은 정규화 별칭이 여러 전공에 걸리면 먼저 등록된 쪽 유지):
+    1. majors.department_aliases (id 순서, 기존 LIKE 검색의 .first()와 동일)
+    2. major_categories.major_names (category_name과 같은 이름의 표준 전공에 매핑)
+    """
+    majors = (
+        session.query(Major)
+        .options(load_only(Major.major_id, Major.major_name, Major.department_aliases))
+        .order_by(Major.id)
+        .all()
+    )
+    major_id_by_name = {}
+    for major in majors:
+        major_id_by_name.setdefault(normalize_alias(major.major_name), major.major_id)
+
+    rows: Dict[str, dict] = {}
+
+    def _add(alias: str, major_id: str, source: str) -> None:
+        key = normalize_alias(alias)
+        if key and key not in rows:
+            rows[key] = {
+                "alias_normalized": key,
+                "alias": alias.strip()[:255],
+                "major_id": major_id,
+                "source": source,
+            }
+
+    for major in majors:
+        for alias in _load_json_list(major.department_aliases):
+            _add(alias, major.major_id, "alias")
+
+    for category in session.query(MajorCategory).order_by(MajorCategory.id).all():
+        major_id = major_id_by_name.get(normalize_alias(category.category_name))
+        if not major_id:
+            continue
+        for alias in _load_json_list(category.major_names):
+            _add(alias, major_id, "category")
+
+    values = list(rows.values())
+    session.execute(delete(MajorAlias))
+    for start in range(0, len(values), BATCH_SIZE):
+        session.execute(insert(MajorAlias), values[start : start + BATCH_SIZE])
+    return len(values)
+
+
+def load_alias_map(session) -> Optional[Dict[str, str]]:
+    """
+    전체 별칭 매핑({정규화된 별칭: major_id})을 반환합니다.
+
+    테이블이 없거나 비어 있으면 None을 반환하여 department_aliases 폴백을 사용하게 합니다.
+    """
+    try:
+        rows = session.execute(
+            select(MajorAlias.alias_normalized, MajorAlias.major_id)
+        ).all()
+    except SQLAlchemyError as e:
+        session.rollback()
+        print(f"⚠️ major_aliases unavailable, using department_aliases instead: {e}")
+        return None
+    if not rows:
+        return None
+    return {row.alias_normalized: row.major_id for row in rows}
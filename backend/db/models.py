@@ -1,4 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, Float
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    Float,
+    DateTime,
+    ForeignKey,
+    Index,
+    func,
+)
 from sqlalchemy.dialects.mysql import LONGTEXT
 from backend.db.connection import Base
 
@@ -64,3 +74,70 @@ class University(Base):
     name = Column(String(255), unique=True, index=True, nullable=False)
     code = Column(String(50), nullable=True)
     url = Column(String(500), nullable=True)
+
+
+class UniversityMajorOffering(Base):
+    """
+    대학별 학과 개설 정보를 정규화하여 저장합니다. (대학 1곳 × 학과 1개 = 1행)
+    Source: majors.university JSON (seed_university_offerings.py에서 펼쳐서 적재)
+
+    majors.university LONGTEXT 전체를 읽고 파싱하지 않고도
+    대학명/학과명/전공 ID로 인덱스 조회가 가능하도록 합니다.
+    """
+
+    __tablename__ = "university_major_offerings"
+
+    id = Column(Integer, primary_key=True)
+    major_id = Column(
+        String(255),
+        ForeignKey("majors.major_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    school = Column(String(255), nullable=False)  # schoolName (예: "서울대학교[본교]")
+    department = Column(String(255), nullable=False)  # majorName (없으면 표준 학과명)
+    campus = Column(String(100), nullable=True)
+    area = Column(String(100), nullable=True)
+    url = Column(String(500), nullable=True)
+
+    __table_args__ = (
+        Index("ix_offerings_school", "school", "department"),
+        Index("ix_offerings_department", "department", "school"),
+        Index("ix_offerings_major_id", "major_id", "school"),
+    )
+
+
+class MajorAlias(Base):
+    """
+    학과 별칭 → 표준 전공 매핑을 저장합니다. (정규화된 별칭 1개 = 1행)
+    Source: majors.department_aliases + major_categories.major_names (seed_majors.py에서 재구성)
+
+    department_aliases LONGTEXT에 LIKE '%"별칭"%' 검색을 하지 않고
+    유니크 인덱스 동등 조회로 별칭을 해석하기 위한 테이블입니다.
+    """
+
+    __tablename__ = "major_aliases"
+
+    id = Column(Integer, primary_key=True)
+    alias_normalized = Column(String(255), unique=True, nullable=False)  # 공백 제거 + 소문자
+    alias = Column(String(255), nullable=False)  # 원본 표기
+    major_id = Column(
+        String(255),
+        ForeignKey("majors.major_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    source = Column(String(20), nullable=False)  # "alias" | "category"
+
+
+class DataVersion(Base):
+    """
+    데이터셋별 버전 카운터를 저장합니다.
+    시드 스크립트가 데이터를 갱신할 때마다 버전을 올리며,
+    프로세스 내 캐시(MajorCatalog 등)는 이 값만 비교하여 재로딩 여부를 결정합니다.
+    """
+
+    __tablename__ = "data_versions"
+
+    name = Column(String(100), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now())
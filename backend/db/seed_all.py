@@ -9,6 +9,7 @@ sys.path.append(str(project_root))
 from backend.db.seed_majors import seed_majors
 from backend.db.seed_categories import seed_categories
 from backend.db.seed_universities import seed_universities
+from backend.db.seed_university_offerings import seed_university_offerings
 from backend.db.connection import engine, Base
 
 
@@ -23,17 +24,21 @@ def seed_all():
     print("=" * 50)
 
     # 2. 전공 데이터 적재
-    print("\n[Step 1/3] Seeding Majors...")
+    print("\n[Step 1/4] Seeding Majors...")
     seed_majors()
 
     # 3. 카테고리 데이터 적재
-    print("\n[Step 2/3] Seeding Major Categories...")
+    print("\n[Step 2/4] Seeding Major Categories...")
     seed_categories()
 
     # 4. 대학 데이터 적재
-    print("\n[Step 3/3] Seeding Universities...")
+    print("\n[Step 3/4] Seeding Universities...")
     seed_universities()
 
+    # 5. 대학별 학과 개설 정보 적재 (majors.university JSON → 정규화 테이블)
+    print("\n[Step 4/4] Seeding University Major Offerings...")
+    seed_university_offerings()
+
     print("\n" + "=" * 50)
     print("🎉 All seeding processes completed successfully!")
     print("=" * 50)
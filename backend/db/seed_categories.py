@@ -8,7 +8,13 @@ project_root = current_dir.parent.parent
 sys.path.append(str(project_root))
 
 from backend.db.connection import SessionLocal, engine, Base
-from backend.db.models import MajorCategory
+from backend.db.data_version import (
+    stage_data_version_bump,
+    MAJORS_DATASET,
+    MAJOR_CATEGORIES_DATASET,
+)
+from backend.db.major_aliases import rebuild_major_aliases
+from backend.db.models import DataVersion, MajorAlias, MajorCategory
 
 
 def seed_categories():
@@ -22,6 +28,10 @@ def seed_categories():
     with open(json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
+    # 시드 과정에서 재구성/갱신하는 보조 테이블만 생성 (DDL은 암묵적 커밋이 일어날 수 있어 트랜잭션 시작 전에 실행)
+    for table in (MajorAlias.__table__, DataVersion.__table__):
+        table.create(bind=engine, checkfirst=True)
+
     session = SessionLocal()
     try:
         # 테이블 생성 (안전을 위해)
@@ -42,12 +52,25 @@ def seed_categories():
                 session.add(new_cat)
             count += 1
 
+        # 카테고리의 세부 학과명도 별칭으로 쓰이므로 별칭 테이블 재구성
+        alias_count = rebuild_major_aliases(session)
+
+        # 프로세스 내 캐시(MajorCatalog 등)가 변경을 감지하도록 버전 갱신
+        # (카테고리/별칭 변경과 같은 트랜잭션으로 커밋)
+        category_version = stage_data_version_bump(session, MAJOR_CATEGORIES_DATASET)
+        majors_version = stage_data_version_bump(session, MAJORS_DATASET)
         session.commit()
         print(f"✅ Successfully seeded {count} categories.")
+        print(f"Rebuilt major_aliases: {alias_count} aliases")
+        print(
+            f"🔖 Data version bumped: {MAJOR_CATEGORIES_DATASET} → v{category_version}, "
+            f"{MAJORS_DATASET} → v{majors_version}"
+        )
 
     except Exception as e:
         session.rollback()
         print(f"❌ Error seeding categories: {e}")
+        raise
     finally:
         session.close()
 
@@ -11,7 +11,10 @@ project_root = current_dir.parent.parent
 sys.path.append(str(project_root))
 
 from backend.db.connection import SessionLocal, engine, Base
-from backend.db.models import Major
+from backend.db.data_version import stage_data_version_bump, MAJORS_DATASET
+from backend.db.major_aliases import rebuild_major_aliases
+from backend.db.models import DataVersion, Major, MajorAlias, UniversityMajorOffering
+from backend.db.seed_university_offerings import rebuild_university_offerings
 
 
 def load_json_data(file_path: Path) -> List[Dict[str, Any]]:
@@ -152,6 +155,10 @@ def seed_majors():
     raw_list = load_json_data(json_path)
     print(f"Found {len(raw_list)} items in JSON.")
 
+    # 시드 과정에서 재구성/갱신하는 보조 테이블만 생성 (DDL은 암묵적 커밋이 일어날 수 있어 트랜잭션 시작 전에 실행)
+    for table in (MajorAlias.__table__, UniversityMajorOffering.__table__, DataVersion.__table__):
+        table.create(bind=engine, checkfirst=True)
+
     session = SessionLocal()
 
     succeeded = 0
@@ -195,7 +202,19 @@ def seed_majors():
                 print(f"Error processing item index {i}: {e}")
                 errors += 1
 
+        # 별칭 테이블 재구성 (department_aliases + major_categories)
+        alias_count = rebuild_major_aliases(session)
+        print(f"Rebuilt major_aliases: {alias_count} aliases")
+
+        # 대학별 개설 정보 재구성 (카탈로그는 이 테이블이 있으면 majors.university 대신 사용)
+        offering_count, _ = rebuild_university_offerings(session)
+        print(f"Rebuilt university_major_offerings: {offering_count} offerings")
+
+        # 프로세스 내 캐시(MajorCatalog 등)가 변경을 감지하도록 버전 갱신
+        # (전공/별칭/개설 정보와 같은 트랜잭션으로 커밋하여, 버전만 남거나 빠지는 일이 없도록 함)
+        version = stage_data_version_bump(session, MAJORS_DATASET)
         session.commit()
+        print(f"🔖 Data version bumped: {MAJORS_DATASET} → v{version}")
     except Exception as e:
         session.rollback()
         print(f"Critical error during seeding: {e}")
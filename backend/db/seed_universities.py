@@ -8,6 +8,7 @@ project_root = current_dir.parent.parent
 sys.path.append(str(project_root))
 
 from backend.db.connection import SessionLocal, engine, Base
+from backend.db.data_version import bump_data_version, UNIVERSITIES_DATASET
 from backend.db.models import University
 
 
@@ -45,6 +46,8 @@ def seed_universities():
             count += 1
 
         session.commit()
+        # 프로세스 내 캐시(MajorCatalog 등)가 변경을 감지하도록 버전 갱신
+        bump_data_version(UNIVERSITIES_DATASET, session)
         print(f"✅ Successfully seeded {count} universities.")
 
     except Exception as e:
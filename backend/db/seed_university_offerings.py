@@ -0,0 +1,101 @@
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트 경로 추가
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import load_only
+
+from backend.db.connection import SessionLocal, engine, Base
+from backend.db.data_version import stage_data_version_bump, MAJORS_DATASET
+from backend.db.models import DataVersion, Major, UniversityMajorOffering
+from backend.rag.university_index import extract_offerings
+
+# 한 번에 INSERT할 행 수
+BATCH_SIZE = 1000
+
+
+def rebuild_university_offerings(session) -> tuple[int, int]:
+    """
+    majors.university JSON을 펼쳐 university_major_offerings 테이블을 전체 재구성합니다. (커밋은 호출자 책임)
+
+    Returns:
+        (저장한 개설 정보 수, university JSON이 잘못되어 건너뛴 전공 수)
+    """
+    majors = (
+        session.query(Major)
+        .options(load_only(Major.major_id, Major.major_name, Major.university))
+        .order_by(Major.id)
+        .all()
+    )
+    print(f"Loaded {len(majors)} majors from DB.")
+
+    rows = []
+    errors = 0
+    for major in majors:
+        if not major.university:
+            continue
+        try:
+            university = json.loads(major.university)
+        except json.JSONDecodeError:
+            errors += 1
+            continue
+
+        record = SimpleNamespace(
+            major_id=major.major_id,
+            major_name=major.major_name,
+            university=university,
+        )
+        for offering in extract_offerings(record):
+            rows.append(
+                {
+                    "major_id": offering.major_id,
+                    "school": offering.university,
+                    "department": offering.department,
+                    "campus": offering.campus or None,
+                    "area": offering.area or None,
+                    "url": offering.url or None,
+                }
+            )
+
+    # 전체 교체 (같은 트랜잭션 안에서 삭제 후 삽입)
+    session.execute(delete(UniversityMajorOffering))
+    for start in range(0, len(rows), BATCH_SIZE):
+        session.execute(insert(UniversityMajorOffering), rows[start : start + BATCH_SIZE])
+    return len(rows), errors
+
+
+def seed_university_offerings():
+    """
+    majors.university JSON을 펼쳐 university_major_offerings 테이블을 다시 채웁니다.
+    (majors 시드 이후에 실행해야 하며, 매번 전체를 교체합니다. seed_majors도 같은 재구성을 수행)
+    """
+    # 재구성 대상 테이블과 버전 테이블만 생성 (트랜잭션 시작 전에 실행)
+    for table in (UniversityMajorOffering.__table__, DataVersion.__table__):
+        table.create(bind=engine, checkfirst=True)
+
+    session = SessionLocal()
+    try:
+        count, errors = rebuild_university_offerings(session)
+        # 프로세스 내 캐시(MajorCatalog 등)가 변경을 감지하도록 버전 갱신 (개설 정보와 같은 트랜잭션)
+        version = stage_data_version_bump(session, MAJORS_DATASET)
+        session.commit()
+        print(f"🔖 Data version bumped: {MAJORS_DATASET} → v{version}")
+        print(f"✅ Successfully seeded {count} university offerings.")
+        if errors:
+            print(f"⚠️ Skipped {errors} majors with invalid university JSON.")
+
+    except Exception as e:
+        session.rollback()
+        print(f"❌ Error seeding university offerings: {e}")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    seed_university_offerings()
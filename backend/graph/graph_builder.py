@@ -7,12 +7,15 @@ LangGraph 그래프를 빌드하는 팩토리 함수들을 정의합니다.
 2. **Major 그래프**: 온보딩 정보를 바탕으로 전공을 추천하는 단방향 파이프라인. 초기 추천에 사용됩니다.
 """
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph
 from langgraph.constants import END
 from langgraph.prebuilt import ToolNode
 from .state import MentorState
 from .nodes import (
+    aagent_node,
     agent_node,
+    arecommend_majors_node,
     should_continue,
     tools,
     recommend_majors_node,
@@ -69,9 +72,11 @@ def build_react_graph():
     graph = StateGraph(MentorState)
 
     # 노드 추가
-    graph.add_node("agent", agent_node)  # 핵심 에이전트 노드
+    # 핵심 에이전트 노드 - invoke/stream은 agent_node, ainvoke/astream은 aagent_node 실행
+    graph.add_node("agent", RunnableLambda(agent_node, afunc=aagent_node, name="agent"))
     # 툴 실행 노드 - LangGraph가 여러 tool call을 병렬 실행하더라도
     # vectorstore.py의 _VECTORSTORE_LOCK이 동시 접근을 방지함
+    # (비동기 실행 시에는 각 툴의 coroutine 구현을 await)
     graph.add_node("tools", ToolNode(tools))
 
     # 엣지 설정
@@ -113,7 +118,10 @@ def build_major_graph():
     이 그래프는 에이전트 루프 없이 단방향(Single-pass)으로 실행되는 간단한 파이프라인입니다.
     """
     graph = StateGraph(MentorState)
-    graph.add_node("recommend", recommend_majors_node)
+    graph.add_node(
+        "recommend",
+        RunnableLambda(recommend_majors_node, afunc=arecommend_majors_node, name="recommend"),
+    )
     graph.set_entry_point("recommend")
     graph.add_edge("recommend", END)
     return graph.compile()
@@ -5,14 +5,19 @@ LangGraph 그래프를 구성하는 노드 함수들을 정의합니다.
 ReAct 패턴: LLM이 자율적으로 tool 호출 여부를 결정 (agent_node, should_continue)
 """
 
+import asyncio
+import threading
+
 from langchain_core.messages import SystemMessage
 
 from .state import MentorState
 from backend.rag.retriever import (
+    asearch_major_docs,
     search_major_docs,
     aggregate_major_scores,
 )
-from backend.rag.embeddings import get_embeddings
+from backend.rag.embeddings import aget_query_embedding, get_query_embedding
+from backend.rag.recommendation_engine import get_recommendation_engine
 
 from backend.rag.tools import (
     list_departments,
@@ -24,8 +29,11 @@ from backend.rag.tools import (
 
 from backend.config import get_llm
 
-# LLM 인스턴스 생성 (.env에서 설정한 LLM_PROVIDER와 MODEL_NAME 사용)
-llm = get_llm()
+# LLM 인스턴스 (.env에서 설정한 LLM_PROVIDER와 MODEL_NAME 사용)
+# 모듈 import 시점이 아니라 처음 사용할 때 생성합니다. (get_node_llm / get_llm_with_tools)
+_LLM = None
+_LLM_WITH_TOOLS = None
+_LLM_LOCK = threading.Lock()
 
 # doc_type별 기본 가중치
 MAJOR_DOC_WEIGHTS = {
@@ -46,7 +54,27 @@ tools = [
     get_search_help,
     get_university_admission_info,
 ]  # 사용 가능한 툴 목록
-llm_with_tools = llm.bind_tools(tools)  # LLM에 툴 사용 권한 부여
+
+
+def get_node_llm():
+    """노드에서 공유하는 LLM 인스턴스 (처음 호출할 때 생성)"""
+    global _LLM
+    if _LLM is None:
+        with _LLM_LOCK:
+            if _LLM is None:
+                _LLM = get_llm()
+    return _LLM
+
+
+def get_llm_with_tools():
+    """ReAct 에이전트용 LLM (툴 사용 권한 부여, 처음 호출할 때 생성)"""
+    global _LLM_WITH_TOOLS
+    if _LLM_WITH_TOOLS is None:
+        llm = get_node_llm()
+        with _LLM_LOCK:
+            if _LLM_WITH_TOOLS is None:
+                _LLM_WITH_TOOLS = llm.bind_tools(tools)
+    return _LLM_WITH_TOOLS
 
 
 def _format_profile_value(value) -> str:
@@ -109,6 +137,24 @@ def _build_user_profile_text(answers: dict, fallback_question: str | None) -> st
     return "\n".join(sections).strip()
 
 
+def canonicalize_onboarding_answers(answers: dict, fallback_question: str | None) -> dict:
+    """
+    추천 결과 캐시 키용 온보딩 답변 정규형.
+
+    _build_user_profile_text와 같은 _format_profile_value 변환을 거친 값만 키 이름순으로 모으므로,
+    입력 순서나 공백/빈 값만 다른 답변은 같은 정규형이 됩니다.
+    """
+    canonical = {}
+    for key in sorted(answers or {}, key=str):
+        formatted = _format_profile_value(answers[key])
+        if formatted:
+            canonical[str(key)] = formatted
+    question = (fallback_question or "").strip()
+    if question:
+        canonical["__question__"] = question
+    return canonical
+
+
 def _merge_tag_lists(existing: list[str], new_values: list[str]) -> list[str]:
     # 전공 태그는 중복을 허용하지 않으므로 순서를 보존하며 합집합 처리
     merged = list(existing)
@@ -125,6 +171,8 @@ def _summarize_major_hits(hits, aggregated_scores, limit: int = 10):
     # [버그 수정] 중복 제거
     # major_id가 다르더라도 major_name이 같으면 중복으로 처리
     seen_names = set()
+    # major_name → 처음 등록된 major_id (같은 이름의 기존 entry를 O(1)로 찾기 위함)
+    id_by_name: dict[str, str] = {}
 
     for hit in hits:
         if not hit.major_id:
@@ -138,11 +186,7 @@ def _summarize_major_hits(hits, aggregated_scores, limit: int = 10):
             # 로직을 좀 더 정교하게: 이미 존재하는 entry를 찾아서 병합
 
             # 기존 entry 찾기 (이름으로)
-            existing_id = None
-            for mid, data in per_major.items():
-                if data["major_name"] == hit.major_name:
-                    existing_id = mid
-                    break
+            existing_id = id_by_name.get(hit.major_name)
 
             if existing_id:
                 entry = per_major[existing_id]
@@ -157,6 +201,7 @@ def _summarize_major_hits(hits, aggregated_scores, limit: int = 10):
                 )
         else:
             seen_names.add(hit.major_name)
+            id_by_name.setdefault(hit.major_name, hit.major_id)
             entry = per_major.setdefault(
                 hit.major_id,
                 {
@@ -242,7 +287,7 @@ def _normalize_majors_with_llm(raw_majors: list[str]) -> list[str]:
     )
 
     try:
-        response = llm.invoke(prompt)
+        response = get_node_llm().invoke(prompt)
         content = response.content.strip()
 
         # 쉼표로 분리하여 리스트로 변환
@@ -264,20 +309,65 @@ def recommend_majors_node(state: MentorState) -> dict:
 
     # 온보딩 답변이 없으면 빈 결과 반환
     if not profile_text:
-        return {
-            "user_profile_text": "",
-            "recommended_majors": [],
-            "major_search_hits": [],
-            "major_scores": {},
-        }
+        return _empty_recommendation()
 
     # 1. 벡터 검색 (Vector Search)
     # 온보딩 텍스트를 단일 임베딩으로 변환하여 Pinecone에서 의미적으로 유사한 전공 문서를 검색합니다.
-    embeddings = get_embeddings()
-    profile_embedding = embeddings.embed_query(profile_text)
+    profile_embedding = get_query_embedding(profile_text)
+
+    # 전체 코퍼스 엔진이 있으면 모든 전공 문서와의 점수를 한 번에 계산하여 정확한 Top-N 반환
+    engine = get_recommendation_engine()
+    if engine is not None:
+        return _engine_recommendation(engine, profile_text, profile_embedding)
 
     # Pinecone에서 상위 50개 문서 검색
     hits = search_major_docs(profile_embedding, top_k=50)
+    return _hits_recommendation(profile_text, profile_embedding, hits)
+
+
+async def arecommend_majors_node(state: MentorState) -> dict:
+    """
+    recommend_majors_node의 비동기 버전 (임베딩/벡터 검색은 await, 채점 결과는 동일)
+
+    추천 엔진 조회는 데이터 버전 확인(MySQL)이나 코퍼스 전체 로드를 할 수 있고 채점은 전체 행렬
+    연산이므로, 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    """
+    onboarding_answers = state.get("onboarding_answers") or {}
+    profile_text = _build_user_profile_text(onboarding_answers, state.get("question"))
+    if not profile_text:
+        return _empty_recommendation()
+
+    profile_embedding = await aget_query_embedding(profile_text)
+
+    engine = await asyncio.to_thread(get_recommendation_engine)
+    if engine is not None:
+        return await asyncio.to_thread(
+            _engine_recommendation, engine, profile_text, profile_embedding
+        )
+
+    hits = await asearch_major_docs(profile_embedding, top_k=50)
+    return _hits_recommendation(profile_text, profile_embedding, hits)
+
+
+def _empty_recommendation() -> dict:
+    return {
+        "user_profile_text": "",
+        "recommended_majors": [],
+        "major_search_hits": [],
+        "major_scores": {},
+    }
+
+
+def _engine_recommendation(engine, profile_text: str, profile_embedding) -> dict:
+    result = engine.recommend(profile_embedding, MAJOR_DOC_WEIGHTS)
+    return {
+        "user_profile_text": profile_text,
+        "user_profile_embedding": profile_embedding,
+        **result,
+    }
+
+
+def _hits_recommendation(profile_text: str, profile_embedding, hits) -> dict:
     # 검색된 문서들의 점수를 전공별로 합산
     aggregated_scores = aggregate_major_scores(hits, MAJOR_DOC_WEIGHTS)
 
@@ -311,6 +401,25 @@ def agent_node(state: MentorState) -> dict:
     """
     [ReAct 패턴] LLM이 자율적으로 tool 호출 여부를 결정.
     """
+    response = get_llm_with_tools().invoke(_agent_messages(state))
+
+    # [MODIFICIATION] Removed internal retry loop to prevent token duplication in stream.
+    # The prompt should be sufficient to encourage tool usage.
+    # If the LLM responds without tools for greetings, it is acceptable.
+
+    # 4. LLM의 응답(response)을 messages에 추가하여 상태 업데이트
+    #    → should_continue가 tool_calls 유무를 확인하여 다음 노드 결정
+    return {"messages": [response]}
+
+
+async def aagent_node(state: MentorState) -> dict:
+    """agent_node의 비동기 버전 (ainvoke로 LLM 응답을 기다리는 동안 이벤트 루프를 양보)"""
+    response = await get_llm_with_tools().ainvoke(_agent_messages(state))
+    return {"messages": [response]}
+
+
+def _agent_messages(state: MentorState) -> list:
+    """시스템 프롬프트(없으면 추가) + 대화 메시지"""
     messages = state.get("messages", [])
     interests = state.get("interests")
 
@@ -349,16 +458,7 @@ def agent_node(state: MentorState) -> dict:
 
     if system_message:
         messages = [system_message] + messages
-
-    response = llm_with_tools.invoke(messages)
-
-    # [MODIFICIATION] Removed internal retry loop to prevent token duplication in stream.
-    # The prompt should be sufficient to encourage tool usage.
-    # If the LLM responds without tools for greetings, it is acceptable.
-
-    # 4. LLM의 응답(response)을 messages에 추가하여 상태 업데이트
-    #    → should_continue가 tool_calls 유무를 확인하여 다음 노드 결정
-    return {"messages": [response]}
+    return messages
 
 
 def should_continue(state: MentorState) -> str:
@@ -4,10 +4,37 @@
 
 프론트엔드(Streamlit)에서 이 파일의 run_mentor() 함수를 호출하여
 사용자 질문에 대한 답변을 받습니다.
+
+ASGI 서버 등 이벤트 루프에서 호출할 때는 async 버전(arun_mentor, astream_mentor,
+arun_major_recommendation)을 사용합니다. 같은 그래프를 ainvoke/astream으로 실행하며,
+노드/툴도 비동기 구현(LLM ainvoke, 임베딩 aembed_query, 벡터 검색, DB 조회)으로 실행되어
+I/O를 기다리는 동안 스레드를 점유하지 않습니다. 비동기 드라이버가 없는 동기 I/O(추천 캐시의
+데이터 버전 조회/SQLite, 카탈로그 로드, 추천 엔진 로드)는 asyncio.to_thread로 이벤트 루프 밖에서 실행합니다.
 """
 
+import asyncio
+
+import numpy as np
 from langchain_core.messages import HumanMessage
 from .graph.graph_builder import build_graph
+from .graph.nodes import (
+    MAJOR_DOC_WEIGHTS,
+    _build_user_profile_text,
+    canonicalize_onboarding_answers,
+)
+from .rag.answer_cache import (
+    AnswerCacheSession,
+    final_answer_from_chunk,
+    replay_answer,
+)
+from .rag.embeddings import embedding_scope, get_embeddings
+from .rag.recommendation_cache import (
+    get_cached_recommendation,
+    recommendation_cache_key,
+    store_recommendation,
+)
+from .rag.recommendation_engine import get_recommendation_engine
+from .rag.tool_cache import tool_run_scope
 
 # 그래프 캐싱을 위한 전역 변수
 # 그래프 빌드는 비용이 높으므로(컴파일 등), 한 번 빌드한 그래프를 메모리에 상주시켜 재사용합니다.
@@ -15,6 +42,9 @@ from .graph.graph_builder import build_graph
 _graph_react = None
 _graph_major = None
 
+# 그래프가 답변 메시지를 만들지 못했을 때 반환하는 문구
+NO_ANSWER_MESSAGE = "답변을 생성할 수 없습니다."
+
 
 def get_graph(mode: str = "react"):
     """
@@ -48,6 +78,22 @@ def get_graph(mode: str = "react"):
         raise ValueError(f"Unknown mode: {mode}")
 
 
+def _build_messages(question: str, chat_history: list[dict] | None) -> list:
+    """대화 기록 + 마지막 질문을 그래프 입력 메시지 목록으로 변환합니다."""
+    messages = []
+    if chat_history:
+        for msg in chat_history:
+            # LLM이 이전 메시지를 이해하고 맥락을 이어가도록 함
+            if msg["role"] == "user":
+                messages.append(HumanMessage(content=msg["content"]))
+            elif msg["role"] == "assistant":
+                messages.append(HumanMessage(content=msg["content"]))
+
+    # 마지막 질문을 추가
+    messages.append(HumanMessage(content=question))
+    return messages
+
+
 def run_mentor(
     question: str,
     interests: str | None = None,
@@ -78,17 +124,7 @@ def run_mentor(
     # 1. 캐싱된 그래프 인스턴스 가져오기
     graph = get_graph(mode=mode)
 
-    messages = []
-    if chat_history:
-        for msg in chat_history:
-            # LLM이 이전 메시지를 이해하고 맥락을 이어가도록 함
-            if msg["role"] == "user":
-                messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                messages.append(HumanMessage(content=msg["content"]))
-
-    # 마지막 질문을 추가
-    messages.append(HumanMessage(content=question))
+    messages = _build_messages(question, chat_history)
 
     if mode == "react":
         # ==================== ReAct 모드 ====================
@@ -99,17 +135,77 @@ def run_mentor(
         }
 
         # 그래프 실행: agent ⇄ tools 반복하며 답변 생성
-        final_state = graph.invoke(state)
+        # 한 턴 안에서 여러 툴이 같은 텍스트를 임베딩하지 않도록 요청 단위 메모 공유
+        # (같은 인자로 반복된 툴 호출도 실행 단위 메모에서 바로 반환)
+        with embedding_scope(), tool_run_scope():
+            # 대화 기록이 없는 첫 질문이면 시맨틱 답변 캐시 먼저 조회 (ANSWER_CACHE_ENABLED)
+            cache_session = AnswerCacheSession.open(question, chat_history, mode, interests)
+            cached = cache_session.lookup() if cache_session else None
+            if cached is not None:
+                return cached.answer
+
+            final_state = graph.invoke(state)
 
-        if "awaiting_user_input" in final_state:
-            return final_state
+            answer, final_answer = _answer_from_state(final_state)
+            if cache_session and final_answer:
+                cache_session.store(final_answer)
+            return answer
+    return NO_ANSWER_MESSAGE
 
-        # 마지막 메시지(LLM의 최종 답변)에서 텍스트 추출
-        messages = final_state.get("messages", [])
-        if messages:
-            last_message = messages[-1]
-            return last_message.content
-        return "답변을 생성할 수 없습니다."
+
+async def arun_mentor(
+    question: str,
+    interests: str | None = None,
+    mode: str = "react",
+    chat_history: list[dict] | None = None,
+) -> str | dict:
+    """
+    run_mentor의 비동기 버전. 인자와 반환값은 run_mentor와 같습니다.
+
+    그래프를 ainvoke로 실행하므로 에이전트 노드는 llm.ainvoke, 툴은 각 coroutine 구현으로 실행됩니다.
+    """
+    graph = get_graph(mode=mode)
+
+    if mode == "react":
+        state = {
+            "messages": _build_messages(question, chat_history),
+            "interests": interests,
+        }
+
+        with embedding_scope(), tool_run_scope():
+            cache_session = await AnswerCacheSession.aopen(
+                question, chat_history, mode, interests
+            )
+            cached = await cache_session.alookup() if cache_session else None
+            if cached is not None:
+                return cached.answer
+
+            final_state = await graph.ainvoke(state)
+
+            answer, final_answer = _answer_from_state(final_state)
+            if cache_session and final_answer:
+                await cache_session.astore(final_answer)
+            return answer
+    return NO_ANSWER_MESSAGE
+
+
+def _answer_from_state(final_state: dict) -> tuple[str | dict, str | None]:
+    """
+    그래프 최종 상태에서 (반환할 답변, 답변 캐시에 저장할 최종 답변)을 꺼냅니다.
+
+    `awaiting_user_input` 상태면 상태 딕셔너리를 그대로 반환합니다.
+    """
+    if "awaiting_user_input" in final_state:
+        return final_state, None
+
+    # 마지막 메시지(LLM의 최종 답변)에서 텍스트 추출
+    messages = final_state.get("messages", [])
+    if messages:
+        last_message = messages[-1]
+        if getattr(last_message, "tool_calls", None):
+            return last_message.content, None
+        return last_message.content, last_message.content
+    return NO_ANSWER_MESSAGE, None
 
 
 def run_mentor_stream(
@@ -133,22 +229,70 @@ def run_mentor_stream(
     """
     graph = get_graph(mode=mode)
 
-    messages = []
-    if chat_history:
-        for msg in chat_history:
-            if msg["role"] == "user":
-                messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                messages.append(HumanMessage(content=msg["content"]))
+    state = {
+        "messages": _build_messages(question, chat_history),
+    }
 
-    messages.append(HumanMessage(content=question))
+    def _stream_in_scope():
+        # 스트리밍 동안에도 한 턴의 툴 호출들이 임베딩 메모를 공유하도록 스코프 유지
+        with embedding_scope(), tool_run_scope():
+            # 첫 질문이 캐시에 있으면 그래프를 실행하지 않고 저장된 답변을 delta로 재생
+            cache_session = AnswerCacheSession.open(question, chat_history, mode)
+            cached = cache_session.lookup() if cache_session else None
+            if cached is not None:
+                yield from replay_answer(cached.answer, stream_mode)
+                return
+
+            final_answer = None
+            for chunk in graph.stream(state, stream_mode=stream_mode):
+                if cache_session:
+                    final_answer = final_answer_from_chunk(chunk, stream_mode) or final_answer
+                yield chunk
+
+            # 스트림이 끝까지 정상 종료된 경우에만 저장 (중단/예외 시에는 저장하지 않음)
+            if cache_session and final_answer:
+                cache_session.store(final_answer)
+
+    # stream_mode="updates"를 사용하여 각 노드의 업데이트 사항을 스트리밍
+    return _stream_in_scope()
 
+
+async def astream_mentor(
+    question: str,
+    chat_history: list[dict] | None = None,
+    mode: str = "react",
+    stream_mode: str | list[str] = "updates",
+):
+    """
+    run_mentor_stream의 비동기 버전 (async 제너레이터).
+    ASGI 워커에서 실행되는 views.astream_chat_responses에서 사용됩니다.
+
+    graph.astream()으로 청크를 받으므로 LLM 응답/툴 I/O를 기다리는 동안 워커 스레드를 점유하지 않습니다.
+
+    Yields:
+        run_mentor_stream과 같은 LangGraph 스트리밍 청크
+    """
+    graph = get_graph(mode=mode)
     state = {
-        "messages": messages,
+        "messages": _build_messages(question, chat_history),
     }
 
-    # stream_mode="updates"를 사용하여 각 노드의 업데이트 사항을 스트리밍
-    return graph.stream(state, stream_mode=stream_mode)
+    with embedding_scope(), tool_run_scope():
+        cache_session = await AnswerCacheSession.aopen(question, chat_history, mode)
+        cached = await cache_session.alookup() if cache_session else None
+        if cached is not None:
+            for chunk in replay_answer(cached.answer, stream_mode):
+                yield chunk
+            return
+
+        final_answer = None
+        async for chunk in graph.astream(state, stream_mode=stream_mode):
+            if cache_session:
+                final_answer = final_answer_from_chunk(chunk, stream_mode) or final_answer
+            yield chunk
+
+        if cache_session and final_answer:
+            await cache_session.astore(final_answer)
 
 
 def run_major_recommendation(
@@ -175,16 +319,134 @@ def run_major_recommendation(
             - recommended_majors (list[dict]): 추천 전공 목록 (이름, 점수, 설명 등)
             - major_scores (dict): 주요 전공별 적합도 점수
             - major_search_hits (list): 벡터 검색 원본 결과 (디버깅용)
+            - from_cache (bool): 같은 답변 조합의 캐시된 추천 결과를 반환했는지 여부
     """
+    # 정규화된 답변이 같으면 (데이터 버전이 바뀌지 않은 한) 이전 추천 결과를 재사용
+    cache_key, cached = _lookup_recommendation(onboarding_answers, question)
+    if cached is not None:
+        cached["from_cache"] = True
+        return cached
+
     graph = get_graph(mode="major")
     state = {
         "onboarding_answers": onboarding_answers,
         "question": question,
     }
-    final_state = graph.invoke(state)
+    with embedding_scope():
+        final_state = graph.invoke(state)
+    result = _recommendation_from_state(final_state)
+    store_recommendation(cache_key, result)
+    result["from_cache"] = False
+    return result
+
+
+async def arun_major_recommendation(
+    onboarding_answers: dict, question: str | None = None
+) -> dict:
+    """run_major_recommendation의 비동기 버전 (인자/반환값 동일, 그래프를 ainvoke로 실행)"""
+    # 캐시 키(데이터 버전 MySQL 조회)와 캐시 조회/저장(SQLite)은 동기 I/O이므로 스레드에서 실행
+    cache_key, cached = await asyncio.to_thread(
+        _lookup_recommendation, onboarding_answers, question
+    )
+    if cached is not None:
+        cached["from_cache"] = True
+        return cached
+
+    graph = get_graph(mode="major")
+    state = {
+        "onboarding_answers": onboarding_answers,
+        "question": question,
+    }
+    with embedding_scope():
+        final_state = await graph.ainvoke(state)
+    result = _recommendation_from_state(final_state)
+    await asyncio.to_thread(store_recommendation, cache_key, result)
+    result["from_cache"] = False
+    return result
+
+
+def _lookup_recommendation(onboarding_answers: dict, question: str | None):
+    # (캐시 키, 캐시된 추천 결과 또는 None)
+    cache_key = recommendation_cache_key(
+        canonicalize_onboarding_answers(onboarding_answers, question), MAJOR_DOC_WEIGHTS
+    )
+    return cache_key, get_cached_recommendation(cache_key)
+
+
+def _recommendation_from_state(final_state: dict) -> dict:
     return {
         "user_profile_text": final_state.get("user_profile_text"),
         "recommended_majors": final_state.get("recommended_majors", []),
         "major_scores": final_state.get("major_scores", {}),
         "major_search_hits": final_state.get("major_search_hits", []),
     }
+
+
+# 일괄 추천 시 한 번의 행렬 연산으로 채점하는 학생 수 (메모리 사용량 제한)
+RECOMMENDATION_BATCH_SIZE = 64
+
+
+def run_major_recommendation_batch(
+    answers_list: list[dict], batch_size: int = RECOMMENDATION_BATCH_SIZE
+):
+    """
+    여러 학생의 온보딩 답변을 한꺼번에 추천합니다 (제너레이터).
+
+    학생마다 run_major_recommendation을 호출하면 임베딩 API 호출과 벡터 검색이 학생 수만큼 발생하므로,
+    프로필 텍스트를 모두 만든 뒤 batch_size 단위로 embed_documents 한 번 → 전체 코퍼스 행렬 채점 한 번으로
+    처리하고 학생별 결과를 순서대로 내보냅니다. 같은 답변 조합은 추천 결과 캐시를 사용합니다.
+
+    Args:
+        answers_list (list[dict]): 학생별 온보딩 답변 목록
+        batch_size (int): 한 번에 임베딩/채점할 학생 수
+
+    Yields:
+        dict: run_major_recommendation과 같은 결과 + index (answers_list 내 위치)
+    """
+    engine = get_recommendation_engine()
+    if engine is None:
+        # 전체 코퍼스 엔진을 쓸 수 없으면(RECOMMENDATION_ENGINE=vector 등) 학생별 그래프 실행
+        for index, answers in enumerate(answers_list):
+            yield {"index": index, **run_major_recommendation(answers)}
+        return
+
+    for start in range(0, len(answers_list), batch_size):
+        chunk = answers_list[start : start + batch_size]
+        results: dict[int, dict] = {}
+        pending: list[tuple[int, str, str | None]] = []  # (index, profile_text, cache_key)
+
+        for offset, answers in enumerate(chunk):
+            index = start + offset
+            profile_text = _build_user_profile_text(answers or {}, None)
+            if not profile_text:
+                results[index] = {
+                    "user_profile_text": "",
+                    "recommended_majors": [],
+                    "major_scores": {},
+                    "major_search_hits": [],
+                    "from_cache": False,
+                }
+                continue
+
+            cache_key = recommendation_cache_key(
+                canonicalize_onboarding_answers(answers, None), MAJOR_DOC_WEIGHTS
+            )
+            cached = get_cached_recommendation(cache_key)
+            if cached is not None:
+                results[index] = {**cached, "from_cache": True}
+            else:
+                pending.append((index, profile_text, cache_key))
+
+        if pending:
+            # 캐시에 없는 프로필만 한 번의 배치 임베딩 + 한 번의 행렬 채점
+            embeddings = get_embeddings().embed_documents([text for _, text, _ in pending])
+            scored = engine.recommend_many(
+                np.asarray(embeddings, dtype=np.float32), MAJOR_DOC_WEIGHTS
+            )
+            for (index, profile_text, cache_key), recommendation in zip(pending, scored):
+                result = {"user_profile_text": profile_text, **recommendation}
+                store_recommendation(cache_key, result)
+                results[index] = {**result, "from_cache": False}
+
+        for offset in range(len(chunk)):
+            yield {"index": start + offset, **results[start + offset]}
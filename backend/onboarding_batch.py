@@ -0,0 +1,92 @@
+"""
+온보딩 답변 일괄 업로드(CSV / JSONL) 파서.
+
+상담 교사/협력 학교가 올리는 학급 단위 온보딩 답변 파일을
+run_major_recommendation_batch()에 넘길 수 있는 (학생 ID, 답변 딕셔너리) 목록으로 변환합니다.
+CLI(backend/scripts/recommend_batch.py)와 Django API(api/onboarding/batch)가 함께 사용합니다.
+
+** CSV **
+첫 줄은 헤더이며 열 이름이 온보딩 답변 키(subjects, interests, career_goal 등)가 됩니다.
+student_id 또는 id 열이 있으면 결과의 학생 ID로 사용합니다.
+
+** JSONL **
+한 줄에 JSON 객체 하나. {"student_id": ..., "answers": {...}} 형태이거나
+답변 키를 최상위에 둔 객체({"student_id": ..., "subjects": ..., ...})를 모두 지원합니다.
+"""
+
+# backend/onboarding_batch.py
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import List, Optional, Tuple
+
+# 학생 ID로 사용하는 필드 이름 (앞에 있는 것이 우선)
+ID_FIELDS = ("student_id", "id")
+
+# 한 번에 처리할 수 있는 최대 학생 수 (API 업로드 제한)
+MAX_BATCH_RECORDS = 5000
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str] = None) -> str:
+    """파일 이름/Content-Type으로 "csv" 또는 "jsonl"을 판단합니다. (기본값 jsonl)"""
+    name = (filename or "").lower()
+    content_type = (content_type or "").lower()
+    if name.endswith(".csv") or "csv" in content_type:
+        return "csv"
+    return "jsonl"
+
+
+def _pop_student_id(row: dict, default: str) -> str:
+    for field in ID_FIELDS:
+        value = row.pop(field, None)
+        if value not in (None, ""):
+            return str(value)
+    return default
+
+
+def parse_onboarding_records(text: str, fmt: str) -> List[Tuple[str, dict]]:
+    """
+    업로드 내용을 [(student_id, answers), ...]로 변환합니다.
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 MAX_BATCH_RECORDS를 넘는 경우 (몇 번째 줄인지 포함)
+    """
+    records: List[Tuple[str, dict]] = []
+    if fmt == "csv":
+        reader = csv.DictReader(io.StringIO(text.lstrip("\ufeff")))
+        for line_no, row in enumerate(reader, start=2):
+            answers = {
+                (key or "").strip(): (value or "").strip()
+                for key, value in row.items()
+                if key and (value or "").strip()
+            }
+            student_id = _pop_student_id(answers, str(line_no - 1))
+            records.append((student_id, answers))
+    elif fmt == "jsonl":
+        for line_no, line in enumerate(text.lstrip("\ufeff").splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"line {line_no}: invalid JSON ({e})") from e
+            if not isinstance(row, dict):
+                raise ValueError(f"line {line_no}: expected a JSON object")
+            answers = row.get("answers")
+            if isinstance(answers, dict):
+                student_id = _pop_student_id(dict(row), str(len(records) + 1))
+                answers = dict(answers)
+            else:
+                answers = dict(row)
+                student_id = _pop_student_id(answers, str(len(records) + 1))
+            records.append((student_id, answers))
+    else:
+        raise ValueError(f"Unsupported format: {fmt}. Use 'csv' or 'jsonl'.")
+
+    if len(records) > MAX_BATCH_RECORDS:
+        raise ValueError(
+            f"Too many records: {len(records)} (max {MAX_BATCH_RECORDS} per upload)"
+        )
+    return records
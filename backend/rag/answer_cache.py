@@ -0,0 +1,555 @@
+"""
+시맨틱 답변 캐시 모듈
+
+"컴퓨터공학과 전망 어때?", "고분자공학과"처럼 대화 기록이 없는 첫 질문은 사용자마다 반복되지만
+매번 agent ⇄ tools 루프(LLM 여러 번 + 툴 호출)를 처음부터 실행합니다.
+이런 질문의 최종 답변을 저장해 두고, 의미가 거의 같은 질문이 다시 들어오면 그래프를 실행하지 않고
+저장된 답변을 바로 반환(스트리밍 시 delta로 재생)합니다. ANSWER_CACHE_ENABLED=true일 때만 동작합니다.
+
+** 조회 순서 **
+1. 정규화된 질문 문자열 일치 (임베딩 없이 조회)
+2. 질문 임베딩과 저장된 질문 벡터의 코사인 유사도가 ANSWER_CACHE_SIMILARITY_THRESHOLD 이상인 항목
+
+** 무효화 **
+- 항목마다 TTL(ANSWER_CACHE_TTL_SECONDS)을 가집니다.
+- 저장 시점의 데이터 버전(majors, major_categories, universities, vector_index)을 함께 기록하며,
+  버전이 바뀌면 이전 버전으로 만든 답변은 조회되지 않고 다음 저장 때 삭제됩니다.
+- 데이터 버전을 확인할 수 없으면(DB 오류 등) 캐시를 사용하지 않습니다.
+
+저장소는 CACHE_DIR/answer_cache.sqlite3 (WAL 모드)이며, 유사도 검색은 프로세스마다
+메모리에 올린 정규화 벡터 행렬(numpy)로 수행합니다. 다른 워커가 항목을 추가/삭제하면 다음 조회 때 다시 읽습니다.
+"""
+
+# backend/rag/answer_cache.py
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from backend.config import get_settings, resolve_path
+from backend.db.data_version import (
+    MAJOR_CATEGORIES_DATASET,
+    MAJORS_DATASET,
+    UNIVERSITIES_DATASET,
+    VECTOR_INDEX_DATASET,
+)
+from .embeddings import aget_query_embedding, get_query_embedding
+from .sqlite_store import SQLiteStore
+from .tool_cache import (
+    aget_cached_data_versions,
+    get_cached_data_versions,
+    is_run_degraded,
+)
+
+# 답변이 의존하는 데이터셋 (툴이 조회하는 DB 테이블 + 벡터 인덱스)
+ANSWER_DATASETS = (
+    MAJORS_DATASET,
+    MAJOR_CATEGORIES_DATASET,
+    UNIVERSITIES_DATASET,
+    VECTOR_INDEX_DATASET,
+)
+
+# 캐시된 답변을 delta로 재생할 때 한 번에 보내는 글자 수
+REPLAY_CHUNK_CHARS = 40
+
+# 첫 질문으로 보기 어려운 긴 입력은 캐싱하지 않음 (개인 상황 설명 등)
+MAX_QUESTION_CHARS = 200
+
+
+def normalize_question(question: str) -> str:
+    """공백/대소문자/끝 문장부호 차이를 무시하는 정확 일치용 키"""
+    text = re.sub(r"\s+", " ", question or "").strip().lower()
+    return text.rstrip("?!.~ ")
+
+
+def _encode_vector(vector: np.ndarray) -> bytes:
+    return array("f", vector.tolist()).tobytes()
+
+
+def _decode_vector(blob: bytes) -> List[float]:
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+@dataclass
+class AnswerCacheStats:
+    """답변 캐시 적중률 모니터링용 카운터"""
+
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    stores: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        hits = self.exact_hits + self.semantic_hits
+        lookups = hits + self.misses
+        return hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "stores": self.stores,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+@dataclass
+class CachedAnswer:
+    """조회된 캐시 항목"""
+
+    question: str
+    answer: str
+    similarity: float
+
+
+class AnswerCache(SQLiteStore):
+    """
+    질문 벡터 + 최종 답변을 SQLite에 저장하고(WAL 모드, SQLiteStore), 메모리 행렬로 유사 질문을 찾는 캐시.
+    """
+
+    TABLE = "answers"
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS answers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            question_key TEXT NOT NULL,
+            version TEXT NOT NULL,
+            question TEXT NOT NULL,
+            vector BLOB NOT NULL,
+            answer TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            UNIQUE (question_key, version)
+        )
+        """,
+    )
+
+    def __init__(self, path: Path, threshold: float, ttl_seconds: int, max_entries: int):
+        super().__init__(path, max_entries)
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.stats = AnswerCacheStats()
+
+        # 메모리 인덱스 (현재 데이터 버전의 항목만)
+        self._loaded_state: Optional[Tuple[str, int, int]] = None
+        self._keys: Dict[str, int] = {}
+        self._rows: List[Tuple[str, str, float]] = []  # (question, answer, expires_at)
+        self._matrix: Optional[np.ndarray] = None
+
+    # ---------- 메모리 인덱스 ----------
+
+    def _refresh(self, version: str) -> None:
+        """다른 워커가 항목을 바꿨거나 데이터 버전이 바뀌었으면 인덱스를 다시 읽습니다. (락 보유 상태)"""
+        max_id, count = self._conn.execute(
+            "SELECT COALESCE(MAX(id), 0), COUNT(*) FROM answers"
+        ).fetchone()
+        state = (version, max_id, count)
+        if state == self._loaded_state:
+            return
+
+        rows = self._conn.execute(
+            "SELECT question_key, question, vector, answer, expires_at "
+            "FROM answers WHERE version = ? AND expires_at > ?",
+            (version, time.time()),
+        ).fetchall()
+        self._keys = {}
+        self._rows = []
+        vectors = []
+        for question_key, question, blob, answer, expires_at in rows:
+            self._keys[question_key] = len(self._rows)
+            self._rows.append((question, answer, expires_at))
+            vectors.append(_decode_vector(blob))
+        self._matrix = np.asarray(vectors, dtype=np.float32) if vectors else None
+        self._loaded_state = state
+
+    # ---------- 조회 / 저장 ----------
+
+    def lookup_exact(self, question_key: str, version: str) -> Optional[CachedAnswer]:
+        with self._lock:
+            self._refresh(version)
+            row = self._keys.get(question_key)
+            if row is None:
+                return None
+            question, answer, expires_at = self._rows[row]
+            if expires_at <= time.time():
+                return None
+            self.stats.exact_hits += 1
+            return CachedAnswer(question=question, answer=answer, similarity=1.0)
+
+    def lookup_similar(self, vector: np.ndarray, version: str) -> Optional[CachedAnswer]:
+        with self._lock:
+            self._refresh(version)
+            if self._matrix is None or self._matrix.shape[1] != vector.shape[0]:
+                return None
+            scores = self._matrix @ vector
+            now = time.time()
+            # 유사도 높은 순으로 만료되지 않은 첫 항목
+            for row in np.argsort(-scores)[:5]:
+                score = float(scores[row])
+                if score < self.threshold:
+                    break
+                question, answer, expires_at = self._rows[row]
+                if expires_at > now:
+                    self.stats.semantic_hits += 1
+                    return CachedAnswer(question=question, answer=answer, similarity=score)
+            return None
+
+    def store(
+        self, question_key: str, question: str, vector: np.ndarray, answer: str, version: str
+    ) -> None:
+        now = time.time()
+        with self._lock:
+            # 이전 데이터 버전 / 만료 항목 정리
+            self._conn.execute(
+                "DELETE FROM answers WHERE version != ? OR expires_at <= ?",
+                (version, now),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO answers "
+                "(question_key, version, question, vector, answer, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    question_key,
+                    version,
+                    question,
+                    _encode_vector(vector),
+                    answer,
+                    now + self.ttl_seconds,
+                ),
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+            overflow = count - self.max_entries
+            if self.max_entries and overflow > 0:
+                # 만료가 가장 가까운(가장 오래 전에 저장된) 항목부터 삭제
+                self._conn.execute(
+                    "DELETE FROM answers WHERE id IN ("
+                    "SELECT id FROM answers ORDER BY expires_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+                count -= overflow
+                self.evictions += overflow
+            self._conn.commit()
+            self._count = count
+            self.stats.stores += 1
+
+    def record(self, stat: str) -> None:
+        """bypassed / misses 카운터를 증가시킵니다. (조회/저장과 같은 락에서 갱신)"""
+        with self._lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + 1)
+
+    def stats_snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return self.stats.as_dict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM answers")
+            self._conn.commit()
+            self._count = 0
+            self._loaded_state = None
+
+
+_ANSWER_CACHE: Optional[AnswerCache] = None
+_ANSWER_CACHE_LOCK = threading.Lock()
+
+
+def get_answer_cache() -> Optional[AnswerCache]:
+    """설정에서 활성화된 경우 공유 AnswerCache 인스턴스를 반환합니다."""
+    global _ANSWER_CACHE
+    settings = get_settings()
+    if not settings.answer_cache_enabled:
+        return None
+    with _ANSWER_CACHE_LOCK:
+        if _ANSWER_CACHE is None:
+            try:
+                _ANSWER_CACHE = AnswerCache(
+                    resolve_path(settings.cache_dir) / "answer_cache.sqlite3",
+                    threshold=settings.answer_cache_similarity_threshold,
+                    ttl_seconds=settings.answer_cache_ttl_seconds,
+                    max_entries=settings.answer_cache_max_entries,
+                )
+            except (OSError, sqlite3.Error) as e:
+                print(f"⚠️ Answer cache disabled: {e}")
+                return None
+        return _ANSWER_CACHE
+
+
+def get_answer_cache_stats() -> Dict[str, Any]:
+    """답변 캐시 적중률 (모니터링용)"""
+    cache = _ANSWER_CACHE
+    return cache.stats_snapshot() if cache is not None else {}
+
+
+def clear_answer_cache() -> None:
+    """저장된 답변을 모두 삭제합니다. (프롬프트/모델 변경 후 등)"""
+    cache = get_answer_cache()
+    if cache is not None:
+        cache.clear()
+
+
+def is_first_turn(question: str, chat_history: Optional[List[dict]]) -> bool:
+    """
+    이전 대화가 없는 첫 질문인지 확인합니다.
+
+    views.chat_api는 방금 저장한 현재 질문을 chat_history에 포함해서 넘기므로,
+    기록이 현재 질문 하나뿐인 경우도 첫 질문으로 봅니다.
+    """
+    if not chat_history:
+        return True
+    if len(chat_history) > 1:
+        return False
+    only = chat_history[0]
+    return only.get("role") == "user" and (only.get("content") or "").strip() == (
+        question or ""
+    ).strip()
+
+
+def is_cacheable_turn(
+    question: str,
+    chat_history: Optional[List[dict]],
+    mode: str = "react",
+    interests: Optional[str] = None,
+) -> bool:
+    """
+    답변 캐시를 사용할 턴인지 확인합니다. (run_mentor / 스트리밍 경로 공통 조건)
+
+    ReAct 모드의 첫 질문이고, 답변에 영향을 주는 추가 입력(interests)이 없어야 합니다.
+    """
+    return mode == "react" and not interests and is_first_turn(question, chat_history)
+
+
+# ==================== 그래프 실행 연동 ====================
+
+
+class AnswerCacheSession:
+    """
+    run_mentor / run_mentor_stream 한 번의 캐시 조회와 저장을 담당합니다.
+
+    사용 순서:
+        session = AnswerCacheSession.open(question, chat_history)
+        hit = session.lookup() if session else None
+        ... 미스면 그래프 실행 후 session.store(final_answer)
+
+    async 경로(arun_mentor / astream_mentor)는 aopen / alookup / astore를 사용합니다.
+    (임베딩과 데이터 버전 조회만 비동기로 하고, SQLite/행렬 조회는 로컬이므로 그대로 실행)
+    """
+
+    def __init__(self, cache: AnswerCache, question: str, version: str):
+        self.cache = cache
+        self.question = question
+        self.question_key = normalize_question(question)
+        self.version = version
+        self._vector: Optional[np.ndarray] = None
+
+    @classmethod
+    def open(
+        cls,
+        question: str,
+        chat_history: Optional[List[dict]] = None,
+        mode: str = "react",
+        interests: Optional[str] = None,
+    ) -> Optional["AnswerCacheSession"]:
+        """캐시 대상(활성화 + is_cacheable_turn + 데이터 버전 확인 가능)이면 세션을 반환합니다."""
+        cache = cls._eligible_cache(question, chat_history, mode, interests)
+        if cache is None:
+            return None
+        return cls._with_versions(cache, question, get_cached_data_versions(ANSWER_DATASETS))
+
+    @classmethod
+    async def aopen(
+        cls,
+        question: str,
+        chat_history: Optional[List[dict]] = None,
+        mode: str = "react",
+        interests: Optional[str] = None,
+    ) -> Optional["AnswerCacheSession"]:
+        """open의 비동기 버전"""
+        cache = cls._eligible_cache(question, chat_history, mode, interests)
+        if cache is None:
+            return None
+        versions = await aget_cached_data_versions(ANSWER_DATASETS)
+        return cls._with_versions(cache, question, versions)
+
+    @staticmethod
+    def _eligible_cache(
+        question: str,
+        chat_history: Optional[List[dict]],
+        mode: str,
+        interests: Optional[str],
+    ) -> Optional[AnswerCache]:
+        cache = get_answer_cache()
+        if cache is None:
+            return None
+        if (
+            not is_cacheable_turn(question, chat_history, mode, interests)
+            or not normalize_question(question)
+            or len(question) > MAX_QUESTION_CHARS
+        ):
+            cache.record("bypassed")
+            return None
+        return cache
+
+    @classmethod
+    def _with_versions(
+        cls, cache: AnswerCache, question: str, versions: Optional[Dict[str, int]]
+    ) -> Optional["AnswerCacheSession"]:
+        if versions is None:
+            cache.record("bypassed")
+            return None
+        return cls(cache, question, json.dumps(versions, sort_keys=True))
+
+    def _set_vector(self, embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        self._vector = vector / norm if norm else vector
+        return self._vector
+
+    def _question_vector(self) -> np.ndarray:
+        # embedding_scope 안에서 호출되므로 같은 질문을 툴이 다시 임베딩하지 않음
+        if self._vector is None:
+            self._set_vector(get_query_embedding(self.question.strip()))
+        return self._vector
+
+    async def _aquestion_vector(self) -> np.ndarray:
+        if self._vector is None:
+            self._set_vector(await aget_query_embedding(self.question.strip()))
+        return self._vector
+
+    def lookup(self) -> Optional[CachedAnswer]:
+        start = time.perf_counter()
+        hit = self._lookup_exact()
+        if hit is None:
+            try:
+                hit = self._lookup_similar(self._question_vector())
+            except Exception as e:
+                print(f"⚠️ Answer cache lookup failed: {e}")
+        return self._finish_lookup(hit, start)
+
+    async def alookup(self) -> Optional[CachedAnswer]:
+        """lookup의 비동기 버전 (질문 임베딩만 await)"""
+        start = time.perf_counter()
+        hit = self._lookup_exact()
+        if hit is None:
+            try:
+                hit = self._lookup_similar(await self._aquestion_vector())
+            except Exception as e:
+                print(f"⚠️ Answer cache lookup failed: {e}")
+        return self._finish_lookup(hit, start)
+
+    def _lookup_exact(self) -> Optional[CachedAnswer]:
+        return self.cache.lookup_exact(self.question_key, self.version)
+
+    def _lookup_similar(self, vector: np.ndarray) -> Optional[CachedAnswer]:
+        return self.cache.lookup_similar(vector, self.version)
+
+    def _finish_lookup(self, hit: Optional[CachedAnswer], start: float) -> Optional[CachedAnswer]:
+        if hit is None:
+            self.cache.record("misses")
+            return None
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(
+            f"💾 [AnswerCache] '{self.question}' ≈ '{hit.question}' "
+            f"(sim={hit.similarity:.3f}, {elapsed_ms:.1f}ms, "
+            f"hit rate: {self.cache.stats_snapshot()['hit_rate']:.0%})"
+        )
+        return hit
+
+    def _should_store(self, answer: Any) -> bool:
+        if not isinstance(answer, str) or not answer.strip():
+            return False
+        if is_run_degraded():
+            # 제한 시간 초과/검색 실패/일시 오류로 만든 답변은 다른 사용자에게 재생하지 않음
+            print(f"⚠️ [AnswerCache] '{self.question}' 저장하지 않음 (degraded tool results)")
+            return False
+        return True
+
+    def store(self, answer: Any) -> None:
+        """
+        그래프가 정상 종료한 최종 답변(문자열)만 저장합니다.
+
+        같은 실행에서 툴 결과가 품질 저하/일시 오류였다면(tool_cache.is_run_degraded) 저장하지 않습니다.
+        """
+        if not self._should_store(answer):
+            return
+        try:
+            self.cache.store(
+                self.question_key, self.question, self._question_vector(), answer, self.version
+            )
+        except Exception as e:
+            print(f"⚠️ Answer cache store failed: {e}")
+
+    async def astore(self, answer: Any) -> None:
+        """store의 비동기 버전"""
+        if not self._should_store(answer):
+            return
+        try:
+            self.cache.store(
+                self.question_key, self.question, await self._aquestion_vector(), answer, self.version
+            )
+        except Exception as e:
+            print(f"⚠️ Answer cache store failed: {e}")
+
+
+def final_answer_from_update(chunk: Any) -> Optional[str]:
+    """
+    "updates" 스트림 청크에서 에이전트의 최종 답변(툴 호출이 없는 메시지)을 꺼냅니다.
+    """
+    if not isinstance(chunk, dict):
+        return None
+    update = chunk.get("agent")
+    if not isinstance(update, dict):
+        return None
+    messages = update.get("messages") or []
+    if not messages:
+        return None
+    last = messages[-1]
+    if getattr(last, "tool_calls", None):
+        return None
+    content = getattr(last, "content", None)
+    return content if isinstance(content, str) and content else None
+
+
+def final_answer_from_chunk(chunk: Any, stream_mode: str | List[str]) -> Optional[str]:
+    """graph.stream() 청크 하나에서 최종 답변을 꺼냅니다. (stream_mode 형태에 맞춰 "updates"만 확인)"""
+    if isinstance(stream_mode, str):
+        return final_answer_from_update(chunk) if stream_mode == "updates" else None
+    if isinstance(chunk, tuple) and len(chunk) == 2 and chunk[0] == "updates":
+        return final_answer_from_update(chunk[1])
+    return None
+
+
+def replay_answer(answer: str, stream_mode: str | List[str]) -> Iterator[Any]:
+    """
+    캐시된 답변을 graph.stream()과 같은 형태의 청크로 재생합니다.
+
+    - "messages"를 요청한 경우: agent 노드의 AIMessageChunk를 REPLAY_CHUNK_CHARS 단위로 전송 (SSE delta)
+    - "updates"를 요청한 경우: 마지막에 agent 노드의 최종 AIMessage 업데이트 전송 (DB 저장용)
+    """
+    modes = [stream_mode] if isinstance(stream_mode, str) else list(stream_mode)
+    multi = not isinstance(stream_mode, str)
+    metadata = {"langgraph_node": "agent", "answer_cache": True}
+
+    if "messages" in modes:
+        for start in range(0, len(answer), REPLAY_CHUNK_CHARS):
+            piece = (AIMessageChunk(content=answer[start : start + REPLAY_CHUNK_CHARS]), metadata)
+            yield ("messages", piece) if multi else piece
+
+    if "updates" in modes:
+        update = {"agent": {"messages": [AIMessage(content=answer)]}}
+        yield ("updates", update) if multi else update
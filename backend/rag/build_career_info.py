@@ -0,0 +1,63 @@
+"""
+get_major_career_info 응답을 모든 전공 × 필드 그룹에 대해 미리 렌더링하는 스크립트.
+
+majors 테이블의 진로/통계/학업 컬럼을 한 번의 쿼리로 읽고, 툴과 같은 _render_career_info()로
+(jobs/stats/academics/all) 응답을 만들어 CACHE_DIR/career_info.json에 저장합니다.
+시드 스크립트로 majors 데이터를 바꾼 뒤 인덱스 동기화와 함께 실행하세요.
+(저장된 데이터 버전과 현재 버전이 다르면 툴은 저장소를 무시하고 직접 렌더링합니다)
+
+사용 예:
+    python -m backend.rag.build_career_info
+"""
+
+from __future__ import annotations
+
+import time
+
+from sqlalchemy.orm import load_only
+
+from backend.db.connection import SessionLocal
+from backend.db.data_version import MAJORS_DATASET, get_data_version
+from backend.db.models import Major
+from backend.rag.career_info_store import CAREER_INFO_FIELDS, save_career_info
+from backend.rag.major_catalog import BASE_COLUMNS, FIELD_GROUPS, convert_major_row
+from backend.rag.tools import _render_career_info
+
+
+def build_career_info() -> int:
+    # 버전을 먼저 읽어 두면, 렌더링 도중 데이터가 바뀌어도 다음 버전과 섞이지 않음
+    version = get_data_version(MAJORS_DATASET)
+    started = time.perf_counter()
+
+    columns = list(BASE_COLUMNS) + list(FIELD_GROUPS["all"])
+    session = SessionLocal()
+    try:
+        rows = (
+            session.query(Major)
+            .options(load_only(*[getattr(Major, column) for column in columns]))
+            .order_by(Major.id)
+            .all()
+        )
+        records = [convert_major_row(row, columns) for row in rows]
+    finally:
+        session.close()
+
+    entries = {}
+    for record in records:
+        # 카탈로그와 같이 먼저 로드된(id가 작은) 레코드를 우선
+        if record.major_id in entries:
+            continue
+        entries[record.major_id] = {
+            field: _render_career_info(record, field) for field in CAREER_INFO_FIELDS
+        }
+
+    path = save_career_info(entries, version)
+    print(
+        f"Rendered {len(entries)} majors x {len(CAREER_INFO_FIELDS)} fields "
+        f"(v{version}) into {path} in {time.perf_counter() - started:.2f}s."
+    )
+    return len(entries)
+
+
+if __name__ == "__main__":
+    build_career_info()
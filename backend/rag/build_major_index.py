@@ -1,34 +1,93 @@
 """
-Pinecone 전공 인덱스를 처음부터 다시 구성할 때 사용하는 유틸리티 스크립트.
+Pinecone 전공 인덱스를 로컬 데이터와 맞추는 유틸리티 스크립트.
 
-로컬 JSON 데이터를 MajorDoc으로 변환한 뒤 Pinecone 네임스페이스를 비우고
-모든 문서를 재업서트하는 일련의 과정을 자동화합니다.
+로컬 JSON 데이터를 MajorDoc으로 변환한 뒤, 기본적으로는 증분 동기화(sync)를 수행합니다.
+문서별 내용 해시를 이전 실행의 매니페스트와 비교하여 바뀐 문서만 다시 임베딩/업서트하고
+사라진 문서는 삭제하므로, 네임스페이스가 비는 시간 없이 검색이 계속 동작합니다.
+
+--full을 지정하면 기존처럼 네임스페이스를 비우고 모든 문서를 재업서트합니다.
+전체 재구축이 중간에 중단되면 체크포인트가 남으며, 다시 실행하면 네임스페이스를 비우지 않고
+완료되지 않은 배치부터 이어서 업서트합니다. 그사이 문서 목록이나 내용이 바뀌었다면
+체크포인트를 버리고 네임스페이스를 비운 뒤 처음부터 실행합니다. (--restart로 항상 처음부터 실행)
+
+사용 예:
+    python -m backend.rag.build_major_index            # 증분 동기화
+    python -m backend.rag.build_major_index --dry-run  # 변경 사항만 확인
+    python -m backend.rag.build_major_index --full     # 전체 재구축
 """
 
 from __future__ import annotations
 
+import argparse
+
+from backend.rag.ingestion import clear_checkpoint, has_checkpoint
 from backend.rag.loader import load_major_detail, build_all_major_docs
 from backend.rag.vectorstore import (
     clear_major_index,
     index_major_docs,
     get_major_vectorstore,
+    major_checkpoint_matches,
+    sync_major_docs,
 )
 
 
-def rebuild_major_index() -> None:
+def rebuild_major_index(restart: bool = False) -> None:
     # 로컬 JSON → MajorDoc 생성 → Pinecone 업서트 순서로 인덱스를 재구축
     records = load_major_detail()
     docs = build_all_major_docs(records)
     print(f"Loaded {len(records)} majors and prepared {len(docs)} documents.")
 
+    if restart:
+        clear_checkpoint("majors")
+
     # 인덱스가 존재하지 않는 환경에서도 안전하게 초기화되도록 벡터스토어를 먼저 준비
     get_major_vectorstore()
-    clear_major_index()
-    print("Cleared existing Pinecone index namespace.")
+    if has_checkpoint("majors") and major_checkpoint_matches(docs):
+        # 이전 실행이 중단된 경우: 이미 업서트된 배치를 지우지 않고 이어서 진행
+        print("Found an unfinished rebuild. Resuming without clearing the namespace.")
+    else:
+        if has_checkpoint("majors"):
+            # 문서가 바뀌어 이어서 진행할 수 없음: 옛 내용으로 업서트된 배치까지 지우고 다시 실행
+            print("Found an unfinished rebuild for a different document set. Starting over.")
+            clear_checkpoint("majors")
+        clear_major_index()
+        print("Cleared existing Pinecone index namespace.")
 
     indexed = index_major_docs(docs)
     print(f"Indexed {indexed} documents into Pinecone.")
 
 
+def sync_major_index(dry_run: bool = False) -> None:
+    # 로컬 JSON → MajorDoc 생성 → 매니페스트와 비교하여 바뀐 문서만 반영
+    records = load_major_detail()
+    docs = build_all_major_docs(records)
+    print(f"Loaded {len(records)} majors and prepared {len(docs)} documents.")
+
+    get_major_vectorstore()
+    result = sync_major_docs(docs, dry_run=dry_run)
+    if dry_run:
+        print(f"Dry run finished: {result.summary()}")
+
+
 if __name__ == "__main__":
-    rebuild_major_index()
+    parser = argparse.ArgumentParser(description="Sync or rebuild the majors vector index.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="네임스페이스를 비우고 모든 문서를 다시 업서트 (기본값: 증분 동기화)",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="--full과 함께 사용: 체크포인트를 무시하고 처음부터 다시 실행",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="증분 동기화 시 변경 사항만 출력하고 인덱스는 수정하지 않음",
+    )
+    args = parser.parse_args()
+    if args.full or args.restart:
+        rebuild_major_index(restart=args.restart)
+    else:
+        sync_major_index(dry_run=args.dry_run)
@@ -0,0 +1,130 @@
+"""
+사전 렌더링된 전공 진로 정보 저장소
+
+get_major_career_info의 응답은 (전공, specific_field)와 majors 데이터에만 의존하므로,
+build_career_info 스크립트가 모든 전공 × 필드 그룹(jobs/stats/academics/all) 응답을 미리 만들어
+CACHE_DIR/career_info.json에 저장해 둡니다. 툴은 전공을 찾은 뒤 이 저장소에서 응답을 꺼내므로
+LONGTEXT 컬럼 조회와 _format_* 포맷팅 비용이 조회 한 번으로 바뀝니다.
+
+** 무효화 **
+파일에는 생성 당시 majors 데이터 버전이 기록되며, 현재 카탈로그 버전과 다르면 사용하지 않습니다.
+(시드 스크립트가 데이터를 바꾸면 스크립트를 다시 실행할 때까지 툴이 직접 렌더링)
+다른 프로세스가 파일을 다시 생성하면 수정 시각을 비교하여 다음 조회 때 다시 읽습니다.
+"""
+
+# backend/rag/career_info_store.py
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from backend.config import get_settings, resolve_path
+
+# 미리 렌더링하는 specific_field 값
+CAREER_INFO_FIELDS = ("all", "jobs", "stats", "academics")
+
+
+def get_career_info_path() -> Path:
+    return resolve_path(get_settings().cache_dir) / "career_info.json"
+
+
+class CareerInfoStore:
+    """major_id → {field: 응답 JSON 문자열} 저장소 (읽기 전용, 파일 변경 시 자동 재로드)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.version: Optional[int] = None
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._mtime: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _reload_if_changed(self) -> None:
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime == self._mtime:
+            return
+
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            entries: Dict[str, Dict[str, str]] = {}
+            version = None
+            if mtime is not None:
+                try:
+                    data = json.loads(self.path.read_text(encoding="utf-8"))
+                    version = data.get("majors_version")
+                    # 조회 시 호출자가 결과를 수정해도 저장소가 바뀌지 않도록 문자열로 보관
+                    entries = {
+                        major_id: {
+                            field: json.dumps(response, ensure_ascii=False)
+                            for field, response in fields.items()
+                        }
+                        for major_id, fields in (data.get("entries") or {}).items()
+                    }
+                    print(
+                        f"✅ Precomputed career info loaded: {len(entries)} majors (v{version})"
+                    )
+                except (OSError, ValueError, AttributeError) as e:
+                    print(f"⚠️ Ignoring unreadable career info store {self.path}: {e}")
+            self._entries = entries
+            self.version = version
+            self._mtime = mtime
+
+    def get(
+        self, major_id: str, field: str, majors_version: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        미리 렌더링된 응답을 반환합니다.
+
+        저장소가 없거나, 데이터 버전이 현재 카탈로그와 다르거나, 해당 조합이 없으면 None.
+        """
+        self._reload_if_changed()
+        if majors_version is None or self.version != majors_version:
+            return None
+        payload = self._entries.get(major_id, {}).get(field)
+        return json.loads(payload) if payload is not None else None
+
+    def __len__(self) -> int:
+        self._reload_if_changed()
+        return len(self._entries)
+
+
+def save_career_info(
+    entries: Dict[str, Dict[str, Dict[str, Any]]], majors_version: Optional[int]
+) -> Path:
+    """렌더링 결과를 원자적으로 저장합니다. (서비스 중인 프로세스가 쓰다 만 파일을 읽지 않도록)"""
+    path = get_career_info_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(
+        json.dumps(
+            {
+                "majors_version": majors_version,
+                "built_at": time.time(),
+                "entries": entries,
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, path)
+    return path
+
+
+_STORE: Optional[CareerInfoStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_career_info_store() -> CareerInfoStore:
+    """프로세스 전역 CareerInfoStore를 반환합니다."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = CareerInfoStore(get_career_info_path())
+        return _STORE
@@ -0,0 +1,259 @@
+"""
+임베딩 캐시 모듈
+
+동일한 텍스트(전공명, 카테고리 토큰, 단일 학과 질문 등)를 반복해서 임베딩하지 않도록
+get_embeddings()가 반환하는 임베딩 모델을 2단계 캐시로 감쌉니다.
+
+** 캐시 구조 **
+1. 메모리 캐시 (LRU): 프로세스 내에서 가장 최근에 사용한 벡터를 보관
+2. 디스크 캐시 (SQLite): 프로세스 재시작/재인덱싱 시에도 재사용되는 영구 저장소
+
+** 캐시 키 **
+(임베딩 제공자, 모델명, 텍스트 해시) 조합을 SHA-256으로 해싱하여 사용합니다.
+모델이 바뀌면 키가 달라지므로 다른 차원의 벡터가 섞이지 않습니다.
+"""
+
+# backend/rag/embedding_cache.py
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from .sqlite_store import SQLiteStore
+
+
+def _encode_vector(vector: List[float]) -> bytes:
+    # float32 바이트열로 직렬화 (JSON 대비 약 1/4 크기)
+    return array("f", vector).tobytes()
+
+
+def _decode_vector(blob: bytes) -> List[float]:
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class SQLiteEmbeddingStore(SQLiteStore):
+    """
+    임베딩 벡터를 SQLite 파일에 저장하는 디스크 캐시.
+
+    여러 gunicorn 워커가 같은 파일을 공유할 수 있도록 WAL 모드를 사용하며(SQLiteStore),
+    max_entries를 넘으면 마지막 접근 시각이 오래된 항목부터 삭제합니다.
+    """
+
+    TABLE = "embeddings"
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS embeddings (
+            key TEXT PRIMARY KEY,
+            vector BLOB NOT NULL,
+            last_access REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings (last_access)",
+    )
+
+    def __init__(self, path: Path, max_entries: int = 200000):
+        super().__init__(path, max_entries)
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """키 목록에 해당하는 벡터를 조회하고 접근 시각을 갱신합니다."""
+        if not keys:
+            return {}
+
+        found: Dict[str, List[float]] = {}
+        now = time.time()
+        with self._lock:
+            # SQLite 바인딩 변수 제한(999)을 고려하여 나눠서 조회
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = _decode_vector(blob)
+                if rows:
+                    hit_keys = [row[0] for row in rows]
+                    hit_placeholders = ",".join("?" for _ in hit_keys)
+                    self._conn.execute(
+                        f"UPDATE embeddings SET last_access = ? WHERE key IN ({hit_placeholders})",
+                        [now, *hit_keys],
+                    )
+            self._conn.commit()
+        return found
+
+    def put_many(self, items: Dict[str, List[float]]) -> None:
+        """벡터를 저장하고 최대 개수를 넘으면 오래된 항목을 정리합니다."""
+        if not items:
+            return
+
+        now = time.time()
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, vector, last_access) VALUES (?, ?, ?)",
+                [(key, _encode_vector(vec), now) for key, vec in items.items()],
+            )
+            self._count += self._conn.total_changes - before
+
+            if self.max_entries and self._count > self.max_entries:
+                # 한 번에 10% 여유를 확보하여 매 호출마다 삭제가 일어나지 않도록 함
+                self._evict_least_recent(self._count - int(self.max_entries * 0.9))
+            self._conn.commit()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    LangChain Embeddings 인터페이스를 그대로 유지하면서 결과를 캐싱하는 래퍼.
+
+    PineconeVectorStore, retriever, tools 등 기존 호출부는 변경 없이
+    embed_query / embed_documents를 호출하면 됩니다.
+    """
+
+    def __init__(
+        self,
+        base: Embeddings,
+        provider: str,
+        model_name: str,
+        memory_size: int = 4096,
+        store: Optional[SQLiteEmbeddingStore] = None,
+    ):
+        self.base = base
+        self.provider = provider
+        self.model_name = model_name
+        self.memory_size = memory_size
+        self.store = store
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 캐시 적중률 모니터링용 카운터
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _key(self, text: str) -> str:
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.provider}:{self.model_name}:{text_hash}"
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        # 메모리 LRU에 추가 (호출자가 락을 잡고 있어야 함)
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        # 1단계: 메모리 → 2단계: 디스크 순서로 조회
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+            self.memory_hits += len(found)
+
+        remaining = [key for key in keys if key not in found]
+        if remaining and self.store is not None:
+            try:
+                disk_found = self.store.get_many(remaining)
+            except sqlite3.Error as e:
+                print(f"⚠️ Embedding disk cache read failed: {e}")
+                disk_found = {}
+            with self._lock:
+                for key, vector in disk_found.items():
+                    self._remember(key, vector)
+                self.disk_hits += len(disk_found)
+            found.update(disk_found)
+
+        return found
+
+    def _save(self, computed: Dict[str, List[float]]) -> None:
+        with self._lock:
+            for key, vector in computed.items():
+                self._remember(key, vector)
+            self.misses += len(computed)
+
+        if self.store is not None:
+            try:
+                self.store.put_many(computed)
+            except sqlite3.Error as e:
+                print(f"⚠️ Embedding disk cache write failed: {e}")
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in texts]
+        found = self._lookup(list(dict.fromkeys(keys)))
+
+        # 캐시에 없는 텍스트만 모아서 한 번에 임베딩 (중복 텍스트는 1회만)
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+
+        if missing:
+            vectors = self.base.embed_documents(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            self._save(computed)
+            found.update(computed)
+
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        found = self._lookup([key])
+        if key in found:
+            return found[key]
+
+        vector = self.base.embed_query(text)
+        self._save({key: vector})
+        return vector
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in texts]
+        found = self._lookup(list(dict.fromkeys(keys)))
+
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+
+        if missing:
+            vectors = await self.base.aembed_documents(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            self._save(computed)
+            found.update(computed)
+
+        return [found[key] for key in keys]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        found = self._lookup([key])
+        if key in found:
+            return found[key]
+
+        vector = await self.base.aembed_query(text)
+        self._save({key: vector})
+        return vector
+
+    def stats(self) -> Dict[str, int | float]:
+        """캐시 적중/미스 통계를 반환합니다."""
+        total = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / total if total else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_entries": len(self.store) if self.store is not None else 0,
+            "disk_evictions": self.store.evictions if self.store is not None else 0,
+        }
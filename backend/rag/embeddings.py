@@ -7,18 +7,69 @@
 임베딩 모델은 다음 용도로 사용됩니다:
 1. 과목 정보를 벡터로 변환하여 Vector DB에 저장 (vectorstore.py)
 2. 사용자 질문을 벡터로 변환하여 유사한 과목 검색 (retriever.py)
+
+EMBEDDING_CACHE_ENABLED=true(기본값)이면 임베딩 결과를 메모리 LRU + SQLite 디스크에
+캐싱하는 CachedEmbeddings 래퍼를 반환합니다. (embedding_cache.py 참고)
+
+또한 하나의 사용자 요청(툴 호출, 그래프 실행) 안에서 같은 문자열을 여러 번 임베딩하지 않도록
+요청 단위 메모(embedding_scope)를 제공합니다. 벡터 검색 경로는 get_query_embedding()으로
+벡터를 얻은 뒤 벡터 기반 검색 API를 호출해야 메모를 공유할 수 있습니다.
 """
 # backend/rag/embeddings.py
+import functools
+import inspect
 import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
 
-from langchain_openai import OpenAIEmbeddings
-
-from backend.config import get_settings
+from backend.config import get_settings, resolve_path
+from .embedding_cache import CachedEmbeddings, SQLiteEmbeddingStore
 
 # 임베딩 모델 싱글톤 캐시
 # 여러 쿼리가 동시에 실행될 때 모델을 중복 로딩하지 않도록 전역 변수에 캐싱
 # 특히 HuggingFace 모델은 로딩 시간이 길기 때문에 캐싱이 중요함
 _EMBEDDINGS_CACHE = None
+_EMBEDDINGS_LOCK = threading.Lock()
+
+
+def _wrap_with_cache(base, settings, provider: str):
+    """
+    임베딩 모델을 CachedEmbeddings로 감쌉니다.
+
+    EMBEDDING_CACHE_ENABLED=false이면 원본 모델을 그대로 반환합니다.
+    디스크 캐시 파일을 열 수 없는 환경(읽기 전용 볼륨 등)에서는 메모리 캐시만 사용합니다.
+    """
+    if not settings.embedding_cache_enabled:
+        return base
+
+    store = None
+    try:
+        store = SQLiteEmbeddingStore(
+            resolve_path(settings.cache_dir) / "embeddings.sqlite3",
+            max_entries=settings.embedding_cache_max_entries,
+        )
+    except Exception as e:
+        print(f"⚠️ Embedding disk cache disabled: {e}")
+
+    return CachedEmbeddings(
+        base,
+        provider=provider,
+        model_name=settings.embedding_model_name,
+        memory_size=settings.embedding_cache_memory_size,
+        store=store,
+    )
+
+
+def _build_openai_embeddings(settings):
+    # 제공자 SDK는 해당 제공자를 사용할 때 import (huggingface 사용 시 langchain_openai 미로드)
+    from langchain_openai import OpenAIEmbeddings
+
+    return OpenAIEmbeddings(
+        model=settings.embedding_model_name,  # .env의 EMBEDDING_MODEL_NAME
+        openai_api_key=settings.openai_api_key
+    )
 
 
 def get_embeddings():
@@ -38,7 +89,8 @@ def get_embeddings():
       - huggingface: HuggingFace의 임베딩 모델 (예: upskyy/bge-m3-korean)
 
     Returns:
-        LangChain Embeddings 인스턴스 (OpenAIEmbeddings 또는 HuggingFaceEmbeddings)
+        LangChain Embeddings 인스턴스 (캐시 활성화 시 OpenAIEmbeddings/HuggingFaceEmbeddings를
+        감싼 CachedEmbeddings)
 
     Raises:
         ValueError: 지원하지 않는 EMBEDDING_PROVIDER가 설정된 경우
@@ -46,11 +98,18 @@ def get_embeddings():
     global _EMBEDDINGS_CACHE
 
     # 이미 로드된 모델이 있으면 재사용 (싱글톤 패턴)
-    # 여러 쿼리가 동시에 실행되어도 모델은 한 번만 로딩됨
+    # 여러 쿼리가 동시에 실행되어도 모델은 한 번만 로딩됨 (첫 생성은 락 안에서 한 번만 수행)
     if _EMBEDDINGS_CACHE is not None:
         return _EMBEDDINGS_CACHE
 
-    settings = get_settings()
+    with _EMBEDDINGS_LOCK:
+        if _EMBEDDINGS_CACHE is None:
+            _EMBEDDINGS_CACHE = _create_embeddings(get_settings())
+        return _EMBEDDINGS_CACHE
+
+
+def _create_embeddings(settings):
+    # EMBEDDING_PROVIDER에 맞는 임베딩 모델을 만들고 캐시 래퍼로 감쌉니다. (get_embeddings 전용)
     provider = settings.embedding_provider.lower()
 
     # 임베딩 문맥 고려 사항
@@ -61,11 +120,8 @@ def get_embeddings():
         # OpenAI 임베딩 사용
         # 예: text-embedding-3-small (1536차원, 저렴), text-embedding-3-large (3072차원, 고품질)
         print("Using OpenAI Embeddings")
-        _EMBEDDINGS_CACHE = OpenAIEmbeddings(
-            model=settings.embedding_model_name,  # .env의 EMBEDDING_MODEL_NAME
-            openai_api_key=settings.openai_api_key
-        )
-        return _EMBEDDINGS_CACHE
+        base = _build_openai_embeddings(settings)
+        return _wrap_with_cache(base, settings, provider)
 
     if provider == "huggingface":
         # HuggingFace 임베딩 사용 (로컬 또는 Inference API)
@@ -86,15 +142,122 @@ def get_embeddings():
         # normalize_embeddings=True: 벡터를 단위 벡터로 정규화 (코사인 유사도 계산에 유리)
         encode_kwargs = {"normalize_embeddings": True}
 
-        _EMBEDDINGS_CACHE = HuggingFaceEmbeddings(
+        base = HuggingFaceEmbeddings(
             model_name=settings.embedding_model_name,  # 예: "upskyy/bge-m3-korean"
             model_kwargs=model_kwargs,
             encode_kwargs=encode_kwargs
         )
-        return _EMBEDDINGS_CACHE
+        return _wrap_with_cache(base, settings, provider)
 
     # 지원하지 않는 제공자
     raise ValueError(
         f"Unsupported EMBEDDING_PROVIDER: {settings.embedding_provider}. "
         "Use one of ['openai', 'huggingface']."
     )
+
+
+def reset_embedding_connections() -> None:
+    """
+    fork된 워커에서 호출: 부모(gunicorn master)가 만든 HTTP 커넥션 풀을 새로 만듭니다.
+
+    워밍업(backend.warmup)이 master에서 임베딩을 호출하면(인덱스 생성 시 차원 확인 등) keep-alive 소켓이 풀에 남는데,
+    그대로 두면 여러 워커가 같은 소켓을 쓰게 됩니다. 모델 객체 자체는 유지하므로
+    이미 이 객체를 참조하는 VectorStore도 그대로 사용할 수 있습니다.
+    (디스크 캐시 연결은 warmup.after_fork가 sqlite_store.reopen_all_stores()로 교체)
+    """
+    cached = _EMBEDDINGS_CACHE
+    if cached is None:
+        return
+
+    base = cached
+    if isinstance(cached, CachedEmbeddings):
+        base = cached.base
+
+    settings = get_settings()
+    if settings.embedding_provider.lower() == "openai":
+        fresh = _build_openai_embeddings(settings)
+        base.client = fresh.client
+        base.async_client = fresh.async_client
+
+
+# ==================== 요청 단위 임베딩 메모 ====================
+
+# 현재 요청(스코프)에서 이미 임베딩한 텍스트 → 벡터 매핑
+# ContextVar를 사용하므로 LangGraph ToolNode의 스레드 풀에도 컨텍스트가 복사되어 공유됨
+_EMBEDDING_SCOPE: ContextVar[Optional[Dict[str, List[float]]]] = ContextVar(
+    "embedding_scope", default=None
+)
+
+
+@contextmanager
+def embedding_scope():
+    """
+    요청 단위 임베딩 메모를 여는 컨텍스트 매니저.
+
+    스코프 안에서 get_query_embedding()으로 요청한 텍스트는 한 번만 임베딩됩니다.
+    이미 스코프가 열려 있으면(툴이 그래프 실행 안에서 호출되는 경우 등) 바깥 메모를 재사용합니다.
+    """
+    memo = _EMBEDDING_SCOPE.get()
+    if memo is not None:
+        yield memo
+        return
+
+    memo = {}
+    token = _EMBEDDING_SCOPE.set(memo)
+    try:
+        yield memo
+    finally:
+        try:
+            _EMBEDDING_SCOPE.reset(token)
+        except ValueError:
+            # 스트리밍 제너레이터가 다른 컨텍스트에서 종료되는 경우
+            _EMBEDDING_SCOPE.set(None)
+
+
+def with_embedding_scope(func):
+    """함수 실행 전체를 embedding_scope로 감싸는 데코레이터 (툴 함수용, async 함수 지원)."""
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with embedding_scope():
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with embedding_scope():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def get_query_embedding(text: str) -> List[float]:
+    """
+    검색 쿼리 텍스트의 임베딩을 반환합니다.
+
+    embedding_scope 안에서 호출되면 같은 텍스트에 대해 저장된 벡터를 재사용하고,
+    스코프 밖에서는 get_embeddings().embed_query()와 동일하게 동작합니다.
+    """
+    memo = _EMBEDDING_SCOPE.get()
+    if memo is not None and text in memo:
+        return memo[text]
+
+    vector = get_embeddings().embed_query(text)
+    if memo is not None:
+        memo[text] = vector
+    return vector
+
+
+async def aget_query_embedding(text: str) -> List[float]:
+    """get_query_embedding의 비동기 버전 (같은 요청 단위 메모 공유, aembed_query 사용)"""
+    memo = _EMBEDDING_SCOPE.get()
+    if memo is not None and text in memo:
+        return memo[text]
+
+    vector = await get_embeddings().aembed_query(text)
+    if memo is not None:
+        memo[text] = vector
+    return vector
@@ -0,0 +1,107 @@
+"""
+현재 Pinecone 인덱스의 네임스페이스를 로컬 NumPy 스냅샷으로 내보내는 유틸리티 스크립트.
+
+VECTOR_BACKEND=local로 전환하기 전에 한 번 실행하면
+majors / university_majors / major_categories 네임스페이스의 벡터와 메타데이터를
+VECTOR_SNAPSHOT_DIR 아래에 저장합니다. (재임베딩 없이 Pinecone에 저장된 벡터를 그대로 사용)
+
+사용 예:
+    python -m backend.rag.export_vector_snapshot
+    python -m backend.rag.export_vector_snapshot --namespace major_categories
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any
+
+from backend.config import get_settings, resolve_path
+from backend.rag.local_vectorstore import write_snapshot
+from backend.rag.vectorstore import (
+    DEFAULT_LOCAL_NAMESPACE,
+    MAJOR_CATEGORIES_NAMESPACE,
+    UNIVERSITY_MAJORS_NAMESPACE,
+    _get_major_namespace,
+    get_major_index,
+)
+
+
+def fetch_namespace(index, namespace: str | None, batch_size: int = 100):
+    """
+    Pinecone 네임스페이스의 모든 벡터를 ID 목록 → fetch 순서로 내려받습니다.
+
+    Returns:
+        (ids, vectors, texts, metadatas) 튜플
+    """
+    ids: list[str] = []
+    vectors: list[list[float]] = []
+    texts: list[str] = []
+    metadatas: list[dict[str, Any]] = []
+
+    list_kwargs: dict[str, Any] = {"limit": batch_size}
+    if namespace:
+        list_kwargs["namespace"] = namespace
+
+    for id_batch in index.list(**list_kwargs):
+        if not id_batch:
+            continue
+        response = index.fetch(ids=list(id_batch), namespace=namespace or "")
+        for vector_id, vector in response.vectors.items():
+            metadata = dict(vector.metadata or {})
+            # PineconeVectorStore(text_key="text")와 동일하게 본문은 메타데이터에서 분리
+            text = metadata.pop("text", "")
+            ids.append(vector_id)
+            vectors.append(list(vector.values))
+            texts.append(text)
+            metadatas.append(metadata)
+
+    return ids, vectors, texts, metadatas
+
+
+def export_snapshot(namespaces: list[str | None] | None = None) -> dict[str, int]:
+    """
+    지정한 네임스페이스들을 스냅샷 디렉토리에 저장하고 네임스페이스별 문서 수를 반환합니다.
+    """
+    settings = get_settings()
+    snapshot_dir = resolve_path(settings.vector_snapshot_dir)
+    if namespaces is None:
+        namespaces = [
+            _get_major_namespace(),
+            UNIVERSITY_MAJORS_NAMESPACE,
+            MAJOR_CATEGORIES_NAMESPACE,
+        ]
+
+    index = get_major_index()
+    counts: dict[str, int] = {}
+    for namespace in namespaces:
+        local_name = namespace or DEFAULT_LOCAL_NAMESPACE
+        started = time.perf_counter()
+        ids, vectors, texts, metadatas = fetch_namespace(index, namespace)
+        if not ids:
+            print(f"⚠️ Namespace '{local_name}' is empty. Skipped.")
+            counts[local_name] = 0
+            continue
+
+        write_snapshot(snapshot_dir / local_name, ids, vectors, texts, metadatas)
+        counts[local_name] = len(ids)
+        print(
+            f"✅ Exported '{local_name}': {len(ids)} vectors "
+            f"({time.perf_counter() - started:.1f}s)"
+        )
+
+    print(f"Snapshot saved to {snapshot_dir}")
+    return counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Export Pinecone namespaces to a local vector snapshot."
+    )
+    parser.add_argument(
+        "--namespace",
+        action="append",
+        help="내보낼 네임스페이스 (여러 번 지정 가능, 기본값: 전체)",
+    )
+    args = parser.parse_args()
+    export_snapshot(args.namespace)
@@ -0,0 +1,194 @@
+"""
+벡터 인덱스 증분 동기화 모듈
+
+clear_major_index() 후 전체 문서를 다시 임베딩하던 대신, 문서별 (text + metadata) 해시를
+매니페스트 파일(CACHE_DIR/index_manifest/<namespace>.json)에 저장해 두고
+다음 실행 때 바뀐 문서만 다시 임베딩/업서트하며, 사라진 문서 ID는 삭제합니다.
+
+** 동작 순서 **
+1. build_all_major_docs / build_university_major_docs 결과의 문서별 해시 계산
+2. 매니페스트와 비교하여 신규/변경/삭제 대상 분류
+3. 신규/변경 문서 업서트 (같은 ID를 덮어쓰므로 기존 벡터는 교체 직전까지 검색 가능)
+4. 사라진 문서 ID 삭제
+5. 모두 성공하면 매니페스트 갱신
+
+매니페스트가 없으면(첫 실행, 캐시 삭제 등) 인덱스의 현재 ID 목록을 기준으로
+전체 문서를 업서트하고 남는 ID만 삭제합니다. 인덱스를 비우는 단계가 없으므로
+동기화 중에도 검색이 계속 동작합니다.
+"""
+
+# backend/rag/index_sync.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.config import get_settings, resolve_path
+from .ingestion import _get_writer, ingest_documents
+
+
+@dataclass
+class SyncResult:
+    """sync_documents() 실행 결과 (문서 수)"""
+
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"added={self.added}, updated={self.updated}, "
+            f"unchanged={self.unchanged}, deleted={self.deleted}"
+        )
+
+
+def doc_hash(text: str, metadata: Dict[str, Any]) -> str:
+    """문서 본문과 메타데이터를 합친 내용 해시 (키 순서와 무관)"""
+    payload = json.dumps(
+        {"text": text, "metadata": metadata},
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ==================== 매니페스트 ====================
+
+
+def get_manifest_path(namespace: Optional[str]) -> Path:
+    from .vectorstore import DEFAULT_LOCAL_NAMESPACE
+
+    name = namespace or DEFAULT_LOCAL_NAMESPACE
+    return resolve_path(get_settings().cache_dir) / "index_manifest" / f"{name}.json"
+
+
+def load_manifest(namespace: Optional[str]) -> Optional[Dict[str, str]]:
+    """{doc_id: hash} 매니페스트를 읽습니다. 없거나 읽을 수 없으면 None."""
+    path = get_manifest_path(namespace)
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️ Ignoring unreadable index manifest {path}: {e}")
+        return None
+    return data.get("docs") or {}
+
+
+def save_manifest(namespace: Optional[str], hashes: Dict[str, str]) -> None:
+    path = get_manifest_path(namespace)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(
+        json.dumps(
+            {"namespace": namespace, "updated_at": time.time(), "docs": hashes},
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, path)
+
+
+def clear_manifest(namespace: Optional[str]) -> None:
+    """네임스페이스를 비웠을 때 매니페스트도 함께 삭제합니다."""
+    try:
+        get_manifest_path(namespace).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def record_manifest(
+    namespace: Optional[str],
+    ids: List[str],
+    texts: List[str],
+    metadatas: List[Dict[str, Any]],
+) -> None:
+    """전체 재구축이 끝난 뒤 현재 문서 집합을 매니페스트로 저장합니다."""
+    save_manifest(
+        namespace,
+        {
+            doc_id: doc_hash(text, metadata)
+            for doc_id, text, metadata in zip(ids, texts, metadatas)
+        },
+    )
+
+
+# ==================== 동기화 ====================
+
+
+def sync_documents(
+    job: str,
+    namespace: Optional[str],
+    ids: List[str],
+    texts: List[str],
+    metadatas: List[Dict[str, Any]],
+    dry_run: bool = False,
+) -> SyncResult:
+    """
+    문서 집합을 네임스페이스와 증분 동기화합니다.
+
+    Args:
+        job: 업서트 체크포인트 이름 (전체 재구축과 구분되도록 "<job>_sync"로 저장)
+        namespace: 대상 네임스페이스
+        ids / texts / metadatas: 현재 데이터로 만든 전체 문서 목록
+        dry_run: True면 변경 사항만 집계하고 인덱스/매니페스트는 수정하지 않음
+    """
+    hashes = {
+        doc_id: doc_hash(text, metadata)
+        for doc_id, text, metadata in zip(ids, texts, metadatas)
+    }
+    writer = _get_writer(namespace)
+
+    manifest = load_manifest(namespace)
+    if manifest is None:
+        # 기준 매니페스트가 없으면 인덱스에 있는 ID를 모두 "내용을 알 수 없음"으로 취급
+        print(f"ℹ️ No index manifest for '{namespace}'. Reading existing IDs from the index.")
+        manifest = {doc_id: "" for doc_id in writer.list_ids()}
+
+    result = SyncResult()
+    changed_rows: List[int] = []
+    for row, doc_id in enumerate(ids):
+        previous = manifest.get(doc_id)
+        if previous == hashes[doc_id]:
+            result.unchanged += 1
+            continue
+        if previous is None:
+            result.added += 1
+        else:
+            result.updated += 1
+        changed_rows.append(row)
+
+    removed_ids = [doc_id for doc_id in manifest if doc_id not in hashes]
+    result.deleted = len(removed_ids)
+    print(f"🔍 [{job}] Sync plan for '{namespace}': {result.summary()}")
+
+    if dry_run:
+        return result
+
+    if changed_rows:
+        ingest_documents(
+            f"{job}_sync",
+            namespace,
+            [ids[row] for row in changed_rows],
+            [texts[row] for row in changed_rows],
+            [metadatas[row] for row in changed_rows],
+        )
+
+    if removed_ids:
+        writer.delete(removed_ids)
+        writer.flush()
+
+    save_manifest(namespace, hashes)
+    if changed_rows or removed_ids:
+        from .vectorstore import mark_vector_index_changed
+
+        mark_vector_index_changed()
+    print(f"✅ [{job}] Index synced: {result.summary()}")
+    return result
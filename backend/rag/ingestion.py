@@ -0,0 +1,473 @@
+"""
+벡터 인덱싱(Ingestion) 엔진
+
+build_major_index / ingest_university_majors / ingest_major_categories 스크립트가
+공통으로 사용하는 대량 업서트 엔진입니다. 기존에는 모든 문서를 add_texts 한 번으로
+직렬 처리했기 때문에 느리고, 중간에 실패하면 처음부터 다시 시작해야 했습니다.
+
+** 처리 흐름 **
+1. 문서를 INGEST_BATCH_SIZE 단위 배치로 나눔
+2. INGEST_MAX_WORKERS 크기의 스레드 풀에서 배치별로 임베딩 → 업서트 수행
+3. 실패한 호출은 지수 백오프로 INGEST_MAX_RETRIES회까지 재시도
+4. 완료된 배치 번호를 체크포인트 파일(CACHE_DIR/ingest/<job>.json)에 기록
+   → 같은 문서 집합으로 다시 실행하면 완료된 배치는 건너뛰고 이어서 진행
+5. 단계(임베딩/업서트)별 docs/s, tokens/s를 출력
+
+** 백엔드 **
+- pinecone: index.upsert()로 배치를 바로 업서트 (PineconeVectorStore와 같은 "text" 메타데이터 키)
+- local: LocalVectorStore에 메모리 업서트 후, 일정 배치마다 스냅샷 파일로 저장한 뒤 체크포인트 기록
+"""
+
+# backend/rag/ingestion.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.config import get_settings, resolve_path
+from .embeddings import get_embeddings
+
+# local 백엔드에서 스냅샷을 저장(=체크포인트 확정)하는 배치 간격
+LOCAL_FLUSH_EVERY = 20
+
+# 재시도 대기 시간의 기준값 (초): 1, 2, 4, ... + 지터
+RETRY_BASE_DELAY = 1.0
+
+
+# ==================== 통계 ====================
+
+
+@dataclass
+class StageStats:
+    """임베딩/업서트 단계별 처리량 집계 (여러 워커가 동시에 기록)"""
+
+    name: str
+    docs: int = 0
+    tokens: int = 0
+    busy_seconds: float = 0.0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, docs: int, tokens: int, started: float, finished: float) -> None:
+        with self._lock:
+            self.docs += docs
+            self.tokens += tokens
+            self.busy_seconds += finished - started
+            self.started = started if self.started is None else min(self.started, started)
+            self.finished = (
+                finished if self.finished is None else max(self.finished, finished)
+            )
+
+    @property
+    def span_seconds(self) -> float:
+        # 첫 배치 시작부터 마지막 배치 종료까지 (동시 실행 구간 포함한 실제 경과 시간)
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    def summary(self) -> str:
+        span = self.span_seconds
+        if span <= 0:
+            return f"{self.name}: {self.docs} docs"
+        return (
+            f"{self.name}: {self.docs} docs in {span:.1f}s "
+            f"({self.docs / span:.1f} docs/s, {self.tokens / span:.0f} tokens/s)"
+        )
+
+
+@dataclass
+class IngestionStats:
+    """ingest_documents() 실행 결과"""
+
+    job: str
+    total_docs: int
+    skipped_docs: int = 0
+    failed_batches: List[int] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    embed: StageStats = field(default_factory=lambda: StageStats("embed"))
+    upsert: StageStats = field(default_factory=lambda: StageStats("upsert"))
+
+    @property
+    def indexed_docs(self) -> int:
+        return self.upsert.docs
+
+    def report(self) -> None:
+        print(
+            f"📊 [{self.job}] {self.indexed_docs}/{self.total_docs} docs indexed "
+            f"(resumed: {self.skipped_docs} skipped) in {self.wall_seconds:.1f}s"
+        )
+        print(f"   - {self.embed.summary()}")
+        print(f"   - {self.upsert.summary()}")
+        if self.failed_batches:
+            print(f"   ⚠️ Failed batches: {self.failed_batches}")
+
+
+# ==================== 토큰 계산 ====================
+
+
+def _get_token_counter() -> Callable[[str], int]:
+    """
+    처리량 보고용 토큰 계산 함수를 반환합니다.
+
+    tiktoken 인코딩을 불러올 수 없는 환경(오프라인 등)에서는 글자 수 기반 근사치를 사용합니다.
+    """
+    try:
+        import tiktoken
+
+        try:
+            encoding = tiktoken.encoding_for_model(get_settings().embedding_model_name)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda text: len(encoding.encode(text or ""))
+    except Exception:
+        return lambda text: max(1, len(text or "") // 2)
+
+
+# ==================== 체크포인트 ====================
+
+
+class IngestCheckpoint:
+    """
+    완료된 배치 번호를 JSON 파일에 기록하는 체크포인트.
+
+    fingerprint(문서 ID/내용 + 배치 크기 + 네임스페이스)가 달라지면 이전 기록을 무시합니다.
+    """
+
+    def __init__(self, path: Path, fingerprint: str):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self.done: set[int] = set()
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        if not self.path.exists():
+            return None
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ Ignoring unreadable checkpoint {self.path}: {e}")
+            return None
+
+    def matches(self) -> bool:
+        """파일에 남은 체크포인트가 같은 fingerprint로 기록되었는지 확인합니다."""
+        data = self._read()
+        return data is not None and data.get("fingerprint") == self.fingerprint
+
+    def load(self) -> set[int]:
+        data = self._read()
+        if data is None:
+            return self.done
+        if data.get("fingerprint") == self.fingerprint:
+            self.done = set(data.get("done", []))
+        else:
+            print(f"ℹ️ Checkpoint {self.path.name} is for a different document set. Starting over.")
+        return self.done
+
+    def mark(self, batch_numbers: List[int]) -> None:
+        if not batch_numbers:
+            return
+        self.done.update(batch_numbers)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "fingerprint": self.fingerprint,
+                    "done": sorted(self.done),
+                    "updated_at": time.time(),
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        self.done = set()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def get_checkpoint_path(job: str) -> Path:
+    return resolve_path(get_settings().cache_dir) / "ingest" / f"{job}.json"
+
+
+def has_checkpoint(job: str) -> bool:
+    """이전 실행이 중단되어 이어서 진행할 체크포인트가 남아 있는지 확인합니다."""
+    return get_checkpoint_path(job).exists()
+
+
+def clear_checkpoint(job: str) -> None:
+    IngestCheckpoint(get_checkpoint_path(job), "").clear()
+
+
+def checkpoint_matches(
+    job: str,
+    namespace: Optional[str],
+    ids: List[str],
+    texts: List[str],
+    metadatas: List[Dict[str, Any]],
+    batch_size: Optional[int] = None,
+) -> bool:
+    """
+    남은 체크포인트가 지금 문서 목록으로 기록된 것인지 확인합니다.
+
+    문서 ID나 내용이 바뀌었다면 이미 업서트한 배치가 옛 내용이므로 이어서 진행할 수 없습니다.
+    (ingest_documents()는 처음부터 다시 업서트하므로 호출 측에서 네임스페이스도 비워야 합니다)
+    """
+    fingerprint = _fingerprint(
+        namespace, ids, texts, metadatas, _resolve_batch_size(batch_size)
+    )
+    return IngestCheckpoint(get_checkpoint_path(job), fingerprint).matches()
+
+
+def _resolve_batch_size(batch_size: Optional[int]) -> int:
+    return max(1, batch_size or get_settings().ingest_batch_size)
+
+
+def _fingerprint(
+    namespace: Optional[str],
+    ids: List[str],
+    texts: List[str],
+    metadatas: List[Dict[str, Any]],
+    batch_size: int,
+) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{namespace or ''}|{batch_size}|".encode("utf-8"))
+    for doc_id, text, metadata in zip(ids, texts, metadatas):
+        payload = json.dumps(
+            [doc_id, text, metadata], ensure_ascii=False, sort_keys=True, default=str
+        )
+        digest.update(payload.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# ==================== 네임스페이스 Writer ====================
+
+
+class _PineconeWriter:
+    """임베딩된 배치를 Pinecone 인덱스에 바로 업서트합니다."""
+
+    durable = True
+
+    def __init__(self, namespace: Optional[str]):
+        from .vectorstore import get_major_index
+
+        self.index = get_major_index()
+        self.namespace = namespace or ""
+
+    def upsert(
+        self,
+        ids: List[str],
+        vectors: List[List[float]],
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        # PineconeVectorStore(text_key="text")와 같은 형식으로 본문을 메타데이터에 저장
+        records = [
+            {"id": doc_id, "values": vector, "metadata": {**metadata, "text": text}}
+            for doc_id, vector, text, metadata in zip(ids, vectors, texts, metadatas)
+        ]
+        self.index.upsert(vectors=records, namespace=self.namespace)
+
+    def delete(self, ids: List[str]) -> None:
+        # Pinecone delete는 요청당 최대 1000개 ID
+        for start in range(0, len(ids), 1000):
+            self.index.delete(ids=ids[start : start + 1000], namespace=self.namespace)
+
+    def list_ids(self) -> List[str]:
+        ids: List[str] = []
+        for id_batch in self.index.list(namespace=self.namespace):
+            ids.extend(id_batch)
+        return ids
+
+    def flush(self) -> None:
+        pass
+
+
+class _LocalWriter:
+    """LocalVectorStore에 메모리 업서트하고 flush() 시 스냅샷 파일로 저장합니다."""
+
+    durable = False
+
+    def __init__(self, namespace: Optional[str]):
+        from .vectorstore import _get_local_vectorstore
+
+        self.store = _get_local_vectorstore(namespace)
+
+    def upsert(
+        self,
+        ids: List[str],
+        vectors: List[List[float]],
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        self.store.upsert_vectors(ids, vectors, texts, metadatas, persist=False)
+
+    def delete(self, ids: List[str]) -> None:
+        self.store.delete(ids=ids, persist=False)
+
+    def list_ids(self) -> List[str]:
+        return self.store.list_ids()
+
+    def flush(self) -> None:
+        self.store.save()
+
+
+def _get_writer(namespace: Optional[str]):
+    from .vectorstore import _use_local_backend
+
+    return _LocalWriter(namespace) if _use_local_backend() else _PineconeWriter(namespace)
+
+
+# ==================== 엔진 ====================
+
+
+def _with_retry(fn: Callable[[], Any], retries: int, label: str) -> Any:
+    # 일시적인 API 오류(레이트 리밋, 타임아웃)를 지수 백오프로 재시도
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt >= retries:
+                raise
+            delay = RETRY_BASE_DELAY * (2**attempt) + random.uniform(0, RETRY_BASE_DELAY)
+            print(f"⚠️ {label} failed ({e}). Retrying in {delay:.1f}s ({attempt + 1}/{retries})")
+            time.sleep(delay)
+
+
+def ingest_documents(
+    job: str,
+    namespace: Optional[str],
+    ids: List[str],
+    texts: List[str],
+    metadatas: List[Dict[str, Any]],
+    batch_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    resume: bool = True,
+) -> IngestionStats:
+    """
+    문서를 배치 단위로 임베딩하여 네임스페이스에 업서트합니다.
+
+    Args:
+        job: 체크포인트 파일 이름으로 쓰이는 작업 이름 (예: "majors")
+        namespace: 대상 네임스페이스 (None이면 기본 네임스페이스)
+        ids / texts / metadatas: 같은 길이의 문서 목록
+        batch_size / max_workers / max_retries: None이면 INGEST_* 설정값 사용
+        resume: False면 기존 체크포인트를 무시하고 처음부터 실행
+
+    Returns:
+        IngestionStats (실패한 배치가 있으면 체크포인트를 남기고 RuntimeError 발생)
+    """
+    settings = get_settings()
+    batch_size = _resolve_batch_size(batch_size)
+    max_workers = max(1, max_workers or settings.ingest_max_workers)
+    retries = settings.ingest_max_retries if max_retries is None else max_retries
+
+    stats = IngestionStats(job=job, total_docs=len(ids))
+    if not ids:
+        return stats
+
+    checkpoint = IngestCheckpoint(
+        get_checkpoint_path(job),
+        _fingerprint(namespace, ids, texts, metadatas, batch_size),
+    )
+    if resume:
+        checkpoint.load()
+    else:
+        checkpoint.clear()
+
+    batches = [
+        (number, start, min(start + batch_size, len(ids)))
+        for number, start in enumerate(range(0, len(ids), batch_size))
+    ]
+    pending = [batch for batch in batches if batch[0] not in checkpoint.done]
+    stats.skipped_docs = sum(end - start for number, start, end in batches) - sum(
+        end - start for number, start, end in pending
+    )
+    if stats.skipped_docs:
+        print(
+            f"⏩ [{job}] Resuming from checkpoint: "
+            f"{len(batches) - len(pending)}/{len(batches)} batches already done"
+        )
+
+    embeddings = get_embeddings()
+    writer = _get_writer(namespace)
+    count_tokens = _get_token_counter()
+
+    def process_batch(number: int, start: int, end: int) -> int:
+        batch_ids = ids[start:end]
+        batch_texts = texts[start:end]
+        batch_metadatas = [dict(metadata) for metadata in metadatas[start:end]]
+        tokens = sum(count_tokens(text) for text in batch_texts)
+
+        embed_started = time.perf_counter()
+        vectors = _with_retry(
+            lambda: embeddings.embed_documents(batch_texts),
+            retries,
+            f"[{job}] embed batch {number}",
+        )
+        embed_finished = time.perf_counter()
+        stats.embed.record(len(batch_ids), tokens, embed_started, embed_finished)
+
+        _with_retry(
+            lambda: writer.upsert(batch_ids, vectors, batch_texts, batch_metadatas),
+            retries,
+            f"[{job}] upsert batch {number}",
+        )
+        stats.upsert.record(len(batch_ids), tokens, embed_finished, time.perf_counter())
+        return number
+
+    started = time.perf_counter()
+    unflushed: List[int] = []
+    completed = 0
+    print(
+        f"🚀 [{job}] Ingesting {len(ids) - stats.skipped_docs} docs "
+        f"({len(pending)} batches x {batch_size}, workers={max_workers})"
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(process_batch, *batch): batch[0] for batch in pending}
+        for future in as_completed(futures):
+            number = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                stats.failed_batches.append(number)
+                print(f"❌ [{job}] Batch {number} failed after {retries} retries: {e}")
+                continue
+
+            completed += 1
+            unflushed.append(number)
+            # Pinecone은 업서트 즉시 반영, local은 스냅샷 저장 후에 체크포인트 확정
+            if writer.durable or len(unflushed) >= LOCAL_FLUSH_EVERY:
+                writer.flush()
+                checkpoint.mark(unflushed)
+                unflushed = []
+            if completed % 10 == 0 or completed == len(pending):
+                print(f"   📦 [{job}] {completed}/{len(pending)} batches done")
+
+    writer.flush()
+    checkpoint.mark(unflushed)
+    stats.wall_seconds = time.perf_counter() - started
+    stats.failed_batches.sort()
+    stats.report()
+
+    if stats.failed_batches:
+        raise RuntimeError(
+            f"[{job}] {len(stats.failed_batches)} batches failed. "
+            "Run the same command again to resume from the checkpoint."
+        )
+
+    checkpoint.clear()
+    return stats
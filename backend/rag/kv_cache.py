@@ -0,0 +1,233 @@
+"""
+TTL 키-값 캐시 모듈
+
+LLM 판단 결과처럼 "같은 입력이면 같은 결과"인 값을 프로세스 재시작 이후에도 재사용하기 위한
+범용 캐시입니다. 임베딩 캐시(embedding_cache.py)와 같은 2단계 구조를 사용합니다.
+
+** 캐시 구조 **
+1. 메모리 캐시 (LRU): 프로세스 내에서 최근 사용한 항목
+2. 디스크 캐시 (SQLite): 여러 워커/재시작 간에 공유되는 영구 저장소 (WAL 모드)
+
+** 항목 **
+- 값은 JSON으로 직렬화하여 저장하며, None도 "결과 없음"으로 캐싱할 수 있습니다. (네거티브 캐싱)
+- 항목마다 만료 시각(expires_at)을 가지며, 만료된 항목은 조회 시 미스로 처리됩니다.
+- max_entries를 넘으면 마지막 접근 시각이 오래된 항목부터 삭제합니다.
+"""
+
+# backend/rag/kv_cache.py
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .sqlite_store import SQLiteStore
+
+# 조회 결과가 없을 때 사용하는 표식 (None은 캐싱된 값일 수 있으므로 구분)
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중률 모니터링용 카운터"""
+
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class SQLiteKVStore(SQLiteStore):
+    """
+    JSON 값을 만료 시각과 함께 SQLite 파일에 저장하는 디스크 캐시. (WAL 모드, SQLiteStore)
+    """
+
+    TABLE = "entries"
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            last_access REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access)",
+    )
+
+    def __init__(self, path: Path, max_entries: int = 50000):
+        super().__init__(path, max_entries)
+
+    def get(self, key: str) -> Tuple[Any, float]:
+        """(값, 만료 시각)을 반환합니다. 없거나 만료되었으면 (_MISSING, 0)."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return _MISSING, 0.0
+            value, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                self._count -= 1
+                return _MISSING, 0.0
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+        return json.loads(value), expires_at
+
+    def put(self, key: str, value: Any, expires_at: float) -> None:
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, expires_at, now),
+            )
+            if exists is None:
+                self._count += 1
+
+            if self.max_entries and self._count > self.max_entries:
+                # 만료 항목을 먼저 지우고, 그래도 넘치면 오래된 항목부터 10% 여유 확보
+                expired = self._conn.execute(
+                    "DELETE FROM entries WHERE expires_at <= ?", (now,)
+                ).rowcount
+                self._count -= expired
+                self.evictions += expired
+                self._evict_least_recent(self._count - int(self.max_entries * 0.9))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self._count = 0
+
+class TTLCache:
+    """
+    메모리 LRU + SQLite 디스크 2단계 TTL 캐시.
+
+    get()은 (적중 여부, 값)을 반환하므로 None 값(네거티브 결과)도 적중으로 구분할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        memory_size: int = 1024,
+        store: Optional[SQLiteKVStore] = None,
+    ):
+        self.name = name
+        self.memory_size = memory_size
+        self.store = store
+        self._memory: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def _remember(self, key: str, value: Any, expires_at: float) -> None:
+        # 메모리 LRU에 추가 (호출자가 락을 잡고 있어야 함)
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _record(self, value: Any) -> None:
+        # 적중 통계 기록 (호출자가 락을 잡고 있어야 함)
+        if value is _MISSING:
+            self.stats.misses += 1
+            return
+        self.stats.hits += 1
+        if value is None:
+            self.stats.negative_hits += 1
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._record(value)
+                    return True, value
+                del self._memory[key]
+
+        value: Any = _MISSING
+        if self.store is not None:
+            try:
+                value, expires_at = self.store.get(key)
+            except (sqlite3.Error, ValueError) as e:
+                print(f"⚠️ {self.name} cache read failed: {e}")
+                value = _MISSING
+
+        with self._lock:
+            if value is not _MISSING:
+                self._remember(key, value, expires_at)
+            self._record(value)
+        if value is _MISSING:
+            return False, None
+        return True, value
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            return
+        expires_at = time.time() + ttl_seconds
+        with self._lock:
+            self._remember(key, value, expires_at)
+            self.stats.stores += 1
+
+        if self.store is not None:
+            try:
+                self.store.put(key, value, expires_at)
+                self.stats.evictions = self.store.evictions
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                print(f"⚠️ {self.name} cache write failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.store is not None:
+            self.store.clear()
+
+
+def open_ttl_cache(
+    name: str, directory: Path, max_entries: int, memory_size: int = 1024
+) -> TTLCache:
+    """
+    directory/<name>.sqlite3 디스크 캐시를 사용하는 TTLCache를 생성합니다.
+
+    디스크 캐시 파일을 열 수 없는 환경(읽기 전용 볼륨 등)에서는 메모리 캐시만 사용합니다.
+    """
+    store = None
+    try:
+        store = SQLiteKVStore(Path(directory) / f"{name}.sqlite3", max_entries=max_entries)
+    except Exception as e:
+        print(f"⚠️ {name} disk cache disabled: {e}")
+    return TTLCache(name, memory_size=memory_size, store=store)
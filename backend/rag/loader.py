@@ -50,6 +50,8 @@ class MajorRecord:
     university: Any = None
     chart_data: Any = None
     raw: dict = field(default_factory=dict, repr=False)
+    # DB에서 일부 컬럼만 로드한 경우 로드된 컬럼 이름 (None이면 전체 로드)
+    loaded_columns: Optional[frozenset] = field(default=None, repr=False, compare=False)
 
 
 # Pinecone에 업로드할 전공 문서 구조
@@ -0,0 +1,368 @@
+"""
+로컬 NumPy 벡터 스토어 모듈
+
+Pinecone 네임스페이스의 스냅샷을 로컬 파일로 저장해 두고,
+네트워크 없이 메모리 안에서 정확한(Exact) 코사인 유사도 Top-K 검색을 수행합니다.
+
+** 저장 구조 (네임스페이스별 디렉토리) **
+- vectors.npy   : 정규화된 float32 행렬 (문서 수 × 임베딩 차원)
+- records.json  : 행 순서와 동일한 [{"id", "text", "metadata"}] 목록
+
+** 사용 방법 **
+.env에서 VECTOR_BACKEND=local로 설정하면 vectorstore.py의 get_*_vectorstore() 함수들이
+PineconeVectorStore 대신 LocalVectorStore를 반환합니다.
+스냅샷은 export_vector_snapshot.py로 현재 Pinecone 인덱스에서 내려받을 수 있습니다.
+"""
+
+# backend/rag/local_vectorstore.py
+from __future__ import annotations
+
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+VECTORS_FILE = "vectors.npy"
+RECORDS_FILE = "records.json"
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    # 코사인 유사도를 내적 한 번으로 계산할 수 있도록 각 행을 단위 벡터로 변환
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    if matrix.size == 0:
+        return matrix
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _matches_filter(metadata: dict, filter: Optional[dict]) -> bool:
+    # Pinecone 메타데이터 필터 중 단순 일치($eq)와 포함($in)만 지원
+    if not filter:
+        return True
+    for field, condition in filter.items():
+        value = metadata.get(field)
+        if isinstance(condition, dict):
+            if "$eq" in condition and value != condition["$eq"]:
+                return False
+            if "$in" in condition and value not in condition["$in"]:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+def write_snapshot(
+    directory: Path,
+    ids: List[str],
+    vectors: List[List[float]],
+    texts: List[str],
+    metadatas: List[dict],
+) -> None:
+    """
+    네임스페이스 하나의 스냅샷을 디렉토리에 저장합니다.
+
+    중간에 실패해도 기존 스냅샷이 깨지지 않도록 임시 파일에 쓴 뒤 교체합니다.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    matrix = _normalize_rows(np.asarray(vectors, dtype=np.float32))
+    records = [
+        {"id": doc_id, "text": text, "metadata": metadata}
+        for doc_id, text, metadata in zip(ids, texts, metadatas)
+    ]
+
+    tmp_vectors = directory / f"{VECTORS_FILE}.tmp"
+    tmp_records = directory / f"{RECORDS_FILE}.tmp"
+    with open(tmp_vectors, "wb") as f:
+        np.save(f, matrix)
+    with open(tmp_records, "w", encoding="utf-8") as f:
+        json.dump(records, f, ensure_ascii=False)
+
+    os.replace(tmp_vectors, directory / VECTORS_FILE)
+    os.replace(tmp_records, directory / RECORDS_FILE)
+
+
+class LocalVectorStore(VectorStore):
+    """
+    PineconeVectorStore와 같은 LangChain 호출 방식을 지원하는 인메모리 벡터 스토어.
+
+    retriever.py / tools.py에서 사용하는 메서드
+    (similarity_search_by_vector_with_relevance_scores, similarity_search_by_vector_with_score,
+    similarity_search_with_score, similarity_search, add_texts)를 구현합니다.
+    점수는 Pinecone cosine 인덱스와 동일하게 원본 코사인 유사도를 반환합니다.
+    """
+
+    def __init__(self, namespace: str, embedding: Embeddings, snapshot_dir: Path):
+        self.namespace = namespace
+        self._embedding = embedding
+        self.directory = Path(snapshot_dir) / namespace
+        self._lock = threading.RLock()
+
+        self._ids: List[str] = []
+        self._texts: List[str] = []
+        self._metadatas: List[dict] = []
+        self._id_to_row: dict[str, int] = {}
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._load()
+
+    # ==================== 스냅샷 입출력 ====================
+
+    def _load(self) -> None:
+        vectors_path = self.directory / VECTORS_FILE
+        records_path = self.directory / RECORDS_FILE
+        if not vectors_path.exists() or not records_path.exists():
+            print(f"⚠️ Local vector snapshot not found: {self.directory}")
+            return
+
+        # mmap으로 열어 여러 워커 프로세스가 같은 페이지를 공유하도록 함 (쓰기 시에만 복사)
+        matrix = np.load(vectors_path, mmap_mode="r")
+        with open(records_path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+
+        if len(records) != matrix.shape[0]:
+            raise ValueError(
+                f"Corrupted snapshot for namespace '{self.namespace}': "
+                f"{len(records)} records vs {matrix.shape[0]} vectors"
+            )
+
+        self._matrix = matrix
+        self._ids = [record["id"] for record in records]
+        self._texts = [record.get("text") or "" for record in records]
+        self._metadatas = [record.get("metadata") or {} for record in records]
+        self._id_to_row = {doc_id: row for row, doc_id in enumerate(self._ids)}
+        print(
+            f"✅ Loaded local vector snapshot '{self.namespace}' ({len(self._ids)} docs)"
+        )
+
+    def save(self) -> None:
+        """현재 메모리 상태를 스냅샷 파일로 저장합니다."""
+        with self._lock:
+            write_snapshot(
+                self.directory,
+                self._ids,
+                self._matrix,
+                self._texts,
+                self._metadatas,
+            )
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def list_ids(self) -> List[str]:
+        """저장된 문서 ID 목록 (증분 동기화 시 매니페스트가 없을 때 사용)"""
+        with self._lock:
+            return list(self._ids)
+
+    def snapshot(self) -> Tuple[List[str], np.ndarray, List[str], List[dict]]:
+        """(ids, 정규화 행렬, texts, metadatas) 현재 상태 (전체 코퍼스 추천 엔진용)"""
+        with self._lock:
+            return list(self._ids), self._matrix, list(self._texts), list(self._metadatas)
+
+    # ==================== 검색 ====================
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        # Pinecone(cosine) 경로와 동일하게 원본 코사인 유사도를 그대로 사용
+        return lambda score: score
+
+    def _top_k(
+        self, embedding: List[float], k: int, filter: Optional[dict] = None
+    ) -> List[Tuple[int, float]]:
+        with self._lock:
+            matrix = self._matrix
+            metadatas = self._metadatas
+        if matrix.shape[0] == 0 or k <= 0:
+            return []
+
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0:
+            return []
+        scores = matrix @ (query / norm)
+
+        if filter:
+            mask = np.fromiter(
+                (_matches_filter(meta, filter) for meta in metadatas),
+                dtype=bool,
+                count=len(metadatas),
+            )
+            scores = np.where(mask, scores, -np.inf)
+
+        k = min(k, scores.shape[0])
+        # 전체 정렬 대신 argpartition으로 상위 k개만 고른 뒤 그 안에서 정렬
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(row), float(scores[row])) for row in top if scores[row] > -np.inf]
+
+    def _to_document(self, row: int) -> Document:
+        return Document(
+            id=self._ids[row],
+            page_content=self._texts[row],
+            metadata=dict(self._metadatas[row]),
+        )
+
+    def similarity_search_by_vector_with_score(
+        self, embedding: List[float], k: int = 4, filter: Optional[dict] = None, **kwargs
+    ) -> List[Tuple[Document, float]]:
+        return [
+            (self._to_document(row), score)
+            for row, score in self._top_k(embedding, k, filter)
+        ]
+
+    def similarity_search_by_vector_with_relevance_scores(
+        self, embedding: List[float], k: int = 4, filter: Optional[dict] = None, **kwargs
+    ) -> List[Tuple[Document, float]]:
+        return self.similarity_search_by_vector_with_score(embedding, k, filter)
+
+    def similarity_search_by_vector(
+        self, embedding: List[float], k: int = 4, filter: Optional[dict] = None, **kwargs
+    ) -> List[Document]:
+        return [
+            doc
+            for doc, _ in self.similarity_search_by_vector_with_score(
+                embedding, k, filter
+            )
+        ]
+
+    def similarity_search_with_score(
+        self, query: str, k: int = 4, filter: Optional[dict] = None, **kwargs
+    ) -> List[Tuple[Document, float]]:
+        embedding = self._embedding.embed_query(query)
+        return self.similarity_search_by_vector_with_score(embedding, k, filter)
+
+    def similarity_search(
+        self, query: str, k: int = 4, filter: Optional[dict] = None, **kwargs
+    ) -> List[Document]:
+        return [
+            doc for doc, _ in self.similarity_search_with_score(query, k, filter)
+        ]
+
+    # 메모리 행렬 연산만 하므로 비동기 경로에서도 스레드 풀을 거치지 않고 바로 계산
+
+    async def asimilarity_search_by_vector_with_score(
+        self, embedding: List[float], k: int = 4, filter: Optional[dict] = None, **kwargs
+    ) -> List[Tuple[Document, float]]:
+        return self.similarity_search_by_vector_with_score(embedding, k, filter)
+
+    async def asimilarity_search_by_vector(
+        self, embedding: List[float], k: int = 4, filter: Optional[dict] = None, **kwargs
+    ) -> List[Document]:
+        return self.similarity_search_by_vector(embedding, k, filter)
+
+    # ==================== 쓰기 ====================
+
+    def upsert_vectors(
+        self,
+        ids: List[str],
+        vectors: List[List[float]],
+        texts: List[str],
+        metadatas: List[dict],
+        persist: bool = True,
+    ) -> None:
+        """이미 임베딩된 벡터를 추가하거나 같은 ID의 문서를 교체합니다."""
+        if not ids:
+            return
+
+        new_rows = _normalize_rows(np.asarray(vectors, dtype=np.float32))
+        with self._lock:
+            # mmap(읽기 전용) 행렬은 수정 전에 메모리로 복사
+            matrix = np.array(self._matrix, dtype=np.float32)
+            if matrix.size == 0:
+                matrix = np.zeros((0, new_rows.shape[1]), dtype=np.float32)
+
+            appended: List[np.ndarray] = []
+            for offset, doc_id in enumerate(ids):
+                row = self._id_to_row.get(doc_id)
+                if row is not None:
+                    matrix[row] = new_rows[offset]
+                    self._texts[row] = texts[offset]
+                    self._metadatas[row] = metadatas[offset]
+                else:
+                    self._id_to_row[doc_id] = len(self._ids)
+                    self._ids.append(doc_id)
+                    self._texts.append(texts[offset])
+                    self._metadatas.append(metadatas[offset])
+                    appended.append(new_rows[offset])
+
+            if appended:
+                matrix = np.vstack([matrix, np.stack(appended)])
+            self._matrix = np.ascontiguousarray(matrix)
+
+            if persist:
+                self.save()
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[List[dict]] = None,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        texts = list(texts)
+        if not texts:
+            return []
+        metadatas = metadatas or [{} for _ in texts]
+        ids = ids or [str(uuid.uuid4()) for _ in texts]
+
+        vectors = self._embedding.embed_documents(texts)
+        self.upsert_vectors(ids, vectors, texts, [dict(m) for m in metadatas])
+        return ids
+
+    def delete(
+        self,
+        ids: Optional[List[str]] = None,
+        delete_all: Optional[bool] = None,
+        persist: bool = True,
+        **kwargs: Any,
+    ) -> Optional[bool]:
+        with self._lock:
+            if delete_all or kwargs.get("deleteAll"):
+                keep: List[int] = []
+            else:
+                targets = set(ids or [])
+                keep = [row for row, doc_id in enumerate(self._ids) if doc_id not in targets]
+
+            dimension = self._matrix.shape[1] if self._matrix.ndim == 2 else 0
+            self._matrix = (
+                np.ascontiguousarray(self._matrix[keep], dtype=np.float32)
+                if keep
+                else np.zeros((0, dimension), dtype=np.float32)
+            )
+            self._ids = [self._ids[row] for row in keep]
+            self._texts = [self._texts[row] for row in keep]
+            self._metadatas = [self._metadatas[row] for row in keep]
+            self._id_to_row = {doc_id: row for row, doc_id in enumerate(self._ids)}
+
+            if persist:
+                self.save()
+        return True
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: List[str],
+        embedding: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        *,
+        namespace: str = "default",
+        snapshot_dir: Optional[Path] = None,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> "LocalVectorStore":
+        if snapshot_dir is None:
+            raise ValueError("snapshot_dir is required for LocalVectorStore.from_texts")
+        store = cls(namespace=namespace, embedding=embedding, snapshot_dir=snapshot_dir)
+        store.add_texts(texts, metadatas=metadatas, ids=ids)
+        return store
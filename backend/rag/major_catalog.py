@@ -0,0 +1,462 @@
+"""
+전공 카탈로그 (인메모리) 모듈
+
+툴 호출마다 SessionLocal()을 열고 LONGTEXT JSON 컬럼을 json.loads 하던 대신,
+majors 테이블 전체를 프로세스당 한 번만 로드하여 파싱된 MajorRecord로 보관합니다.
+
+** 인덱스 **
+- by_id: major_id → MajorRecord
+- by_name: 정확한 major_name → MajorRecord
+- by_alias: 정규화된 별칭(공백 제거 + 소문자) → MajorRecord
+  major_aliases 테이블(department_aliases + 카테고리 세부 학과명)에서 로드하며,
+  테이블이 비어 있으면 department_aliases JSON으로 만듭니다.
+- universities: 대학명 ↔ 개설 학과 역색인 (university_index.py)
+  university_major_offerings 테이블이 채워져 있으면 majors.university JSON은 읽지 않습니다.
+
+** 컬럼 프로젝션 **
+로드 시에는 BASE_COLUMNS(이름, 연봉, 취업률 등)만 읽고, 진로/통계/학업 LONGTEXT 컬럼은
+ensure_fields(record, specific_field)가 FIELD_GROUPS에 정의된 최소 컬럼만 조회하여 채웁니다.
+
+** 갱신 방식 **
+data_versions 테이블의 "majors" 버전(PK 한 건 조회)만 주기적으로 비교하여,
+시드 스크립트가 데이터를 바꾼 경우에만 카탈로그를 다시 로드합니다.
+재로드는 한 스레드가 락 밖에서 새 카탈로그를 만든 뒤 참조만 교체하므로, 그동안 다른 요청은 기존 카탈로그를 사용합니다.
+"""
+
+# backend/rag/major_catalog.py
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import load_only
+
+from backend.config import get_settings
+from backend.db.connection import SessionLocal
+from backend.db.data_version import MAJORS_DATASET, get_data_version
+from backend.db.major_aliases import load_alias_map, normalize_alias
+from backend.db.models import Major, UniversityMajorOffering
+from .loader import MajorRecord
+from .university_index import UniversityIndex, UniversityOffering
+
+# ensure_fields()가 조회한 컬럼을 레코드에 반영할 때만 잡는 락 (DB 조회는 락 밖에서 수행)
+_FIELDS_LOCK = threading.Lock()
+
+
+# 카탈로그가 항상 로드하는 가벼운 컬럼 (조회/색인/목록 응답에 필요한 값)
+BASE_COLUMNS: Tuple[str, ...] = (
+    "major_id",
+    "major_name",
+    "salary",
+    "employment",
+    "employment_rate",
+    "acceptance_rate",
+)
+
+# get_major_career_info(specific_field)별로 필요한 최소 컬럼 집합
+FIELD_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "jobs": ("job", "enter_field"),
+    "stats": ("chart_data",),  # 성비/만족도는 chart_data에서 추출, 나머지는 BASE_COLUMNS
+    "academics": ("career_act", "qualifications", "main_subject"),
+}
+FIELD_GROUPS["all"] = tuple(
+    column for group in ("jobs", "stats", "academics") for column in FIELD_GROUPS[group]
+)
+
+# LONGTEXT에 JSON 문자열로 저장된 컬럼
+_JSON_COLUMNS = {
+    "relate_subject",
+    "enter_field",
+    "department_aliases",
+    "career_act",
+    "main_subject",
+    "university",
+    "chart_data",
+}
+# None 대신 빈 문자열을 기본값으로 쓰는 텍스트 컬럼 (MajorRecord 타입에 맞춤)
+_TEXT_COLUMNS = {"summary", "interest", "property", "job"}
+
+
+def _apply_columns(record: MajorRecord, values: Dict[str, Any]) -> None:
+    """
+    DB 컬럼 값을 디코딩하여 MajorRecord 속성에 채웁니다.
+
+    chart_data는 파싱하면서 성비(gender)/만족도(satisfaction)도 함께 추출합니다.
+    """
+    for column, value in values.items():
+        if column in _JSON_COLUMNS:
+            decoded = json.loads(value) if value else None
+            if column == "department_aliases":
+                decoded = decoded or []
+            setattr(record, column, decoded)
+            if column == "chart_data" and decoded and isinstance(decoded, list):
+                stats_block = decoded[0]
+                if isinstance(stats_block, dict):
+                    record.gender = stats_block.get("gender")
+                    record.satisfaction = stats_block.get("satisfaction")
+        elif column in _TEXT_COLUMNS:
+            setattr(record, column, value or "")
+        elif column == "raw_data":
+            record.raw = json.loads(value) if value else {}
+        else:
+            setattr(record, column, value)
+
+
+def convert_major_row(row: Major, columns: Optional[Iterable[str]] = None) -> MajorRecord:
+    """
+    DB 모델 객체를 MajorRecord 데이터클래스로 변환합니다.
+
+    Args:
+        row: majors 테이블 ORM 객체
+        columns: 디코딩할 컬럼 이름 목록. None이면 raw_data를 제외한 전체 컬럼.
+            지연 로딩(defer)된 컬럼에 접근하면 행마다 추가 쿼리가 발생하므로
+            쿼리의 load_only 목록과 같은 값을 넘겨야 합니다.
+            로드하지 않은 컬럼은 ensure_fields()로 필요할 때 채웁니다.
+    """
+    if columns is None:
+        columns = [c for c in Major.__table__.columns.keys() if c not in ("id", "raw_data")]
+    columns = list(columns)
+
+    record = MajorRecord(
+        major_id=row.major_id,
+        major_name=row.major_name,
+        cluster=None,
+        summary="",
+        interest="",
+        property="",
+        relate_subject=None,
+        job="",
+        enter_field=None,
+        salary=None,
+    )
+    _apply_columns(record, {column: getattr(row, column) for column in columns})
+    record.loaded_columns = frozenset(columns)
+    return record
+
+
+def ensure_fields(record: MajorRecord, specific_field: str = "all") -> MajorRecord:
+    """
+    specific_field 그룹에 필요한 컬럼이 아직 로드되지 않았다면 해당 컬럼만 조회하여 채웁니다.
+
+    카탈로그 레코드는 가벼운 컬럼만 가지고 시작하며, 무거운 LONGTEXT 컬럼은
+    get_major_career_info가 실제로 요청한 그룹만 major_id 한 건 조회로 가져와 파싱합니다.
+    한 번 채운 컬럼은 레코드에 남으므로 같은 전공을 다시 조회하면 쿼리가 발생하지 않습니다.
+    """
+    loaded = getattr(record, "loaded_columns", None)
+    if loaded is None:
+        # JSON 파일 등에서 만든 레코드는 이미 모든 값을 가지고 있음
+        return record
+
+    wanted = FIELD_GROUPS.get(specific_field, ())
+    if all(column in loaded for column in wanted):
+        return record
+
+    # DB 왕복 동안 다른 전공의 조회를 막지 않도록 락 없이 조회
+    # (같은 레코드를 동시에 조회하면 쿼리가 중복될 수 있지만 결과는 같음)
+    missing = [column for column in wanted if column not in loaded]
+    session = SessionLocal()
+    try:
+        row = session.execute(
+            select(*[getattr(Major, column) for column in missing]).where(
+                Major.major_id == record.major_id
+            )
+        ).first()
+    finally:
+        session.close()
+
+    with _FIELDS_LOCK:
+        # 그사이 다른 스레드가 채운 컬럼은 다시 파싱하지 않음
+        fetched = [column for column in missing if column not in record.loaded_columns]
+        if row is not None and fetched:
+            values = dict(zip(missing, row))
+            _apply_columns(record, {column: values[column] for column in fetched})
+        record.loaded_columns = record.loaded_columns | frozenset(missing)
+    return record
+
+
+def _load_offerings(session) -> Optional[List[UniversityOffering]]:
+    """
+    university_major_offerings ⋈ majors 조인으로 개설 정보를 읽어옵니다.
+
+    테이블이 없거나 비어 있으면 None을 반환하여 JSON 폴백을 사용하게 합니다.
+    """
+    offering = UniversityMajorOffering
+    try:
+        rows = session.execute(
+            select(
+                offering.major_id,
+                offering.school,
+                offering.department,
+                offering.campus,
+                offering.area,
+                offering.url,
+                Major.major_name,
+            )
+            .join(Major, Major.major_id == offering.major_id)
+            .order_by(Major.id, offering.id)
+        ).all()
+    except SQLAlchemyError as e:
+        session.rollback()
+        print(f"⚠️ university_major_offerings unavailable, parsing JSON instead: {e}")
+        return None
+
+    if not rows:
+        return None
+
+    return [
+        UniversityOffering(
+            university=row.school,
+            department=row.department,
+            campus=row.campus or "",
+            area=row.area or "",
+            url=row.url or "",
+            major_id=row.major_id,
+            standard_major_name=row.major_name,
+        )
+        for row in rows
+    ]
+
+
+class MajorCatalog:
+    """
+    파싱이 끝난 MajorRecord 전체와 조회용 인덱스를 보관하는 읽기 전용 카탈로그.
+    """
+
+    def __init__(
+        self,
+        records: List[MajorRecord],
+        version: Optional[int] = None,
+        universities: Optional[UniversityIndex] = None,
+        alias_map: Optional[Dict[str, str]] = None,
+    ):
+        self.records = records
+        self.version = version
+        self.loaded_at = time.time()
+
+        self.by_id: Dict[str, MajorRecord] = {}
+        self.by_name: Dict[str, MajorRecord] = {}
+        self.by_alias: Dict[str, MajorRecord] = {}
+
+        # DB의 .first()와 같은 결과가 나오도록 먼저 로드된(id가 작은) 레코드를 우선
+        for record in records:
+            self.by_id.setdefault(record.major_id, record)
+            if record.major_name:
+                self.by_name.setdefault(record.major_name, record)
+
+        if alias_map is not None:
+            # major_aliases 테이블: {정규화된 별칭: major_id}
+            for alias_key, major_id in alias_map.items():
+                record = self.by_id.get(major_id)
+                if record is not None:
+                    self.by_alias[alias_key] = record
+        else:
+            for record in records:
+                for alias in record.department_aliases or []:
+                    if isinstance(alias, str) and alias.strip():
+                        self.by_alias.setdefault(normalize_alias(alias), record)
+
+        # 대학 개설 정보는 로드 시 한 번만 색인 (정규화 테이블이 없으면 JSON을 펼쳐서 생성)
+        self.universities = universities or UniversityIndex.build(records)
+
+    @classmethod
+    def load(cls, version: Optional[int] = None) -> "MajorCatalog":
+        """majors 테이블 전체를 읽어 카탈로그를 생성합니다. (가벼운 컬럼만 로드)"""
+        started = time.perf_counter()
+        session = SessionLocal()
+        try:
+            offerings = _load_offerings(session)
+            alias_map = load_alias_map(session)
+
+            # 상세 LONGTEXT 컬럼은 로드하지 않고 ensure_fields()로 필요할 때만 조회
+            columns = list(BASE_COLUMNS)
+            if alias_map is None:
+                columns.append("department_aliases")
+            if offerings is None:
+                # 정규화 테이블이 없을 때만 university JSON을 읽어 색인을 만듦
+                columns.append("university")
+
+            rows = (
+                session.query(Major)
+                .options(load_only(*[getattr(Major, column) for column in columns]))
+                .order_by(Major.id)
+                .all()
+            )
+            records = [convert_major_row(row, columns) for row in rows]
+        finally:
+            session.close()
+
+        universities = (
+            UniversityIndex.from_offerings(offerings) if offerings is not None else None
+        )
+        catalog = cls(
+            records, version=version, universities=universities, alias_map=alias_map
+        )
+        print(
+            f"✅ Major catalog loaded: {len(records)} majors, "
+            f"{len(catalog.by_alias)} aliases, {len(catalog.universities)} universities "
+            f"({time.perf_counter() - started:.2f}s)"
+        )
+        return catalog
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, major_id: str) -> Optional[MajorRecord]:
+        return self.by_id.get(major_id)
+
+    def get_many(self, major_ids: List[str]) -> List[MajorRecord]:
+        """major_id 순서를 유지하며 존재하는 레코드만 반환합니다."""
+        return [self.by_id[mid] for mid in major_ids if mid in self.by_id]
+
+    def lookup(self, name: str) -> Optional[MajorRecord]:
+        """전공명 정확 일치 → 별칭(정규화) 일치 순서로 검색합니다."""
+        key = (name or "").strip()
+        if not key:
+            return None
+        return self.by_name.get(key) or self.by_alias.get(normalize_alias(key))
+
+    def lookup_many(self, names: List[str]) -> List[MajorRecord]:
+        """
+        여러 이름/별칭을 한 번에 해석합니다. (입력 순서 유지, 같은 전공은 한 번만)
+        """
+        resolved: List[MajorRecord] = []
+        seen: set[str] = set()
+        for name in names:
+            record = self.lookup(name)
+            if record is not None and record.major_id not in seen:
+                seen.add(record.major_id)
+                resolved.append(record)
+        return resolved
+
+    def filter_by_token(self, token: str, limit: Optional[int] = None) -> List[MajorRecord]:
+        """전공명에 토큰이 포함된 레코드를 반환합니다. (MySQL LIKE와 같이 대소문자 무시)"""
+        needle = (token or "").strip().lower()
+        if not needle:
+            return []
+
+        matches: List[MajorRecord] = []
+        for record in self.records:
+            if needle in (record.major_name or "").lower():
+                matches.append(record)
+                if limit and len(matches) >= limit:
+                    break
+        return matches
+
+    def sorted_by_name(self) -> List[MajorRecord]:
+        return sorted(
+            (record for record in self.records if record.major_name),
+            key=lambda record: record.major_name,
+        )
+
+
+# ==================== 프로세스 전역 카탈로그 ====================
+
+_CATALOG: Optional[MajorCatalog] = None
+_CATALOG_LOCK = threading.Lock()  # 참조 교체와 갱신 상태만 보호 (DB 조회/로드 중에는 잡지 않음)
+_INITIAL_LOAD_LOCK = threading.Lock()  # 카탈로그가 아직 없을 때의 최초 로드를 한 스레드로 제한
+_LAST_VERSION_CHECK = 0.0
+_REFRESHING = False  # 버전 확인/재로드를 수행 중인 스레드가 있는지
+
+
+def get_major_catalog() -> MajorCatalog:
+    """
+    프로세스 전역 MajorCatalog를 반환합니다. (Lazy Loading)
+
+    MAJOR_CATALOG_REFRESH_SECONDS 간격으로 data_versions의 버전만 확인하며,
+    버전이 바뀐 경우에만 전체를 다시 로드합니다. 0이면 자동 갱신을 하지 않습니다.
+    버전 확인/재로드는 한 스레드만 락 밖에서 수행하고, 그동안 다른 호출은 기존 카탈로그를 받습니다.
+    """
+    catalog = _fresh_catalog()
+    if catalog is not None:
+        return catalog
+    if _CATALOG is None:
+        return _load_initial_catalog()
+    return _refresh_catalog()
+
+
+def _load_initial_catalog() -> MajorCatalog:
+    # 돌려줄 카탈로그가 없으므로 최초 로드는 기다리되, 로드는 한 번만 수행
+    global _CATALOG, _LAST_VERSION_CHECK
+    with _INITIAL_LOAD_LOCK:
+        catalog = _CATALOG
+        if catalog is not None:
+            return catalog
+        catalog = MajorCatalog.load(get_data_version(MAJORS_DATASET))
+        with _CATALOG_LOCK:
+            _CATALOG = catalog
+            _LAST_VERSION_CHECK = time.monotonic()
+        return catalog
+
+
+def _refresh_catalog() -> MajorCatalog:
+    global _CATALOG, _LAST_VERSION_CHECK, _REFRESHING
+    with _CATALOG_LOCK:
+        current = _CATALOG
+        if current is not None and (_REFRESHING or _is_fresh()):
+            # 다른 스레드가 갱신 중이거나 방금 확인했으면 현재 카탈로그로 응답
+            return current
+        if current is not None:
+            _REFRESHING = True
+            _LAST_VERSION_CHECK = time.monotonic()
+    if current is None:
+        # 확인 사이에 invalidate_major_catalog()가 호출된 경우
+        return _load_initial_catalog()
+
+    try:
+        version = get_data_version(MAJORS_DATASET)
+        if version is None or version == current.version:
+            return current
+        print(f"🔄 Major data changed (v{current.version} → v{version}), reloading")
+        try:
+            catalog = MajorCatalog.load(version)
+        except Exception as e:
+            # 재로딩 실패 시 기존 카탈로그로 계속 서비스
+            print(f"⚠️ Major catalog reload failed: {e}")
+            return current
+        with _CATALOG_LOCK:
+            # 로드 중에 invalidate_major_catalog()가 호출되었으면 다음 호출이 새로 로드하도록 둠
+            if _CATALOG is current:
+                _CATALOG = catalog
+        return catalog
+    finally:
+        with _CATALOG_LOCK:
+            _REFRESHING = False
+
+
+def _is_fresh() -> bool:
+    interval = get_settings().major_catalog_refresh_seconds
+    return interval <= 0 or time.monotonic() - _LAST_VERSION_CHECK < interval
+
+
+def _fresh_catalog() -> Optional[MajorCatalog]:
+    # 버전 확인 주기 안이면 현재 카탈로그 (I/O 없음), 로드/버전 확인이 필요하면 None
+    catalog = _CATALOG
+    if catalog is not None and _is_fresh():
+        return catalog
+    return None
+
+
+async def aget_major_catalog() -> MajorCatalog:
+    """
+    get_major_catalog의 비동기 버전.
+
+    최초 로드/버전 확인(MySQL)이 필요할 때만 스레드에서 실행하므로, 비동기 툴은 카탈로그를 쓰기 전에
+    이 함수를 await 하면 이후 같은 흐름의 get_major_catalog()는 이벤트 루프에서 I/O 없이 반환됩니다.
+    """
+    catalog = _fresh_catalog()
+    if catalog is not None:
+        return catalog
+    return await asyncio.to_thread(get_major_catalog)
+
+
+def invalidate_major_catalog() -> None:
+    """다음 호출 시 카탈로그를 강제로 다시 로드하도록 캐시를 비웁니다."""
+    global _CATALOG, _LAST_VERSION_CHECK
+    with _CATALOG_LOCK:
+        _CATALOG = None
+        _LAST_VERSION_CHECK = 0.0
@@ -0,0 +1,121 @@
+"""
+온보딩 전공 추천 결과 캐시 모듈
+
+run_major_recommendation은 제출마다 프로필 텍스트 임베딩 → 상위 50개 벡터 검색 → 집계/요약을
+다시 실행하지만, 온보딩은 객관식 답변이 많아 같은 답변 조합이 자주 반복됩니다.
+정규화된 온보딩 답변(canonicalize_onboarding_answers)을 키로 추천 결과를 저장해 두고 재사용합니다.
+
+** 캐시 키 **
+(임베딩 제공자, 모델명, 추천 방식, 채점 버전, doc_type 가중치, 정규화된 답변, 데이터 버전)을 해싱합니다.
+majors / vector_index 버전이 바뀌면(시드, 인덱스 동기화) 키가 달라지므로 이전 결과는 사용되지 않습니다.
+RECOMMENDATION_ENGINE(exact/vector)이나 가중치가 바뀌어도 다른 키가 되어, 다른 방식으로 채점한 결과를 재사용하지 않습니다.
+데이터 버전을 확인할 수 없으면 캐시를 사용하지 않습니다.
+
+저장소는 kv_cache.TTLCache(메모리 LRU + SQLite)이며 RECOMMENDATION_CACHE_MAX_ENTRIES로 크기를 제한합니다.
+"""
+
+# backend/rag/recommendation_cache.py
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional
+
+from backend.config import get_settings, resolve_path
+from backend.db.data_version import MAJORS_DATASET, VECTOR_INDEX_DATASET
+from .kv_cache import TTLCache, open_ttl_cache
+from .tool_cache import get_cached_data_versions
+
+# 추천 결과가 의존하는 데이터셋 (전공 데이터 + 전공 벡터 인덱스)
+RECOMMENDATION_DATASETS = (MAJORS_DATASET, VECTOR_INDEX_DATASET)
+
+# 채점/집계 로직(aggregate_major_scores, RecommendationEngine 등)을 바꾸면 올려서 이전 결과를 무효화
+RECOMMENDATION_SCORING_VERSION = 1
+
+_RECOMMENDATION_CACHE: Optional[TTLCache] = None
+_RECOMMENDATION_CACHE_LOCK = threading.Lock()
+
+
+def _get_cache() -> Optional[TTLCache]:
+    global _RECOMMENDATION_CACHE
+    settings = get_settings()
+    if not settings.recommendation_cache_enabled:
+        return None
+    with _RECOMMENDATION_CACHE_LOCK:
+        if _RECOMMENDATION_CACHE is None:
+            _RECOMMENDATION_CACHE = open_ttl_cache(
+                "recommendations",
+                resolve_path(settings.cache_dir),
+                max_entries=settings.recommendation_cache_max_entries,
+                memory_size=256,
+            )
+        return _RECOMMENDATION_CACHE
+
+
+def recommendation_cache_key(
+    canonical_answers: Dict[str, str], doc_weights: Dict[str, float]
+) -> Optional[str]:
+    """
+    정규화된 온보딩 답변의 캐시 키를 반환합니다.
+
+    doc_weights는 채점에 사용하는 doc_type별 가중치(MAJOR_DOC_WEIGHTS)입니다.
+    캐시가 비활성화되었거나 데이터 버전을 확인할 수 없으면 None (캐시 사용 안 함).
+    """
+    if _get_cache() is None or not canonical_answers:
+        return None
+    versions = get_cached_data_versions(RECOMMENDATION_DATASETS)
+    if versions is None:
+        return None
+
+    settings = get_settings()
+    payload = json.dumps(
+        [
+            settings.embedding_provider,
+            settings.embedding_model_name,
+            settings.recommendation_engine.lower(),
+            RECOMMENDATION_SCORING_VERSION,
+            doc_weights,
+            canonical_answers,
+            versions,
+        ],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_cached_recommendation(key: Optional[str]) -> Optional[Dict[str, Any]]:
+    cache = _get_cache()
+    if cache is None or key is None:
+        return None
+    hit, value = cache.get(key)
+    if not hit or value is None:
+        return None
+    print(f"💾 [Recommendation] 캐시 적중 (hit rate: {cache.stats.hit_rate:.0%})")
+    # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 JSON 문자열에서 복원
+    return json.loads(value)
+
+
+def store_recommendation(key: Optional[str], result: Dict[str, Any]) -> None:
+    cache = _get_cache()
+    if cache is None or key is None or not result.get("recommended_majors"):
+        return
+    try:
+        payload = json.dumps(result, ensure_ascii=False, default=str)
+    except (TypeError, ValueError) as e:
+        print(f"⚠️ [Recommendation] result is not cacheable: {e}")
+        return
+    cache.set(key, payload, get_settings().recommendation_cache_ttl_seconds)
+
+
+def get_recommendation_cache_stats() -> Dict[str, Any]:
+    """추천 결과 캐시 적중률 (모니터링용)"""
+    cache = _RECOMMENDATION_CACHE
+    return cache.stats.as_dict() if cache is not None else {}
+
+
+def clear_recommendation_cache() -> None:
+    cache = _get_cache()
+    if cache is not None:
+        cache.clear()
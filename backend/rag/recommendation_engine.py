@@ -0,0 +1,352 @@
+"""
+전체 코퍼스 정확(Exact) 전공 추천 엔진
+
+recommend_majors_node는 Pinecone에서 상위 50개 문서만 가져와 전공별 doc_type 최고 점수를 합산했기 때문에,
+다섯 가지 doc_type이 모두 51위 밖인 전공은 아무리 종합 점수가 높아도 추천에 나타날 수 없었습니다.
+이 엔진은 전공 네임스페이스의 모든 문서 벡터를 메모리에 올려 두고, 프로필 임베딩과 전체 문서의
+코사인 유사도를 한 번의 행렬 곱으로 계산한 뒤 가중치 벡터를 곱해 정확한 Top-N을 구합니다.
+
+** 점수 계산 **
+1. 문서 점수: (배치 × 문서) = 프로필 행렬 @ 문서 행렬ᵀ
+2. 전공 × doc_type 최고 점수: 문서를 (전공, doc_type) 슬롯으로 모아 최댓값 (없는 슬롯은 0점)
+3. 전공 점수: (배치 × 전공 × doc_type) @ 가중치 벡터  (aggregate_major_scores와 같은 가중 합)
+
+** 코퍼스 **
+- VECTOR_BACKEND=local: LocalVectorStore 스냅샷 행렬을 그대로 사용
+- VECTOR_BACKEND=pinecone: 네임스페이스의 벡터를 한 번 내려받아(export_vector_snapshot.fetch_namespace) 보관
+vector_index 데이터 버전이 바뀌면(인덱싱/동기화) 다음 요청에서 다시 로드합니다.
+"""
+
+# backend/rag/recommendation_engine.py
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from backend.config import get_settings
+from backend.db.data_version import VECTOR_INDEX_DATASET
+from .local_vectorstore import _normalize_rows
+from .tool_cache import get_cached_data_versions
+
+# 추천 결과의 sample_docs 최대 개수 (_summarize_major_hits와 동일)
+SAMPLE_DOCS_PER_MAJOR = 3
+
+
+class RecommendationEngine:
+    """
+    전공 문서 벡터 전체와 (전공, doc_type) 슬롯 색인을 보관하는 읽기 전용 엔진.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        matrix: np.ndarray,
+        texts: Sequence[str],
+        metadatas: Sequence[Dict[str, Any]],
+        version: Optional[int] = None,
+    ):
+        rows = [row for row, metadata in enumerate(metadatas) if metadata.get("major_id")]
+        if not rows:
+            raise ValueError("major namespace has no documents with major_id")
+
+        self.version = version
+        self.doc_ids = [ids[row] for row in rows]
+        self.texts = [texts[row] or "" for row in rows]
+        self.metadatas = [dict(metadatas[row]) for row in rows]
+        self.doc_matrix = _normalize_rows(np.asarray(matrix, dtype=np.float32)[rows])
+
+        # 전공/doc_type 색인
+        self.major_ids: List[str] = []
+        self.major_names: List[str] = []
+        self.doc_types: List[str] = []
+        major_index: Dict[str, int] = {}
+        type_index: Dict[str, int] = {}
+        doc_major: List[int] = []
+        doc_type: List[int] = []
+        for metadata in self.metadatas:
+            major_id = metadata["major_id"]
+            if major_id not in major_index:
+                major_index[major_id] = len(self.major_ids)
+                self.major_ids.append(major_id)
+                self.major_names.append(metadata.get("major_name") or "")
+            type_name = metadata.get("doc_type") or "unknown"
+            if type_name not in type_index:
+                type_index[type_name] = len(self.doc_types)
+                self.doc_types.append(type_name)
+            doc_major.append(major_index[major_id])
+            doc_type.append(type_index[type_name])
+
+        self.doc_major = np.asarray(doc_major, dtype=np.int64)
+        self.doc_type = np.asarray(doc_type, dtype=np.int64)
+        self.slots = self.doc_major * len(self.doc_types) + self.doc_type
+
+        # 전공별 문서 행 / 같은 이름의 전공 묶음 (major_id가 달라도 이름이 같으면 한 항목으로 병합)
+        self.docs_by_major: List[List[int]] = [[] for _ in self.major_ids]
+        for row, major in enumerate(doc_major):
+            self.docs_by_major[major].append(row)
+        self.majors_by_name: Dict[str, List[int]] = {}
+        for major, name in enumerate(self.major_names):
+            self.majors_by_name.setdefault(name, []).append(major)
+
+    def __len__(self) -> int:
+        return len(self.major_ids)
+
+    @classmethod
+    def load(cls, version: Optional[int] = None) -> "RecommendationEngine":
+        """현재 벡터 백엔드의 전공 네임스페이스 전체로 엔진을 생성합니다."""
+        from .vectorstore import (
+            _get_major_namespace,
+            _use_local_backend,
+            get_major_index,
+            get_major_vectorstore,
+        )
+
+        started = time.perf_counter()
+        if _use_local_backend():
+            ids, matrix, texts, metadatas = get_major_vectorstore().snapshot()
+        else:
+            from .export_vector_snapshot import fetch_namespace
+
+            ids, vectors, texts, metadatas = fetch_namespace(
+                get_major_index(), _get_major_namespace()
+            )
+            matrix = np.asarray(vectors, dtype=np.float32)
+
+        engine = cls(ids, matrix, texts, metadatas, version=version)
+        print(
+            f"✅ Recommendation engine loaded: {len(engine)} majors, "
+            f"{len(engine.doc_ids)} docs, {len(engine.doc_types)} doc types "
+            f"({time.perf_counter() - started:.2f}s)"
+        )
+        return engine
+
+    # ==================== 점수 계산 ====================
+
+    def _weight_vector(self, doc_type_weights: Dict[str, float]) -> np.ndarray:
+        return np.asarray(
+            [doc_type_weights.get(name, 1.0) for name in self.doc_types], dtype=np.float32
+        )
+
+    def score(self, profile_embeddings: np.ndarray, doc_type_weights: Dict[str, float]):
+        """
+        프로필 임베딩 배치(B × d)의 점수를 계산합니다.
+
+        Returns:
+            (doc_scores (B × 문서), slot_scores (B × 전공 × doc_type, 없는 슬롯은 NaN),
+             major_scores (B × 전공))
+        """
+        profiles = _normalize_rows(np.atleast_2d(np.asarray(profile_embeddings, dtype=np.float32)))
+        batch = profiles.shape[0]
+        doc_scores = profiles @ self.doc_matrix.T
+
+        # 같은 (전공, doc_type) 슬롯에 문서가 여러 개면 최고 점수만 사용
+        slot_scores = np.full(
+            (batch, len(self.major_ids) * len(self.doc_types)), -np.inf, dtype=np.float32
+        )
+        np.maximum.at(
+            slot_scores, (np.arange(batch)[:, None], self.slots[None, :]), doc_scores
+        )
+        slot_scores = slot_scores.reshape(batch, len(self.major_ids), len(self.doc_types))
+        present = np.isfinite(slot_scores)
+
+        major_scores = np.where(present, slot_scores, 0.0) @ self._weight_vector(
+            doc_type_weights
+        )
+        return doc_scores, np.where(present, slot_scores, np.nan), major_scores
+
+    # ==================== 결과 구성 ====================
+
+    def _summarize(
+        self,
+        doc_scores: np.ndarray,
+        slot_scores: np.ndarray,
+        major_scores: np.ndarray,
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        # 점수 내림차순으로 같은 이름을 건너뛰며 limit개 선택 (전공 수가 수백 개라 전체 정렬도 충분히 빠름)
+        recommended: List[Dict[str, Any]] = []
+        seen_names: set[str] = set()
+        for major in np.argsort(-major_scores, kind="stable"):
+            name = self.major_names[major]
+            if name in seen_names:
+                continue
+            seen_names.add(name)
+
+            group = self.majors_by_name.get(name, [int(major)])
+            doc_rows = sorted(
+                (row for member in group for row in self.docs_by_major[member]),
+                key=lambda row: doc_scores[row],
+                reverse=True,
+            )
+            first = self.metadatas[self.docs_by_major[major][0]]
+
+            top_doc_types: Dict[str, float] = {}
+            for member in group:
+                for type_idx, type_name in enumerate(self.doc_types):
+                    value = slot_scores[member, type_idx]
+                    if not np.isnan(value):
+                        top_doc_types[type_name] = max(
+                            top_doc_types.get(type_name, -np.inf), float(value)
+                        )
+
+            relate_subject_tags: List[str] = []
+            job_tags: List[str] = []
+            summary = ""
+            for row in doc_rows:
+                metadata = self.metadatas[row]
+                for tag in metadata.get("relate_subject_tags") or []:
+                    if tag not in relate_subject_tags:
+                        relate_subject_tags.append(tag)
+                for tag in metadata.get("job_tags") or []:
+                    if tag not in job_tags:
+                        job_tags.append(tag)
+                if not summary and metadata.get("doc_type") == "summary":
+                    summary = self.texts[row]
+
+            recommended.append(
+                {
+                    "major_id": self.major_ids[major],
+                    "major_name": name,
+                    "cluster": first.get("cluster"),
+                    "salary": first.get("salary"),
+                    "score": float(major_scores[major]),
+                    "top_doc_types": sorted(
+                        top_doc_types.items(), key=lambda item: item[1], reverse=True
+                    ),
+                    "sample_docs": [
+                        {
+                            "doc_type": self.metadatas[row].get("doc_type") or "unknown",
+                            "score": float(doc_scores[row]),
+                            "text": self.texts[row],
+                        }
+                        for row in doc_rows[:SAMPLE_DOCS_PER_MAJOR]
+                    ],
+                    "relate_subject_tags": relate_subject_tags,
+                    "job_tags": job_tags,
+                    "summary": summary,
+                }
+            )
+            if len(recommended) >= limit:
+                break
+        return recommended
+
+    def _top_rows(self, scores: np.ndarray, k: int) -> np.ndarray:
+        k = min(k, scores.shape[0])
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64)
+        top = np.argpartition(-scores, k - 1)[:k]
+        return top[np.argsort(-scores[top], kind="stable")]
+
+    def recommend_many(
+        self,
+        profile_embeddings: np.ndarray,
+        doc_type_weights: Dict[str, float],
+        limit: int = 10,
+        hits_limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        프로필 임베딩 배치 각각에 대해 recommend_majors_node와 같은 형태의 결과를 반환합니다.
+
+        Returns:
+            [{"recommended_majors", "major_scores", "major_search_hits"}, ...]
+            - major_scores: 점수 상위 hits_limit개 전공의 가중 합산 점수
+            - major_search_hits: 점수 상위 hits_limit개 문서 (디버깅용)
+        """
+        doc_scores, slot_scores, major_scores = self.score(
+            profile_embeddings, doc_type_weights
+        )
+        results: List[Dict[str, Any]] = []
+        for index in range(doc_scores.shape[0]):
+            top_majors = self._top_rows(major_scores[index], hits_limit)
+            top_docs = self._top_rows(doc_scores[index], hits_limit)
+            results.append(
+                {
+                    "recommended_majors": self._summarize(
+                        doc_scores[index], slot_scores[index], major_scores[index], limit
+                    ),
+                    "major_scores": {
+                        self.major_ids[major]: float(major_scores[index, major])
+                        for major in top_majors
+                    },
+                    "major_search_hits": [
+                        {
+                            "doc_id": self.doc_ids[row],
+                            "major_id": self.metadatas[row]["major_id"],
+                            "major_name": self.metadatas[row].get("major_name") or "",
+                            "doc_type": self.metadatas[row].get("doc_type") or "unknown",
+                            "score": float(doc_scores[index, row]),
+                            "metadata": self.metadatas[row],
+                        }
+                        for row in top_docs
+                    ],
+                }
+            )
+        return results
+
+    def recommend(
+        self,
+        profile_embedding: Sequence[float],
+        doc_type_weights: Dict[str, float],
+        limit: int = 10,
+        hits_limit: int = 50,
+    ) -> Dict[str, Any]:
+        return self.recommend_many(
+            np.asarray([profile_embedding], dtype=np.float32),
+            doc_type_weights,
+            limit=limit,
+            hits_limit=hits_limit,
+        )[0]
+
+
+# ==================== 프로세스 전역 엔진 ====================
+
+_ENGINE: Optional[RecommendationEngine] = None
+_ENGINE_LOCK = threading.Lock()
+# 로드에 실패한 벡터 인덱스 버전 (같은 버전에서 매 요청 재시도하지 않도록)
+_NOT_FAILED = object()
+_FAILED_VERSION: Any = _NOT_FAILED
+
+
+def get_recommendation_engine() -> Optional[RecommendationEngine]:
+    """
+    프로세스 전역 RecommendationEngine을 반환합니다.
+
+    RECOMMENDATION_ENGINE=vector이거나 코퍼스를 불러올 수 없으면 None을 반환하며,
+    이때 호출자는 기존 Top-K 벡터 검색 경로를 사용합니다.
+    """
+    global _ENGINE, _FAILED_VERSION
+    if get_settings().recommendation_engine.lower() != "exact":
+        return None
+
+    versions = get_cached_data_versions((VECTOR_INDEX_DATASET,))
+    version = versions.get(VECTOR_INDEX_DATASET) if versions else None
+
+    engine = _ENGINE
+    if engine is not None and (version is None or version == engine.version):
+        return engine
+
+    with _ENGINE_LOCK:
+        if _ENGINE is not None and (version is None or version == _ENGINE.version):
+            return _ENGINE
+        if _FAILED_VERSION is not _NOT_FAILED and _FAILED_VERSION == version:
+            return _ENGINE
+
+        try:
+            _ENGINE = RecommendationEngine.load(version)
+            _FAILED_VERSION = _NOT_FAILED
+        except Exception as e:
+            # 로드 실패 시 기존 엔진(없으면 벡터 검색 경로)으로 계속 서비스
+            print(f"⚠️ Recommendation engine load failed: {e}")
+            _FAILED_VERSION = version
+        return _ENGINE
+
+
+def reset_recommendation_engine() -> None:
+    """다음 호출 시 엔진을 다시 로드하도록 비웁니다."""
+    global _ENGINE, _FAILED_VERSION
+    with _ENGINE_LOCK:
+        _ENGINE = None
+        _FAILED_VERSION = _NOT_FAILED
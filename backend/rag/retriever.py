@@ -18,7 +18,11 @@
 from dataclasses import dataclass
 from typing import Dict, List, Any
 
-from .vectorstore import get_major_vectorstore
+from .vectorstore import (
+    _get_major_namespace,
+    asimilarity_search_by_vector_with_score,
+    get_major_vectorstore,
+)
 
 
 # Pinecone 검색 결과를 일관된 구조로 다루기 위한 헬퍼 데이터클래스
@@ -61,6 +65,22 @@ def search_major_docs(
             k=top_k,
         )
 
+    return _to_search_hits(results)
+
+
+async def asearch_major_docs(
+    query_embedding: List[float],
+    top_k: int = 150,
+) -> List[SearchHit]:
+    """search_major_docs의 비동기 버전 (이벤트 루프별 Pinecone asyncio 인덱스 / 로컬 스냅샷)"""
+    results = await asimilarity_search_by_vector_with_score(
+        _get_major_namespace(), query_embedding, k=top_k
+    )
+    return _to_search_hits(results)
+
+
+def _to_search_hits(results) -> List[SearchHit]:
+    """(Document, score) 목록을 SearchHit 목록으로 변환하고 상위 결과를 로그로 남깁니다."""
     hits: List[SearchHit] = []
     for doc, score in results:
         # LangChain이 반환한 Document/score 튜플을 SearchHit로 래핑
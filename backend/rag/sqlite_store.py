@@ -0,0 +1,84 @@
+"""
+SQLite 디스크 캐시 공통 모듈
+
+임베딩 캐시(embedding_cache.py), TTL 키-값 캐시(kv_cache.py), 답변 캐시(answer_cache.py)가
+같은 방식으로 SQLite 파일을 여는 부분을 모아 둔 기반 클래스입니다.
+
+** 연결 방식 **
+- 여러 gunicorn 워커가 같은 파일을 공유할 수 있도록 WAL 모드(synchronous=NORMAL)를 사용합니다.
+- 프로세스 안에서는 연결 하나를 락(_lock)으로 보호하여 스레드 간에 공유합니다.
+- fork된 워커는 reopen_all_stores()로 부모에게서 물려받은 연결 대신 새 연결을 엽니다.
+"""
+
+# backend/rag/sqlite_store.py
+from __future__ import annotations
+
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+from typing import List, Tuple
+
+# 현재 프로세스에서 열린 저장소 (fork 후 reopen_all_stores()가 연결을 교체할 대상)
+_OPEN_STORES: "weakref.WeakSet[SQLiteStore]" = weakref.WeakSet()
+
+
+class SQLiteStore:
+    """
+    WAL 모드 SQLite 파일 하나를 사용하는 디스크 캐시의 기반 클래스.
+
+    하위 클래스는 TABLE(항목 수를 세는 테이블)과 SCHEMA(CREATE 문 목록)를 정의합니다.
+    last_access 컬럼이 있는 테이블은 _evict_least_recent()로 오래된 항목부터 정리할 수 있습니다.
+    """
+
+    TABLE: str = ""
+    SCHEMA: Tuple[str, ...] = ()
+
+    def __init__(self, path: Path, max_entries: int):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # fork 이전(gunicorn master)에 열었던 연결. 자식 프로세스에서 닫으면 부모 쪽 WAL 상태를
+        # 건드릴 수 있으므로 reopen() 후에도 닫지 않고 참조만 유지합니다.
+        self._inherited_conns: List[sqlite3.Connection] = []
+        self._conn = self._connect()
+        for statement in self.SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+        self._count = self._conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+        self.evictions = 0
+        _OPEN_STORES.add(self)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def reopen(self) -> None:
+        """fork된 워커에서 호출: 부모 프로세스와 공유하던 연결 대신 새 연결을 엽니다."""
+        with self._lock:
+            self._inherited_conns.append(self._conn)
+            self._conn = self._connect()
+
+    def _evict_least_recent(self, overflow: int) -> None:
+        """마지막 접근 시각이 오래된 항목부터 overflow개 삭제합니다. (호출자가 락을 잡고 있어야 함)"""
+        if overflow <= 0:
+            return
+        self._conn.execute(
+            f"DELETE FROM {self.TABLE} WHERE key IN ("
+            f"SELECT key FROM {self.TABLE} ORDER BY last_access ASC LIMIT ?)",
+            (overflow,),
+        )
+        self._count -= overflow
+        self.evictions += overflow
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def reopen_all_stores() -> None:
+    """fork된 워커에서 호출: 이 프로세스에 열려 있는 모든 SQLite 저장소의 연결을 새로 엽니다."""
+    for store in list(_OPEN_STORES):
+        store.reopen()
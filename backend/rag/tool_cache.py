@@ -0,0 +1,386 @@
+"""
+툴 결과 캐시 모듈
+
+list_departments, get_major_career_info 등 @tool 함수는 인자와 데이터(DB/벡터 인덱스)가 같으면
+항상 같은 결과를 반환하므로, 결과를 2단계로 캐싱합니다.
+
+** 캐시 계층 **
+1. 실행 단위 메모 (tool_run_scope): 한 번의 그래프 실행 안에서 LLM이 같은 툴을 같은 인자로
+   다시 호출하면 즉시 반환합니다. ContextVar를 사용하므로 ToolNode 스레드에도 공유됩니다.
+2. 공유 캐시 (TTLCache, 메모리 LRU + SQLite): 요청/워커/재시작 간에 공유되며 툴별 TTL을 가집니다.
+
+** 캐시 키 **
+(툴 이름, 정규화된 인자, 툴이 의존하는 데이터셋 버전) 조합을 해싱합니다.
+시드/인제스트 스크립트가 data_versions를 갱신하면 키가 바뀌므로 이전 결과는 더 이상 사용되지 않습니다.
+데이터 버전은 MAJOR_CATALOG_REFRESH_SECONDS 주기로만 다시 조회합니다.
+
+** 공유 캐시에 저장하지 않는 결과 **
+일시적인 장애가 TTL 동안 모든 워커의 오답으로 남지 않도록 다음 결과는 실행 단위 메모에만 남깁니다.
+- "error" 키를 가진 결과 (입력 오류/검색 결과 없음처럼 데이터에 따라 정해지는 코드는 제외)
+- 툴 실행 중 mark_result_degraded()가 호출된 결과 (벡터 검색 실패를 삼킨 경우, 제한 시간 초과 등)
+- 예외로 끝난 툴 호출
+이런 결과가 하나라도 있었던 그래프 실행은 is_run_degraded()가 True를 반환하며,
+답변 캐시(answer_cache)는 그 실행의 최종 답변을 저장하지 않습니다.
+"""
+
+# backend/rag/tool_cache.py
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from backend.config import get_settings, resolve_path
+from backend.db.data_version import aget_data_versions, get_data_versions
+from .kv_cache import TTLCache, open_ttl_cache
+
+# 현재 그래프 실행에서 이미 계산한 툴 결과: 캐시 키(버전 제외) → 결과
+_TOOL_RUN_MEMO: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "tool_run_memo", default=None
+)
+
+_SHARED_CACHE: Optional[TTLCache] = None
+_SHARED_CACHE_LOCK = threading.Lock()
+
+# 데이터 버전 조회 결과 (주기적으로만 갱신)
+_VERSIONS: Dict[str, int] = {}
+_VERSIONS_CHECKED_AT = 0.0
+_VERSIONS_LOCK = threading.Lock()
+
+# 실행 단위 메모 적중 횟수 (공유 캐시 통계는 TTLCache.stats)
+_RUN_MEMO_HITS = 0
+# 공유 캐시에 저장하지 않은 결과 수 (오류/품질 저하)
+_UNCACHED_RESULTS = 0
+# 위 두 카운터 보호 (스레드 풀에서 동시에 툴이 실행되므로 += 도 락 안에서)
+_STATS_LOCK = threading.Lock()
+
+# 현재 툴 호출에서 보고된 품질 저하 사유 목록 (툴 호출마다 새 리스트)
+# 리스트 객체를 공유하므로 copy_context()로 실행한 스레드 풀 단계나 asyncio 태스크에서 추가해도 보입니다.
+_DEGRADED: ContextVar[Optional[list]] = ContextVar("tool_result_degraded", default=None)
+
+# 현재 그래프 실행(tool_run_scope)에서 공유 캐시에 저장하지 못한 툴 결과의 사유 목록
+_RUN_DEGRADED: ContextVar[Optional[list]] = ContextVar("tool_run_degraded", default=None)
+
+# 입력과 데이터만으로 정해지는 오류 코드 (같은 데이터 버전에서는 항상 같은 결과이므로 캐싱)
+_DETERMINISTIC_ERRORS = {"invalid_query", "no_results"}
+
+
+def mark_result_degraded(reason: str) -> None:
+    """
+    현재 툴 호출의 결과가 일시적인 실패로 불완전함을 표시합니다. (공유 캐시에 저장하지 않음)
+
+    외부 호출 실패를 삼키고 빈 결과로 계속 진행하는 헬퍼나, 제한 시간을 넘겨 건너뛴 단계에서 호출합니다.
+    cached_tool로 감싼 툴 실행 밖에서 호출되면 아무 일도 하지 않습니다.
+    """
+    reasons = _DEGRADED.get()
+    if reasons is not None:
+        reasons.append(reason)
+
+
+def _has_transient_error(result: Any) -> bool:
+    # {"error": ...} 또는 [{"error": ...}, ...] 형태의 오류 응답 중 데이터로 정해지지 않는 것
+    items = result if isinstance(result, list) else [result]
+    return any(
+        isinstance(item, dict)
+        and "error" in item
+        and item.get("error") not in _DETERMINISTIC_ERRORS
+        for item in items
+    )
+
+
+@contextmanager
+def tool_run_scope():
+    """
+    그래프 실행 단위 툴 결과 메모를 여는 컨텍스트 매니저.
+
+    이미 스코프가 열려 있으면 바깥 메모를 재사용합니다. (embedding_scope와 같은 방식)
+    스코프 안에서 품질 저하/일시 오류 결과가 나왔는지는 is_run_degraded()로 확인합니다.
+    """
+    memo = _TOOL_RUN_MEMO.get()
+    if memo is not None:
+        yield memo
+        return
+
+    memo = {}
+    token = _TOOL_RUN_MEMO.set(memo)
+    degraded_token = _RUN_DEGRADED.set([])
+    try:
+        yield memo
+    finally:
+        try:
+            _RUN_DEGRADED.reset(degraded_token)
+            _TOOL_RUN_MEMO.reset(token)
+        except ValueError:
+            # 스트리밍 제너레이터가 다른 컨텍스트에서 종료되는 경우
+            _RUN_DEGRADED.set(None)
+            _TOOL_RUN_MEMO.set(None)
+
+
+def is_run_degraded() -> bool:
+    """현재 그래프 실행에서 공유 캐시에 저장하지 못한 툴 결과(품질 저하/일시 오류/예외)가 있었는지 확인합니다."""
+    return bool(_RUN_DEGRADED.get())
+
+
+def _mark_run_degraded(reason: str) -> None:
+    reasons = _RUN_DEGRADED.get()
+    if reasons is not None:
+        reasons.append(reason)
+
+
+def _get_shared_cache() -> Optional[TTLCache]:
+    global _SHARED_CACHE
+    settings = get_settings()
+    if not settings.tool_cache_enabled:
+        return None
+    with _SHARED_CACHE_LOCK:
+        if _SHARED_CACHE is None:
+            _SHARED_CACHE = open_ttl_cache(
+                "tool_results",
+                resolve_path(settings.cache_dir),
+                max_entries=settings.tool_cache_max_entries,
+            )
+        return _SHARED_CACHE
+
+
+def _fresh_versions(datasets: tuple) -> Optional[Dict[str, int]]:
+    """조회 주기 안이면 마지막 버전을 반환합니다. (_VERSIONS_LOCK 보유 상태)"""
+    interval = get_settings().major_catalog_refresh_seconds
+    fresh = interval <= 0 or time.monotonic() - _VERSIONS_CHECKED_AT < interval
+    if fresh and all(name in _VERSIONS for name in datasets):
+        return {name: _VERSIONS[name] for name in datasets}
+    return None
+
+
+def _remember_versions(versions: Dict[str, int], datasets: tuple) -> Dict[str, int]:
+    global _VERSIONS, _VERSIONS_CHECKED_AT
+    with _VERSIONS_LOCK:
+        _VERSIONS = versions
+        _VERSIONS_CHECKED_AT = time.monotonic()
+    return {name: versions[name] for name in datasets}
+
+
+def get_cached_data_versions(datasets: Iterable[str]) -> Optional[Dict[str, int]]:
+    """
+    데이터셋 버전을 반환합니다. 조회 주기가 지나지 않았으면 마지막 값을 재사용합니다.
+    (툴 결과 캐시와 답변 캐시가 함께 사용)
+
+    버전을 확인할 수 없으면(DB 오류 등) None을 반환하며, 이때는 공유 캐시를 사용하지 않습니다.
+    """
+    datasets = tuple(datasets)
+    if not datasets:
+        return {}
+
+    with _VERSIONS_LOCK:
+        cached = _fresh_versions(datasets)
+        if cached is not None:
+            return cached
+        names = set(datasets) | set(_VERSIONS)
+
+    versions = get_data_versions(sorted(names))
+    if versions is None:
+        return None
+    return _remember_versions(versions, datasets)
+
+
+async def aget_cached_data_versions(datasets: Iterable[str]) -> Optional[Dict[str, int]]:
+    """get_cached_data_versions의 비동기 버전 (주기가 지났을 때만 비동기 엔진으로 조회)"""
+    datasets = tuple(datasets)
+    if not datasets:
+        return {}
+
+    with _VERSIONS_LOCK:
+        cached = _fresh_versions(datasets)
+        if cached is not None:
+            return cached
+        names = set(datasets) | set(_VERSIONS)
+
+    versions = await aget_data_versions(sorted(names))
+    if versions is None:
+        return None
+    return _remember_versions(versions, datasets)
+
+
+def _json_default(value: Any) -> str:
+    return str(value)
+
+
+def get_tool_cache_stats() -> Dict[str, Any]:
+    """툴 결과 캐시 적중률 (모니터링용)"""
+    cache = _SHARED_CACHE
+    stats = cache.stats.as_dict() if cache is not None else {}
+    with _STATS_LOCK:
+        stats["run_memo_hits"] = _RUN_MEMO_HITS
+        stats["uncached_results"] = _UNCACHED_RESULTS
+    return stats
+
+
+def clear_tool_cache() -> None:
+    """공유 캐시를 비웁니다. (데이터 버전 갱신 없이 강제로 무효화할 때)"""
+    global _VERSIONS_CHECKED_AT
+    cache = _get_shared_cache()
+    if cache is not None:
+        cache.clear()
+    with _VERSIONS_LOCK:
+        _VERSIONS_CHECKED_AT = 0.0
+
+
+def cached_tool(
+    ttl_seconds: int,
+    datasets: Iterable[str] = (),
+    normalizers: Optional[Dict[str, Callable[[Any], Any]]] = None,
+):
+    """
+    툴 함수 결과를 캐싱하는 데코레이터. (@tool 바로 아래에 적용)
+
+    Args:
+        ttl_seconds: 공유 캐시 보관 시간 (초)
+        datasets: 결과가 의존하는 data_versions 데이터셋 이름 목록
+        normalizers: 인자 이름 → 정규화 함수 (예: {"query": _normalize_major_key})
+
+    결과는 JSON으로 직렬화 가능해야 하며(str/dict/list), 예외가 발생한 호출은 캐싱하지 않습니다.
+    오류 응답이나 mark_result_degraded()로 표시된 결과는 실행 단위 메모에만 남깁니다.
+    async 함수에도 적용할 수 있으며, 동기 래퍼의 cache_async(coro)로 감싼 비동기 구현은
+    같은 툴 이름/설정을 사용하므로 동기 경로와 캐시를 공유합니다.
+    """
+    datasets = tuple(datasets)
+    normalizers = normalizers or {}
+
+    def decorator(func, tool_name: Optional[str] = None):
+        signature = inspect.signature(func)
+        tool_name = tool_name or func.__name__
+
+        def _arg_key(args, kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            normalized = {
+                name: normalizers[name](value) if name in normalizers else value
+                for name, value in bound.arguments.items()
+            }
+            payload = json.dumps(
+                [tool_name, normalized],
+                ensure_ascii=False,
+                sort_keys=True,
+                default=_json_default,
+            )
+            return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+        def _lookup(arg_key: str, versions: Optional[Dict[str, int]]):
+            """(적중 여부, 결과, 공유 캐시 키) - 실행 단위 메모 → 공유 캐시 순서로 조회"""
+            global _RUN_MEMO_HITS
+
+            # 1단계: 실행 단위 메모
+            memo = _TOOL_RUN_MEMO.get()
+            if memo is not None and arg_key in memo:
+                with _STATS_LOCK:
+                    _RUN_MEMO_HITS += 1
+                print(f"💾 [Tool:{tool_name}] 같은 실행 안의 동일 호출 - 이전 결과 재사용")
+                return True, memo[arg_key], None
+
+            # 2단계: 공유 캐시 (데이터 버전을 키에 포함)
+            cache = _get_shared_cache()
+            shared_key = None
+            if cache is not None and versions is not None:
+                shared_key = f"{arg_key}:{json.dumps(versions, sort_keys=True)}"
+                hit, cached = cache.get(shared_key)
+                if hit and cached is not None:
+                    print(
+                        f"💾 [Tool:{tool_name}] 캐시 적중 (hit rate: {cache.stats.hit_rate:.0%})"
+                    )
+                    result = json.loads(cached)
+                    if memo is not None:
+                        memo[arg_key] = result
+                    return True, result, None
+            return False, None, shared_key
+
+        def _remember(
+            arg_key: str, shared_key: Optional[str], result: Any, degraded: list
+        ) -> None:
+            global _UNCACHED_RESULTS
+            # 다른 캐시 툴 안에서 호출된 경우 바깥 툴 결과도 품질 저하로 표시
+            for reason in degraded:
+                mark_result_degraded(reason)
+
+            memo = _TOOL_RUN_MEMO.get()
+            if memo is not None:
+                memo[arg_key] = result
+            if degraded or _has_transient_error(result):
+                reason = ", ".join(degraded) if degraded else "error result"
+                _mark_run_degraded(f"{tool_name}: {reason}")
+                if shared_key is None:
+                    return
+                with _STATS_LOCK:
+                    _UNCACHED_RESULTS += 1
+                print(f"⚠️ [Tool:{tool_name}] 공유 캐시에 저장하지 않음 ({reason})")
+                return
+            if shared_key is not None:
+                try:
+                    # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 JSON 문자열로 저장
+                    _get_shared_cache().set(
+                        shared_key, json.dumps(result, ensure_ascii=False), ttl_seconds
+                    )
+                except (TypeError, ValueError) as e:
+                    print(f"⚠️ [Tool:{tool_name}] result is not cacheable: {e}")
+
+        def _needs_versions(arg_key: str) -> bool:
+            memo = _TOOL_RUN_MEMO.get()
+            in_memo = memo is not None and arg_key in memo
+            return not in_memo and _get_shared_cache() is not None
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                arg_key = _arg_key(args, kwargs)
+                versions = (
+                    await aget_cached_data_versions(datasets)
+                    if _needs_versions(arg_key)
+                    else None
+                )
+                hit, result, shared_key = _lookup(arg_key, versions)
+                if hit:
+                    return result
+                degraded: list = []
+                token = _DEGRADED.set(degraded)
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception:
+                    _mark_run_degraded(f"{tool_name}: exception")
+                    raise
+                finally:
+                    _DEGRADED.reset(token)
+                _remember(arg_key, shared_key, result, degraded)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            arg_key = _arg_key(args, kwargs)
+            versions = (
+                get_cached_data_versions(datasets) if _needs_versions(arg_key) else None
+            )
+            hit, result, shared_key = _lookup(arg_key, versions)
+            if hit:
+                return result
+            degraded: list = []
+            token = _DEGRADED.set(degraded)
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                _mark_run_degraded(f"{tool_name}: exception")
+                raise
+            finally:
+                _DEGRADED.reset(token)
+            _remember(arg_key, shared_key, result, degraded)
+            return result
+
+        wrapper.cache_async = lambda coro: decorator(coro, tool_name)
+        return wrapper
+
+    return decorator
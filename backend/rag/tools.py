@@ -20,15 +20,36 @@ LLM이 사용자 질문을 분석하고, 필요시 자율적으로 이 툴들을
 5. LLM이 결과를 바탕으로 최종 답변 생성
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import List, Dict, Any, Optional, Tuple
 from langchain_core.tools import tool
+import asyncio
+import contextvars
+import functools
+import hashlib
 import re
 import json
-from backend.config import get_llm
+import threading
+import time
+from backend.config import get_llm, get_settings, resolve_path
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
-from .vectorstore import get_university_majors_vectorstore
+from .embeddings import aget_query_embedding, get_query_embedding, with_embedding_scope
+from .kv_cache import TTLCache, open_ttl_cache
+from .tool_cache import cached_tool, mark_result_degraded
+from backend.db.data_version import (
+    MAJOR_CATEGORIES_DATASET,
+    MAJORS_DATASET,
+    UNIVERSITIES_DATASET,
+    VECTOR_INDEX_DATASET,
+)
+from .vectorstore import (
+    MAJOR_CATEGORIES_NAMESPACE,
+    UNIVERSITY_MAJORS_NAMESPACE,
+    asimilarity_search_by_vector_with_score,
+    get_university_majors_vectorstore,
+)
 from .university_lookup import lookup_university_url, search_universities
 
 # ==================== 상수 정의 ====================
@@ -39,6 +60,10 @@ MAX_UNIVERSITY_RESULTS = 200
 UNIVERSITY_PREVIEW_COUNT = 5
 VECTOR_SEARCH_MULTIPLIER = 3
 
+# 툴 결과 캐시 TTL (초) - 데이터가 바뀌면 data_versions로 즉시 무효화되므로 넉넉하게 설정
+TOOL_CACHE_TTL_SEARCH = 60 * 60  # 벡터 검색/LLM 검증이 섞인 전공 검색 결과
+TOOL_CACHE_TTL_STATIC = 24 * 60 * 60  # 도움말, 대학 입시 URL 등 거의 바뀌지 않는 결과
+
 # 출력 포맷
 SEPARATOR_LINE = "=" * 80
 
@@ -210,6 +235,25 @@ def get_main_categories() -> Dict[str, List[str]]:
     return _MAIN_CATEGORIES
 
 
+def warm_main_categories() -> Dict[str, List[str]]:
+    """
+    전공 카테고리를 미리 로드합니다. (backend.warmup용)
+
+    로드 결과가 비어 있으면(DB 오류 등) 캐싱하지 않으므로, 워커가 첫 사용 시 다시 로드합니다.
+    """
+    global _MAIN_CATEGORIES
+    categories = _load_major_categories()
+    _MAIN_CATEGORIES = categories or None
+    return categories
+
+
+async def aget_main_categories() -> Dict[str, List[str]]:
+    """get_main_categories의 비동기 버전 (최초 DB 로드만 스레드에서 실행)"""
+    if _MAIN_CATEGORIES is not None:
+        return _MAIN_CATEGORIES
+    return await asyncio.to_thread(get_main_categories)
+
+
 def _expand_category_query(query: str) -> Tuple[List[str], str]:
     """
     list_departments용 쿼리 확장 함수
@@ -266,102 +310,43 @@ def _expand_category_query(query: str) -> Tuple[List[str], str]:
 
 # ==================== 전공 데이터 관리 (DB 기반) ====================
 
-from backend.db.connection import SessionLocal
-from backend.db.models import Major
-
-
-def _convert_db_model_to_record(row: Major) -> Any:
-    """DB 모델 객체를 MajorRecord 데이터클래스로 변환합니다."""
-    from backend.rag.loader import MajorRecord  # 순환 참조 방지
-
-    # 차트 데이터에서 성비/만족도 추출
-    gender = None
-    satisfaction = None
-
-    chart_data_obj = json.loads(row.chart_data) if row.chart_data else None
-    if chart_data_obj and isinstance(chart_data_obj, list):
-        stats_block = chart_data_obj[0]
-        if isinstance(stats_block, dict):
-            gender = stats_block.get("gender")
-            satisfaction = stats_block.get("satisfaction")
-
-    aliases = json.loads(row.department_aliases) if row.department_aliases else []
-
-    return MajorRecord(
-        major_id=row.major_id,
-        major_name=row.major_name,
-        cluster=None,
-        summary=row.summary or "",
-        interest=row.interest or "",
-        property=row.property or "",
-        relate_subject=json.loads(row.relate_subject) if row.relate_subject else None,
-        job=row.job or "",
-        enter_field=json.loads(row.enter_field) if row.enter_field else None,
-        salary=row.salary,
-        employment=row.employment,
-        employment_rate=row.employment_rate,
-        acceptance_rate=row.acceptance_rate,
-        department_aliases=aliases,
-        career_act=json.loads(row.career_act) if row.career_act else None,
-        qualifications=row.qualifications,
-        main_subject=json.loads(row.main_subject) if row.main_subject else None,
-        university=json.loads(row.university) if row.university else None,
-        chart_data=chart_data_obj,
-        raw=json.loads(row.raw_data) if row.raw_data else {},
-        gender=gender,
-        satisfaction=satisfaction,
-    )
+from .career_info_store import get_career_info_store
+from .major_catalog import aget_major_catalog, ensure_fields, get_major_catalog
+from .university_index import extract_offerings
 
 
 def _lookup_major_by_name(query: str) -> Optional[Any]:
     """
-    정확한 전공명 또는 별칭으로 전공 정보를 DB에서 검색합니다. (Exact Match Only)
+    정확한 전공명 또는 별칭으로 전공 정보를 카탈로그에서 검색합니다. (Exact Match Only)
     """
     query_str = query.strip()
     if not query_str:
         return None
 
-    session = SessionLocal()
-    try:
-        # 1. 전공명 정확 일치
-        obj = session.query(Major).filter(Major.major_name == query_str).first()
-
-        # 2. 별칭 검색 (전공명 일치가 없을 경우)
-        if not obj:
-            # JSON 리스트 내 검색 (LIKE 사용)
-            search_pattern = f'%"{query_str}"%'
-            obj = (
-                session.query(Major)
-                .filter(Major.department_aliases.like(search_pattern))
-                .first()
-            )
+    # 1. 전공명 정확 일치 → 2. 별칭 정확 일치 (인메모리 인덱스 조회)
+    return get_major_catalog().lookup(query_str)
 
-        if obj:
-            return _convert_db_model_to_record(obj)
-        return None
-    finally:
-        session.close()
+
+def _lookup_majors_by_names(names: List[str]) -> List[Any]:
+    """
+    여러 토큰을 전공명/별칭으로 한 번에 해석합니다. (Batch Exact Match)
+    """
+    names = [name.strip() for name in names if name and name.strip()]
+    if not names:
+        return []
+
+    return get_major_catalog().lookup_many(names)
 
 
 def _filter_majors_by_token(token: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
     """
-    전공명에 특정 토큰(키워드)이 포함된 전공들을 DB에서 검색합니다. (Partial Match)
+    전공명에 특정 토큰(키워드)이 포함된 전공들을 카탈로그에서 검색합니다. (Partial Match)
     """
     token_str = token.strip()
     if not token_str:
         return []
 
-    session = SessionLocal()
-    try:
-        results = (
-            session.query(Major)
-            .filter(Major.major_name.like(f"%{token_str}%"))
-            .limit(limit)
-            .all()
-        )
-        return [_convert_db_model_to_record(obj) for obj in results]
-    finally:
-        session.close()
+    return get_major_catalog().filter_by_token(token_str, limit=limit)
 
 
 def _search_major_records_by_vector(
@@ -370,14 +355,31 @@ def _search_major_records_by_vector(
     """
     벡터 검색을 통해 유사한 전공을 찾고, DB에서 상세 정보를 조회합니다.
     """
-    from backend.rag.embeddings import get_embeddings
-    from backend.rag.retriever import search_major_docs, aggregate_major_scores
+    from backend.rag.retriever import search_major_docs
 
-    embeddings = get_embeddings()
-    query_vec = embeddings.embed_query(query)
+    # 요청 단위 메모를 통해 같은 텍스트는 한 번만 임베딩
+    query_vec = get_query_embedding(query)
 
     # top_k는 limit * VECTOR_SEARCH_MULTIPLIER로 여유있게 가져옴
     hits = search_major_docs(query_vec, top_k=limit * VECTOR_SEARCH_MULTIPLIER)
+    return _major_records_from_hits(hits, limit)
+
+
+async def _asearch_major_records_by_vector(
+    query: str, limit: int = DEFAULT_SEARCH_LIMIT
+) -> List[Any]:
+    """_search_major_records_by_vector의 비동기 버전"""
+    from backend.rag.retriever import asearch_major_docs
+
+    query_vec = await aget_query_embedding(query)
+    hits = await asearch_major_docs(query_vec, top_k=limit * VECTOR_SEARCH_MULTIPLIER)
+    await aget_major_catalog()
+    return _major_records_from_hits(hits, limit)
+
+
+def _major_records_from_hits(hits: List[Any], limit: int) -> List[Any]:
+    """검색 결과를 전공별로 집계하여 상위 전공 레코드를 반환합니다."""
+    from backend.rag.retriever import aggregate_major_scores
 
     # 점수 집계
     aggregated_scores = aggregate_major_scores(
@@ -393,19 +395,8 @@ def _search_major_records_by_vector(
     if not top_ids:
         return []
 
-    session = SessionLocal()
-    try:
-        records = []
-        majors = session.query(Major).filter(Major.major_id.in_(top_ids)).all()
-        major_map = {m.major_id: m for m in majors}
-
-        for mid in top_ids:
-            if mid in major_map:
-                records.append(_convert_db_model_to_record(major_map[mid]))
-
-        return records
-    finally:
-        session.close()
+    # 상세 정보는 카탈로그에서 순서를 유지하며 조회
+    return get_major_catalog().get_many(top_ids)
 
 
 def _search_university_majors_by_vector(
@@ -416,58 +407,105 @@ def _search_university_majors_by_vector(
     """
     try:
         vs = get_university_majors_vectorstore()
-        # threshold=0.75 이상만 리턴하도록 설정
-        docs = vs.similarity_search_with_score(query, k=limit * 2)
-
-        results = []
-        for doc, score in docs:
-            if score < 0.75:
-                continue
-
-            results.append(
-                {
-                    "university": doc.metadata.get("university"),
-                    "department": doc.metadata.get("department"),
-                    "major_name": doc.metadata.get("major_name"),  # 대분류 이름
-                    "major_id": doc.metadata.get("major_id"),  # 대분류 ID
-                    "score": score,
-                }
-            )
+        # 텍스트 대신 벡터로 조회하여 같은 요청 내 다른 검색 경로와 임베딩을 공유
+        docs = vs.similarity_search_by_vector_with_score(
+            get_query_embedding(query), k=limit * 2
+        )
+        return _university_matches_from_docs(docs, limit)
+    except Exception as e:
+        print(f"⚠️ University major search failed: {e}")
+        mark_result_degraded("university_vector failed")
+        return []
 
-        # 대학명+학과명 중복 제거 (점수 높은 순 유지)
-        deduped = []
-        seen = set()
-        for res in results:
-            key = f"{res['university']}-{res['department']}"
-            if key not in seen:
-                seen.add(key)
-                deduped.append(res)
 
-        return deduped[:limit]
+async def _asearch_university_majors_by_vector(
+    query: str, limit: int = 5
+) -> List[Dict[str, Any]]:
+    """_search_university_majors_by_vector의 비동기 버전"""
+    try:
+        docs = await asimilarity_search_by_vector_with_score(
+            UNIVERSITY_MAJORS_NAMESPACE, await aget_query_embedding(query), k=limit * 2
+        )
+        return _university_matches_from_docs(docs, limit)
     except Exception as e:
         print(f"⚠️ University major search failed: {e}")
+        mark_result_degraded("university_vector failed")
         return []
 
 
-def _verify_with_llm(
-    query: str, candidates: List[Dict[str, Any]]
-) -> Optional[Dict[str, Any]]:
-    """
-    LLM을 사용하여 모호한 쿼리에 대해 가장 적절한 대학-학과 후보를 선택합니다.
-    """
-    if not candidates:
+def _university_matches_from_docs(docs, limit: int) -> List[Dict[str, Any]]:
+    """(Document, score) 목록을 대학-학과 후보 목록으로 변환합니다."""
+    # threshold=0.75 이상만 리턴하도록 설정
+    results = []
+    for doc, score in docs:
+        if score < 0.75:
+            continue
+
+        results.append(
+            {
+                "university": doc.metadata.get("university"),
+                "department": doc.metadata.get("department"),
+                "major_name": doc.metadata.get("major_name"),  # 대분류 이름
+                "major_id": doc.metadata.get("major_id"),  # 대분류 ID
+                "score": score,
+            }
+        )
+
+    # 대학명+학과명 중복 제거 (점수 높은 순 유지)
+    deduped = []
+    seen = set()
+    for res in results:
+        key = f"{res['university']}-{res['department']}"
+        if key not in seen:
+            seen.add(key)
+            deduped.append(res)
+
+    return deduped[:limit]
+
+
+# ==================== LLM 검증 결과 캐시 ====================
+
+_VERIFY_CACHE: Optional[TTLCache] = None
+_VERIFY_CACHE_LOCK = threading.Lock()
+
+
+def _get_verify_cache() -> Optional[TTLCache]:
+    """LLM 검증 결과 캐시를 반환합니다. (비활성화 시 None)"""
+    global _VERIFY_CACHE
+    settings = get_settings()
+    if not settings.llm_verify_cache_enabled:
         return None
+    with _VERIFY_CACHE_LOCK:
+        if _VERIFY_CACHE is None:
+            _VERIFY_CACHE = open_ttl_cache(
+                "llm_verify",
+                resolve_path(settings.cache_dir),
+                max_entries=settings.llm_verify_cache_max_entries,
+            )
+        return _VERIFY_CACHE
 
-    # 후보군이 1개이고 점수가 매우 높으면 바로 반환 (Token 절약)
-    if len(candidates) == 1 and candidates[0]["score"] > 0.88:
-        return candidates[0]
 
-    # 후보군 포맷팅
-    candidates_text = ""
-    for idx, c in enumerate(candidates):
-        candidates_text += f"{idx + 1}. {c['university']} {c['department']} (Category: {c['major_name']})\n"
+def _verify_cache_key(query: str, candidates: List[Dict[str, Any]]) -> str:
+    """(모델, 정규화된 쿼리, 순서가 있는 후보 목록) 조합의 캐시 키"""
+    settings = get_settings()
+    candidate_keys = [
+        f"{c.get('university')}|{c.get('department')}|{c.get('major_id')}"
+        for c in candidates
+    ]
+    payload = json.dumps(
+        [settings.llm_provider, settings.model_name, _normalize_major_key(query), candidate_keys],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-    prompt = ChatPromptTemplate.from_template("""
+
+def get_verify_cache_stats() -> Dict[str, Any]:
+    """LLM 검증 캐시 적중률 (모니터링용)"""
+    cache = _VERIFY_CACHE
+    return cache.stats.as_dict() if cache is not None else {}
+
+
+_VERIFY_PROMPT = ChatPromptTemplate.from_template("""
     User Query: {query}
     
     Candidates:
@@ -481,53 +519,313 @@ def _verify_with_llm(
     Return ONLY the number of the best match.
     """)
 
+
+def _verify_precheck(query: str, candidates: List[Dict[str, Any]]):
+    """
+    LLM 호출 없이 판단할 수 있는지 확인합니다.
+
+    Returns:
+        (resolved, result, cache_key): resolved=True이면 result를 그대로 사용
+    """
+    if not candidates:
+        return True, None, ""
+
+    # 후보군이 1개이고 점수가 매우 높으면 바로 반환 (Token 절약)
+    if len(candidates) == 1 and candidates[0]["score"] > 0.88:
+        return True, candidates[0], ""
+
+    cache = _get_verify_cache()
+    cache_key = _verify_cache_key(query, candidates) if cache is not None else ""
+    if cache is not None:
+        hit, cached_idx = cache.get(cache_key)
+        if hit:
+            print(
+                f"💾 LLM verification cache hit (hit rate: {cache.stats.hit_rate:.0%})"
+            )
+            if cached_idx is not None and 0 <= cached_idx < len(candidates):
+                return True, candidates[cached_idx], cache_key
+            return True, None, cache_key
+    return False, None, cache_key
+
+
+def _verify_inputs(query: str, candidates: List[Dict[str, Any]]) -> Dict[str, str]:
+    # 후보군 포맷팅
+    candidates_text = ""
+    for idx, c in enumerate(candidates):
+        candidates_text += f"{idx + 1}. {c['university']} {c['department']} (Category: {c['major_name']})\n"
+    return {"query": query, "candidates": candidates_text}
+
+
+def _apply_verification(
+    result: str, candidates: List[Dict[str, Any]], cache_key: str
+) -> Optional[Dict[str, Any]]:
+    """LLM 응답(후보 번호)을 해석하고 판단 결과를 캐싱합니다."""
+    cache = _get_verify_cache()
+    # 숫자만 추출
+    match_idx = int(re.sub(r"\D", "", result.strip()) or "0") - 1
+    settings = get_settings()
+    if 0 <= match_idx < len(candidates):
+        if cache is not None:
+            cache.set(cache_key, match_idx, settings.llm_verify_cache_ttl_seconds)
+        _log_tool_result(
+            "LLM Verification",
+            f"Selected: {candidates[match_idx]['university']} {candidates[match_idx]['department']}",
+        )
+        return candidates[match_idx]
+
+    # 적합한 후보가 없다는 판단도 캐싱 (네거티브 캐싱)
+    if cache is not None:
+        cache.set(cache_key, None, settings.llm_verify_cache_negative_ttl_seconds)
+    return None
+
+
+def _verify_with_llm(
+    query: str, candidates: List[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """
+    LLM을 사용하여 모호한 쿼리에 대해 가장 적절한 대학-학과 후보를 선택합니다.
+
+    같은 (쿼리, 후보 목록)에 대한 판단은 캐싱하며, LLM이 0(적합한 후보 없음)을 반환한
+    결과도 더 짧은 TTL로 캐싱합니다. LLM 호출 자체가 실패한 경우는 캐싱하지 않습니다.
+    """
+    resolved, result, cache_key = _verify_precheck(query, candidates)
+    if resolved:
+        return result
+
     try:
         llm = get_llm()
-        chain = prompt | llm | StrOutputParser()
-        result = chain.invoke({"query": query, "candidates": candidates_text})
-
-        # 숫자만 추출
-        match_idx = int(re.sub(r"\D", "", result.strip()) or "0") - 1
-        if 0 <= match_idx < len(candidates):
-            _log_tool_result(
-                "LLM Verification",
-                f"Selected: {candidates[match_idx]['university']} {candidates[match_idx]['department']}",
-            )
-            return candidates[match_idx]
+        chain = _VERIFY_PROMPT | llm | StrOutputParser()
+        result = chain.invoke(_verify_inputs(query, candidates))
+        return _apply_verification(result, candidates, cache_key)
     except Exception as e:
         print(f"⚠️ LLM verification failed: {e}")
+        mark_result_degraded("llm_verify failed")
 
     return None
 
 
+async def _averify_with_llm(
+    query: str, candidates: List[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """_verify_with_llm의 비동기 버전 (chain.ainvoke)"""
+    resolved, result, cache_key = _verify_precheck(query, candidates)
+    if resolved:
+        return result
+
+    try:
+        llm = get_llm()
+        chain = _VERIFY_PROMPT | llm | StrOutputParser()
+        result = await chain.ainvoke(_verify_inputs(query, candidates))
+        return _apply_verification(result, candidates, cache_key)
+    except Exception as e:
+        print(f"⚠️ LLM verification failed: {e}")
+        mark_result_degraded("llm_verify failed")
+
+    return None
+
+
+# ==================== 병렬 검색 실행기 ====================
+
+# _find_majors의 I/O 단계(벡터 검색, LLM 검증)를 실행하는 프로세스 공유 스레드 풀
+_STAGE_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_STAGE_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_stage_executor() -> ThreadPoolExecutor:
+    global _STAGE_EXECUTOR
+    with _STAGE_EXECUTOR_LOCK:
+        if _STAGE_EXECUTOR is None:
+            _STAGE_EXECUTOR = ThreadPoolExecutor(
+                max_workers=max(1, get_settings().find_majors_max_workers),
+                thread_name_prefix="find-majors",
+            )
+        return _STAGE_EXECUTOR
+
+
+def _run_stage(deadline: float, fn, *args) -> Any:
+    # 풀이 밀려 deadline이 지난 뒤에야 시작된 단계는 I/O 없이 종료 (_stage_result에서 건너뜀 처리)
+    if time.monotonic() >= deadline:
+        raise FutureTimeoutError()
+    return fn(*args)
+
+
+def _submit_stage(deadline: float, fn, *args) -> Future:
+    # 요청 단위 임베딩 메모(ContextVar)를 공유하도록 현재 컨텍스트를 복사하여 실행
+    context = contextvars.copy_context()
+    return _get_stage_executor().submit(context.run, _run_stage, deadline, fn, *args)
+
+
+def _skip_late_stage(stage: str) -> None:
+    print(f"⏱️ _find_majors stage '{stage}' missed the deadline. Skipped.")
+    # 단계 결과가 빠진 검색 결과는 공유 툴 캐시에 저장하지 않음
+    mark_result_degraded(f"{stage} missed the deadline")
+
+
+def _stage_result(future: Future, deadline: float, stage: str, default: Any) -> Any:
+    """
+    단계 결과를 deadline까지 기다립니다. 시간 안에 끝나지 않으면 default를 반환합니다.
+
+    늦은 단계는 취소하여, 아직 시작하지 않았다면 풀 스레드를 차지하지 않게 합니다.
+    (이미 I/O 중인 단계는 스레드에서 중단할 수 없으므로 마저 실행되고 결과만 버립니다)
+    """
+    try:
+        return future.result(timeout=max(0.0, deadline - time.monotonic()))
+    except FutureTimeoutError:
+        future.cancel()
+        _skip_late_stage(stage)
+        return default
+
+
+def _pick_granular_match(
+    query: str, univ_matches: List[Dict[str, Any]], deadline: float
+) -> Optional[Dict[str, Any]]:
+    """대학-학과 후보 중 최종 후보를 고릅니다. (LLM 검증은 제한 시간 내에서만 사용)"""
+    if not univ_matches:
+        return None
+
+    # LLM에게 검증 요청 (제한 시간을 넘기면 점수 기준으로만 판단)
+    verification_result = _stage_result(
+        _submit_stage(deadline, _verify_with_llm, query, univ_matches),
+        deadline,
+        "llm_verify",
+        None,
+    )
+    return _granular_fallback(univ_matches, verification_result)
+
+
+def _granular_fallback(
+    univ_matches: List[Dict[str, Any]], verification_result: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    if verification_result:
+        return verification_result
+    if univ_matches[0]["score"] > 0.82:
+        # LLM이 실패했거나 0을 반환했더라도, 점수가 높으면 1순위 사용
+        return univ_matches[0]
+    return None
+
+
+async def _await_stage(task: "asyncio.Future", deadline: float, stage: str, default: Any) -> Any:
+    """_stage_result의 비동기 버전 (늦은 단계는 태스크를 취소하여 진행 중인 I/O도 중단)"""
+    try:
+        return await asyncio.wait_for(task, timeout=max(0.0, deadline - time.monotonic()))
+    except asyncio.TimeoutError:
+        _skip_late_stage(stage)
+        return default
+
+
+async def _apick_granular_match(
+    query: str, univ_matches: List[Dict[str, Any]], deadline: float
+) -> Optional[Dict[str, Any]]:
+    """_pick_granular_match의 비동기 버전"""
+    if not univ_matches:
+        return None
+
+    verification_result = await _await_stage(
+        asyncio.ensure_future(_averify_with_llm(query, univ_matches)),
+        deadline,
+        "llm_verify",
+        None,
+    )
+    return _granular_fallback(univ_matches, verification_result)
+
+
 def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
     """
     통합 전공 검색 함수 (4단계 검색 전략 - DB 기반)
 
+    0. 대학-학과 정밀 검색 (+ LLM 검증)
     1. 정확한 전공명 매칭
     2. 별칭 매칭
     3. 벡터 유사도 검색 (항상 수행)
     4. 토큰 필터링 (보완)
+
+    서로 독립적인 단계는 동시에 실행하고(벡터 검색 2종은 스레드 풀, 카탈로그 조회는 현재 스레드),
+    결과는 위 우선순위대로 병합합니다. FIND_MAJORS_DEADLINE_SECONDS 안에 끝나지 않은 단계는
+    취소하고 결과 없이 건너뛰며, 이때의 검색 결과는 공유 툴 캐시에 저장하지 않습니다.
     """
-    matches: List[Any] = []
-    seen_ids: set[str] = set()
+    deadline = time.monotonic() + get_settings().find_majors_deadline_seconds
 
-    # 0단계: 대학-학과 정밀 검색 (New Granular Search)
-    univ_matches = _search_university_majors_by_vector(query, limit=5)
+    # 쿼리 확장
+    tokens, embed_text = _expand_category_query(query)
+    search_text = embed_text or query
 
-    best_univ_match = None
-    if univ_matches:
-        # LLM에게 검증 요청
-        verification_result = _verify_with_llm(query, univ_matches)
-        if verification_result:
-            best_univ_match = verification_result
-        elif len(univ_matches) > 0 and univ_matches[0]["score"] > 0.82:
-            # LLM이 실패했거나 0을 반환했더라도, 점수가 높으면 1순위 사용
-            best_univ_match = univ_matches[0]
+    # I/O 단계 시작: 0단계(대학-학과 벡터 검색), 3단계(전공 벡터 검색)
+    univ_future = _submit_stage(deadline, _search_university_majors_by_vector, query, 5)
+    vector_future = _submit_stage(
+        deadline,
+        _search_major_records_by_vector,
+        search_text,
+        max(limit, DEFAULT_SEARCH_LIMIT),
+    )
+
+    # 메모리 카탈로그 단계는 기다리는 동안 현재 스레드에서 처리 (1, 2, 4단계)
+    direct = _lookup_major_by_name(query)
+    alias_matches = _lookup_majors_by_names(tokens) if tokens else []
+    token_matches = [_filter_majors_by_token(token, limit=limit) for token in tokens]
+
+    univ_matches = _stage_result(univ_future, deadline, "university_vector", [])
+    best_univ_match = _pick_granular_match(query, univ_matches, deadline)
+    vector_matches = _stage_result(vector_future, deadline, "major_vector", [])
+
+    return _merge_major_matches(
+        limit, best_univ_match, direct, alias_matches, vector_matches, token_matches
+    )
+
+
+async def _afind_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
+    """
+    _find_majors의 비동기 버전.
+
+    벡터 검색 2종과 LLM 검증을 이벤트 루프의 태스크로 동시에 실행하며(스레드 풀 미사용),
+    제한 시간과 병합 우선순위는 _find_majors와 같습니다.
+    카테고리/카탈로그 로드와 버전 확인(MySQL)은 aget_* 함수가 필요할 때만 스레드에서 처리하므로
+    메모리 조회 단계는 이벤트 루프에서 I/O 없이 실행됩니다.
+    """
+    deadline = time.monotonic() + get_settings().find_majors_deadline_seconds
+
+    await aget_main_categories()
+    tokens, embed_text = _expand_category_query(query)
+    search_text = embed_text or query
+
+    univ_task = asyncio.ensure_future(_asearch_university_majors_by_vector(query, 5))
+    vector_task = asyncio.ensure_future(
+        _asearch_major_records_by_vector(search_text, max(limit, DEFAULT_SEARCH_LIMIT))
+    )
+
+    await aget_major_catalog()
+    direct = _lookup_major_by_name(query)
+    alias_matches = _lookup_majors_by_names(tokens) if tokens else []
+    token_matches = [_filter_majors_by_token(token, limit=limit) for token in tokens]
+
+    univ_matches = await _await_stage(univ_task, deadline, "university_vector", [])
+    best_univ_match = await _apick_granular_match(query, univ_matches, deadline)
+    vector_matches = await _await_stage(vector_task, deadline, "major_vector", [])
+
+    # 단계를 기다리는 동안 버전 확인 주기가 지났을 수 있으므로 병합 전에 다시 확인
+    await aget_major_catalog()
+    return _merge_major_matches(
+        limit, best_univ_match, direct, alias_matches, vector_matches, token_matches
+    )
+
+
+def _merge_major_matches(
+    limit: int,
+    best_univ_match: Optional[Dict[str, Any]],
+    direct: Optional[Any],
+    alias_matches: List[Any],
+    vector_matches: List[Any],
+    token_matches: List[List[Any]],
+) -> List[Any]:
+    """단계별 결과를 우선순위대로 병합합니다."""
+    # ---- 우선순위 병합: 정밀 매칭 > 정확 일치 > 별칭 > 벡터 > 토큰 ----
+    matches: List[Any] = []
+    seen_ids: set[str] = set()
 
     if best_univ_match:
-        # 정밀 검색으로 찾은 대분류를 최우선으로 추가
-        direct_univ = _lookup_major_by_name(best_univ_match["major_name"])
+        # 정밀 검색으로 찾은 대분류를 최우선으로 추가 (메타데이터의 major_id 우선)
+        direct_univ = get_major_catalog().get(
+            best_univ_match.get("major_id") or ""
+        ) or _lookup_major_by_name(best_univ_match["major_name"] or "")
         if direct_univ:
             matches.append(direct_univ)
             seen_ids.add(direct_univ.major_id)
@@ -536,28 +834,18 @@ def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
             )
 
     # 1단계: 정확한 전공명 매칭
-    direct = _lookup_major_by_name(query)
     if direct and direct.major_id not in seen_ids:
         matches.append(direct)
         seen_ids.add(direct.major_id)
 
-    # 쿼리 확장
-    tokens, embed_text = _expand_category_query(query)
-
-    # 2단계: 별칭 검색 (토큰 기반)
-    if not matches and tokens:
-        for token in tokens:
-            alias_match = _lookup_major_by_name(token)
-            if alias_match and alias_match.major_id not in seen_ids:
+    # 2단계: 별칭 검색 (앞 단계에서 찾지 못한 경우에만 사용)
+    if not matches:
+        for alias_match in alias_matches:
+            if alias_match.major_id not in seen_ids:
                 matches.append(alias_match)
                 seen_ids.add(alias_match.major_id)
 
-    # 3단계: 벡터 유사도 검색 (항상 수행)
-    search_text = embed_text or query
-    vector_matches = _search_major_records_by_vector(
-        search_text, limit=max(limit, DEFAULT_SEARCH_LIMIT)
-    )
-
+    # 3단계: 벡터 유사도 검색
     for record in vector_matches:
         if record.major_id not in seen_ids:
             matches.append(record)
@@ -566,10 +854,9 @@ def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
             break
 
     # 4단계: 토큰 필터링 (보완)
-    if len(matches) < limit and tokens:
-        for token in tokens:
-            token_matches = _filter_majors_by_token(token, limit=limit)
-            for record in token_matches:
+    if len(matches) < limit:
+        for records in token_matches:
+            for record in records:
                 if record.major_id not in seen_ids:
                     matches.append(record)
                     seen_ids.add(record.major_id)
@@ -588,6 +875,9 @@ def _extract_university_entries(record: Any) -> List[Dict[str, str]]:
     """
     MajorRecord에서 대학 정보 추출
 
+    카탈로그의 대학 역색인(major_id → 개설 대학)을 조회하며,
+    카탈로그에 없는 레코드는 university JSON을 직접 펼쳐서 사용합니다.
+
     Args:
         record: MajorRecord 객체
 
@@ -606,73 +896,14 @@ def _extract_university_entries(record: Any) -> List[Dict[str, str]]:
             ...
         ]
     """
-    entries: List[Dict[str, str]] = []
-    raw_list = getattr(record, "university", None)
-
-    if not isinstance(raw_list, list):
-        return entries
-
-    seen: set[Tuple[str, str, str]] = set()
-
-    for item in raw_list:
-        # 필드 추출
-        school = (item.get("schoolName") or "").strip()
-        campus = (item.get("campus_nm") or item.get("campusNm") or "").strip()
-        major_name = (item.get("majorName") or "").strip()
-        area = (item.get("area") or "").strip()
-        url = (item.get("schoolURL") or "").strip()
-
-        # 대학명이 없으면 스킵
-        if not school:
-            continue
-
-        # [BugFix] Hallucination 방지:
-        # JSON 데이터에 majorName이 명시되어 있지 않은 경우, 이것은 해당 대학의 특정 학과가 아니라
-        # '일반적인 학과 정보'일 가능성이 높습니다.
-        # 따라서 majorNamg이 비어있으면 record.major_name(대표 학과명)을 쓰되,
-        # 이를 '대학의 실제 학과'로 확정 짓는 것을 신중히 해야 합니다.
-        # 다만, 현재 로직상 대학 목록을 보여줘야 하므로 record.major_name을 쓰되
-        # 나중에 필터링 할 수 있도록 함.
-        # 여기서는 major_name이 있으면 그것을 우선하고, 없으면 record.major_name을 씁니다.
-        # 하지만, major_name이 실제로 비어있는 경우(대학 테이블에만 매핑된 경우)
-        # 사용자가 "한양대 컴공"이라고 물었을 때 "한양대 컴퓨터소프트웨어학부"가 나와야 하는데
-        # 데이터가 없으면 "한양대 컴퓨터공학(표준)"으로 나올 수 있음.
-
-        dept_label = major_name
-        if not dept_label:
-            # majorName이 없는 경우 스킵하거나, 표준 이름을 사용하되 표시
-            # 여기서는 엄격하게 majorName이 있는 경우만 유효한 '개설 학과'로 봅니다.
-            # 데이터 품질에 따라 다르지만 Hallucination 방지를 위해 엄격 모드 적용
-            # 만약 데이터가 전부 majorName이 비어있다면 이 로직은 수정 필요.
-            # 일단은 표준 이름 사용하되, 원본 데이터가 없었음을 인지.
-            dept_label = record.major_name
-
-        # 중복 제거
-        dedup_key = (school, dept_label, campus)
-        if dedup_key in seen:
-            continue
-        seen.add(dedup_key)
-
-        entry: Dict[str, str] = {
-            "university": school,
-            "college": campus or area or "",
-            "department": dept_label,
-        }
-
-        if area:
-            entry["area"] = area
-        if campus:
-            entry["campus"] = campus
-        if url:
-            entry["url"] = url
-
-        # 표준 학과명과 다르면 기록
-        if record.major_name and record.major_name != dept_label:
-            entry["standard_major_name"] = record.major_name
-
-        entries.append(entry)
+    catalog = get_major_catalog()
+    if catalog.get(record.major_id) is record:
+        offerings = catalog.universities.offerings_for_major(record.major_id)
+    else:
+        offerings = extract_offerings(record)
 
-    return entries
+    # majorName이 비어 있는 개설 정보는 표준 학과명으로 표시됨 (extract_offerings 참고)
+    return [offering.to_entry() for offering in offerings]
 
 
 def _collect_university_pairs(record: Any, limit: int = 3) -> List[str]:
@@ -712,33 +943,11 @@ def _get_majors_for_university(university_name: str) -> List[str]:
     if not target_clean:
         return []
 
-    majors = set()
-    session = SessionLocal()
-    try:
-        # JSON 문자열 검색 (LIKE)
-        # university 컬럼에 해당 대학 이름이 포함된 레코드만 조회
-        # 성능 최적화를 위해 필요한 컬럼만 조회할 수도 있지만, _extract_university_entries가 전체 record를 씀
-        # university_name이 포함된 대략적인 후보군 조회
-        candidates = (
-            session.query(Major)
-            .filter(Major.university.like(f"%{target_clean}%"))
-            .all()
-        )
+    # 대학 역색인에서 바로 조회 (LIKE 스캔 + JSON 파싱 없음)
+    offerings = get_major_catalog().universities.offerings_for_university(target_clean)
+    majors = {offering.department for offering in offerings if offering.department}
 
-        for row in candidates:
-            # DB 모델 -> Record 변환 (필요한 필드만 있어도 됨)
-            record = _convert_db_model_to_record(row)
-            entries = _extract_university_entries(record)
-            for entry in entries:
-                univ = entry.get("university", "")
-                if target_clean in univ.replace(" ", ""):
-                    dept = entry.get("department")
-                    if dept:
-                        majors.add(dept)
-
-        return sorted(list(majors))
-    finally:
-        session.close()
+    return sorted(list(majors))
 
 
 # ==================== 진로 정보 추출 ====================
@@ -956,6 +1165,15 @@ def _resolve_major_for_career(query: str) -> Optional[Any]:
     return matches[0] if matches else None
 
 
+async def _aresolve_major_for_career(query: str) -> Optional[Any]:
+    """_resolve_major_for_career의 비동기 버전"""
+    if not query:
+        return None
+
+    matches = await _afind_majors(query, limit=1)
+    return matches[0] if matches else None
+
+
 # ==================== 출력 포맷팅 ====================
 
 
@@ -1086,7 +1304,40 @@ def summarize_conversation_history(history: List[Dict[str, str]]) -> str:
 # ==================== LangChain Tools ====================
 
 
+def _with_coroutine(sync_tool):
+    """
+    @tool로 만든 동기 툴에 비동기 구현(coroutine)을 연결하는 데코레이터.
+
+    그래프를 ainvoke/astream으로 실행하면 ToolNode가 이 구현을 await 하므로 스레드를 쓰지 않습니다.
+    동기 구현의 cached_tool 설정(툴 이름, TTL, 데이터셋)을 그대로 사용하여 캐시를 공유합니다.
+    """
+
+    def decorator(coro):
+        cache_async = getattr(sync_tool.func, "cache_async", None)
+        sync_tool.coroutine = cache_async(coro) if cache_async else coro
+        return coro
+
+    return decorator
+
+
+def _run_inline(sync_tool):
+    """메모리 조회만 하는 툴은 이벤트 루프에서 동기 구현을 바로 실행하는 coroutine을 연결합니다."""
+
+    @functools.wraps(sync_tool.func)
+    async def coroutine(*args, **kwargs):
+        return sync_tool.func(*args, **kwargs)
+
+    sync_tool.coroutine = coroutine
+    return sync_tool
+
+
 @tool
+@cached_tool(
+    TOOL_CACHE_TTL_SEARCH,
+    datasets=(MAJORS_DATASET, MAJOR_CATEGORIES_DATASET, VECTOR_INDEX_DATASET),
+    normalizers={"query": lambda value: _normalize_major_key(value or "")},
+)
+@with_embedding_scope
 def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
     """
     Pinecone majors vector DB를 기반으로 학과 목록을 조회하고 추천하는 툴입니다.
@@ -1123,70 +1374,79 @@ def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
 
     # 전체 목록 요청 처리
     if raw_query == "전체" or not raw_query:
-        dept_univ_map: Dict[str, List[str]] = {}
-        all_names = []
-
-        session = SessionLocal()
-        try:
-            # 모든 전공 조회 (top_k가 크지 않다면 limit 적용 가능하지만, 전체 통계가 필요하면 다 가져옴)
-            # 여기서는 top_k 제한을 걸어서 가져오는 것이 성능상 유리함
-            query_obj = session.query(Major)
-
-            # 전체 개수 카운트
-            total_count = query_obj.count()
-
-            # 이름순 정렬하여 top_k만큼 가져오기 (혹은 전체 가져와서 포맷팅?)
-            # 여기서는 로직 유지: 전체 이름을 수집하고 정렬
-            # 하지만 DB에서 Order By 하는게 낫다.
-            # limit 없이 다 가져오는건 위험하므로 안전장치로 500개 제한
-            fetched_majors = query_obj.order_by(Major.major_name).limit(500).all()
-
-            for row in fetched_majors:
-                record = _convert_db_model_to_record(row)
-                if not record.major_name:
-                    continue
+        return _list_all_departments(raw_query, top_k)
 
-                all_names.append(record.major_name)
+    # 키워드 검색 처리
+    tokens, embed_text = _expand_category_query(raw_query)
+    print(f"   ℹ️ Expanded query tokens: {tokens}")
+    print(f"   ℹ️ Embedding text: '{embed_text}'")
 
-                # 개설 대학 정보 수집
-                pairs = _collect_university_pairs(record)
-                if pairs:
-                    bucket = dept_univ_map.setdefault(record.major_name, [])
-                    for pair in pairs:
-                        if pair not in bucket:
-                            bucket.append(pair)
+    # 통합 검색 실행
+    matches = _find_majors(raw_query, limit=max(top_k, DEFAULT_SEARCH_LIMIT))
+    return _format_department_matches(raw_query, top_k, matches)
 
-        finally:
-            session.close()
 
-        # 정렬 및 제한
-        # DB에서 이미 정렬했지만, 중복 제거 등 파이썬 로직 유지
-        all_names = sorted(set(all_names))
-        limited = all_names[:top_k] if top_k else all_names
+@_with_coroutine(list_departments)
+@with_embedding_scope
+async def _alist_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
+    """list_departments의 비동기 구현 (그래프를 ainvoke/astream으로 실행할 때 ToolNode가 사용)"""
+    raw_query = (query or "").strip()
+    _log_tool_start(
+        "list_departments",
+        f"학과 목록 조회 - query='{raw_query or '전체'}', top_k={top_k}",
+    )
 
-        print(
-            f"✅ Returning {len(limited)} majors out of {len(all_names)} total (DB limited 500)"
-        )
+    if raw_query == "전체" or not raw_query:
+        await aget_major_catalog()
+        return _list_all_departments(raw_query, top_k)
 
-        result_text = _format_department_output(
-            raw_query or "전체",
-            limited,
-            total_available=total_count,  # 실제 DB 카운트 사용
-            dept_univ_map=dept_univ_map,
-        )
+    matches = await _afind_majors(raw_query, limit=max(top_k, DEFAULT_SEARCH_LIMIT))
+    return _format_department_matches(raw_query, top_k, matches)
 
-        _log_tool_result(
-            "list_departments", f"총 {len(all_names)}개 중 {len(limited)}개 목록 반환"
-        )
-        return result_text
 
-    # 키워드 검색 처리
-    tokens, embed_text = _expand_category_query(raw_query)
-    print(f"   ℹ️ Expanded query tokens: {tokens}")
-    print(f"   ℹ️ Embedding text: '{embed_text}'")
+def _list_all_departments(raw_query: str, top_k: int) -> str:
+    """전체 학과 목록 (카탈로그 이름순)"""
+    dept_univ_map: Dict[str, List[str]] = {}
+    all_names = []
 
-    # 통합 검색 실행
-    matches = _find_majors(raw_query, limit=max(top_k, DEFAULT_SEARCH_LIMIT))
+    # 카탈로그에서 전체 전공을 이름순으로 조회 (DB 왕복 없음)
+    catalog = get_major_catalog()
+    total_count = len(catalog)
+
+    for record in catalog.sorted_by_name():
+        all_names.append(record.major_name)
+
+        # 개설 대학 정보 수집
+        pairs = _collect_university_pairs(record)
+        if pairs:
+            bucket = dept_univ_map.setdefault(record.major_name, [])
+            for pair in pairs:
+                if pair not in bucket:
+                    bucket.append(pair)
+
+    # 정렬 및 제한 (중복 제거)
+    all_names = sorted(set(all_names))
+    limited = all_names[:top_k] if top_k else all_names
+
+    print(
+        f"✅ Returning {len(limited)} majors out of {len(all_names)} total (catalog)"
+    )
+
+    result_text = _format_department_output(
+        raw_query or "전체",
+        limited,
+        total_available=total_count,  # 카탈로그 전체 개수
+        dept_univ_map=dept_univ_map,
+    )
+
+    _log_tool_result(
+        "list_departments", f"총 {len(all_names)}개 중 {len(limited)}개 목록 반환"
+    )
+    return result_text
+
+
+def _format_department_matches(raw_query: str, top_k: int, matches: List[Any]) -> str:
+    """검색된 전공 레코드를 개설 대학 예시와 함께 학과 목록으로 포맷팅"""
     dept_univ_map: Dict[str, List[str]] = {}
 
     # 각 매칭된 전공의 개설 대학 정보 수집
@@ -1224,60 +1484,14 @@ def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
     return result_text
 
 
-@tool
-def get_major_career_info(
-    major_name: str, specific_field: str = "all"
-) -> Dict[str, Any]:
+def _render_career_info(record: Any, field: str) -> Dict[str, Any]:
     """
-    특정 전공의 상세 정보(진로, 취업률, 연봉, 관련 자격증 등)를 조회하는 툴입니다.
+    get_major_career_info의 응답 딕셔너리를 구성합니다.
 
-    [중요: 일반 정보 원칙]
-    - 이 툴은 **특정 대학의 데이터가 아닌, 국가 표준(커리어넷) 데이터**만 제공합니다.
-    - 사용자가 특정 대학과 학과에 대한 정보를 물어보면, 이 툴을 사용하되 **결과를 설명할 때 절대 특정 대학의 정보인 것처럼 답변하지 마세요.**
-    - "한양대 컴퓨터공학과의 취업률은..." (X) -> "한양대학교의 구체적인 취업률 공시 자료는 없으나, 국가 표준 데이터에 따른 일반적인 컴퓨터공학과의 취업률은..." (O)
-
-    [호출 시점]
-    - **취업률, 연봉, 진로, 졸업 후 직업** 관련 질문은 대학명이 포함되어 있어도 무조건 이 툴을 사용하세요.
-    - 입력으로 받은 대학명은 무시하고 **학과명만** 사용하세요.
-
-    파라미터 설명:
-    - major_name: 정보를 조회할 학과명. (예: "컴퓨터공학과")
-    - specific_field:
-        사용자가 궁금해하는 특정 정보를 지정하여 필요한 데이터만 가져보세요.
-        - "jobs": 진출 직업, 관련 직업 리스트, 진출 분야
-        - "stats": 취업률, 입학 경쟁률, 남녀 성비, 만족도, 졸업 후 연봉
-        - "academics": 주요 교과목, 관련 자격증, 학과 관련 활동
-        - "all": (기본값) 위 모든 정보를 포함한 전체 요약
-
-    [필수 처리]
-    - 결과에 `warning_context`가 포함되어 있다면, 답변 시 **반드시 해당 경고 문구**를 포함하여 사용자에게 고지하세요.
+    결과는 (전공, field)와 카탈로그 데이터에만 의존하므로 build_career_info 스크립트가
+    모든 전공 × 필드 조합을 미리 렌더링할 때도 같은 함수를 사용합니다.
+    record에는 FIELD_GROUPS[field] 컬럼이 로드되어 있어야 합니다. (ensure_fields)
     """
-    query = (major_name or "").strip()
-    field = (specific_field or "all").lower()
-
-    _log_tool_start(
-        "get_major_career_info", f"전공 정보 조회 - major='{query}', field='{field}'"
-    )
-    print(f"✅ Using get_major_career_info tool for: '{query}' (Field: {field})")
-
-    # 입력 검증
-    if not query:
-        return {
-            "error": "invalid_query",
-            "message": "전공명을 입력해 주세요.",
-            "suggestion": "예: '컴퓨터공학과', '소프트웨어공학과'",
-        }
-
-    # 전공 레코드 검색
-    record = _resolve_major_for_career(query)
-    if record is None:
-        print(f"⚠️  WARNING: No career data found for '{query}'")
-        return {
-            "error": "no_results",
-            "message": f"'{query}' 전공의 정보를 찾을 수 없습니다.",
-            "suggestion": "학과명을 정확히 입력하거나 list_departments 툴로 전공명을 먼저 확인하세요.",
-        }
-
     # 응답 구성 (공통 필드)
     response: Dict[str, Any] = {
         "major": record.major_name,
@@ -1302,8 +1516,6 @@ def get_major_career_info(
 
         if not job_list:
             response["warning"] = "데이터에 등록된 직업 목록이 없습니다."
-        else:
-            print(f"   ℹ️ Included {len(job_list)} jobs")
 
     # 2. 통계 정보 (stats)
     if field in ["all", "stats"]:
@@ -1320,9 +1532,6 @@ def get_major_career_info(
         response["employment_rate"] = record.employment_rate
         response["acceptance_rate"] = record.acceptance_rate
         response["annual_salary"] = annual_salary
-        print(
-            f"   ℹ️ Included stats (employment: {record.employment_rate}, salary: {annual_salary})"
-        )
 
     # 3. 학업/자격증/활동 정보 (academics)
     if field in ["all", "academics"]:
@@ -1339,8 +1548,117 @@ def get_major_career_info(
         if main_subjects:
             response["main_subject"] = main_subjects
 
+    return response
+
+
+@tool
+@cached_tool(
+    TOOL_CACHE_TTL_SEARCH,
+    # 전공 해석(_find_majors)이 카테고리 기반 쿼리 확장을 사용하므로 카테고리 버전도 포함
+    datasets=(MAJORS_DATASET, MAJOR_CATEGORIES_DATASET, VECTOR_INDEX_DATASET),
+    normalizers={
+        "major_name": lambda value: _normalize_major_key(value or ""),
+        "specific_field": lambda value: (value or "all").lower(),
+    },
+)
+@with_embedding_scope
+def get_major_career_info(
+    major_name: str, specific_field: str = "all"
+) -> Dict[str, Any]:
+    """
+    특정 전공의 상세 정보(진로, 취업률, 연봉, 관련 자격증 등)를 조회하는 툴입니다.
+
+    [중요: 일반 정보 원칙]
+    - 이 툴은 **특정 대학의 데이터가 아닌, 국가 표준(커리어넷) 데이터**만 제공합니다.
+    - 사용자가 특정 대학과 학과에 대한 정보를 물어보면, 이 툴을 사용하되 **결과를 설명할 때 절대 특정 대학의 정보인 것처럼 답변하지 마세요.**
+    - "한양대 컴퓨터공학과의 취업률은..." (X) -> "한양대학교의 구체적인 취업률 공시 자료는 없으나, 국가 표준 데이터에 따른 일반적인 컴퓨터공학과의 취업률은..." (O)
+
+    [호출 시점]
+    - **취업률, 연봉, 진로, 졸업 후 직업** 관련 질문은 대학명이 포함되어 있어도 무조건 이 툴을 사용하세요.
+    - 입력으로 받은 대학명은 무시하고 **학과명만** 사용하세요.
+
+    파라미터 설명:
+    - major_name: 정보를 조회할 학과명. (예: "컴퓨터공학과")
+    - specific_field:
+        사용자가 궁금해하는 특정 정보를 지정하여 필요한 데이터만 가져보세요.
+        - "jobs": 진출 직업, 관련 직업 리스트, 진출 분야
+        - "stats": 취업률, 입학 경쟁률, 남녀 성비, 만족도, 졸업 후 연봉
+        - "academics": 주요 교과목, 관련 자격증, 학과 관련 활동
+        - "all": (기본값) 위 모든 정보를 포함한 전체 요약
+
+    [필수 처리]
+    - 결과에 `warning_context`가 포함되어 있다면, 답변 시 **반드시 해당 경고 문구**를 포함하여 사용자에게 고지하세요.
+    """
+    query = (major_name or "").strip()
+    field = (specific_field or "all").lower()
+
+    _log_tool_start(
+        "get_major_career_info", f"전공 정보 조회 - major='{query}', field='{field}'"
+    )
+    print(f"✅ Using get_major_career_info tool for: '{query}' (Field: {field})")
+
+    # 입력 검증
+    if not query:
+        return {
+            "error": "invalid_query",
+            "message": "전공명을 입력해 주세요.",
+            "suggestion": "예: '컴퓨터공학과', '소프트웨어공학과'",
+        }
+
+    # 전공 레코드 검색
+    record = _resolve_major_for_career(query)
+    return _career_info_response(query, field, record)
+
+
+@_with_coroutine(get_major_career_info)
+@with_embedding_scope
+async def _aget_major_career_info(
+    major_name: str, specific_field: str = "all"
+) -> Dict[str, Any]:
+    """get_major_career_info의 비동기 구현"""
+    query = (major_name or "").strip()
+    field = (specific_field or "all").lower()
+
+    _log_tool_start(
+        "get_major_career_info", f"전공 정보 조회 - major='{query}', field='{field}'"
+    )
+
+    if not query:
+        return {
+            "error": "invalid_query",
+            "message": "전공명을 입력해 주세요.",
+            "suggestion": "예: '컴퓨터공학과', '소프트웨어공학과'",
+        }
+
+    record = await _aresolve_major_for_career(query)
+    # 미리 렌더링된 응답 파일 확인과 ensure_fields(MySQL 조회)는 동기 I/O이므로 스레드에서 실행
+    return await asyncio.to_thread(_career_info_response, query, field, record)
+
+
+def _career_info_response(query: str, field: str, record: Optional[Any]) -> Dict[str, Any]:
+    """검색된 전공 레코드로 get_major_career_info 응답을 만듭니다."""
+    if record is None:
+        print(f"⚠️  WARNING: No career data found for '{query}'")
+        return {
+            "error": "no_results",
+            "message": f"'{query}' 전공의 정보를 찾을 수 없습니다.",
+            "suggestion": "학과명을 정확히 입력하거나 list_departments 툴로 전공명을 먼저 확인하세요.",
+        }
+
+    # 미리 렌더링된 응답이 있으면 포맷팅 없이 반환 (build_career_info로 생성)
+    response = get_career_info_store().get(
+        record.major_id, field, get_major_catalog().version
+    )
+    if response is not None:
+        print(f"   💾 Served precomputed career info for '{record.major_name}' ({field})")
+    else:
+        # 요청한 필드 그룹에 필요한 컬럼만 추가로 로드
+        record = ensure_fields(record, field)
+        response = _render_career_info(record, field)
         print(
-            f"   ℹ️ Included academic info (subjects: {len(main_subjects)}, acts: {len(career_activities)})"
+            f"   ℹ️ Included {len(response.get('jobs', []))} jobs, "
+            f"{len(response.get('main_subject', []))} subjects "
+            f"(employment: {record.employment_rate})"
         )
 
     _log_tool_result(
@@ -1351,6 +1669,12 @@ def get_major_career_info(
 
 
 @tool
+@cached_tool(
+    TOOL_CACHE_TTL_SEARCH,
+    datasets=(MAJORS_DATASET, VECTOR_INDEX_DATASET),
+    normalizers={"department_name": lambda value: _normalize_major_key(value or "")},
+)
+@with_embedding_scope
 def get_universities_by_department(department_name: str) -> List[Dict[str, str]]:
     """
     특정 학과를 개설한 대학 목록을 조회하는 툴입니다.
@@ -1385,39 +1709,85 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
         _log_tool_result("get_universities_by_department", "학과명 누락 - 오류 반환")
         return result
 
-    from backend.db.connection import get_db
-    from backend.db.models import Major
-    import json
+    # 1. Vector DB Semantic Search (의미 기반 대분류 확장)
+    vector_matched_names = _category_vector_names(query)
+    return _universities_for_department(query, vector_matched_names)
 
-    db = next(get_db())
-    aggregated: List[Dict[str, str]] = []
-    seen = set()
 
+@_with_coroutine(get_universities_by_department)
+@with_embedding_scope
+async def _aget_universities_by_department(department_name: str) -> List[Dict[str, str]]:
+    """get_universities_by_department의 비동기 구현"""
+    query = (department_name or "").strip()
+    _log_tool_start(
+        "get_universities_by_department", f"학과별 대학 조회 - department='{query}'"
+    )
+
+    if not query:
+        _log_tool_result("get_universities_by_department", "학과명 누락 - 오류 반환")
+        return [
+            {
+                "error": "invalid_query",
+                "message": "학과명을 입력해 주세요.",
+                "suggestion": "예: '컴퓨터공학과', '소프트웨어학부'",
+            }
+        ]
+
+    vector_matched_names = await _acategory_vector_names(query)
+    await aget_major_catalog()
+    return _universities_for_department(query, vector_matched_names)
+
+
+def _category_vector_names(query: str) -> List[str]:
+    """검색어와 의미적으로 유사한 표준 학과명 상위 20개 (major_categories 네임스페이스)"""
     try:
-        # =========================================================
-        # 1. Vector DB Semantic Search (의미 기반 대분류 확장)
-        # =========================================================
-        vector_matched_names = []
-        try:
-            from backend.rag.vectorstore import get_major_category_vectorstore
+        from backend.rag.vectorstore import get_major_category_vectorstore
 
-            vectorstore = get_major_category_vectorstore()
-            # 검색어와 의미적으로 유사한 학과명 상위 20개 검색
-            docs = vectorstore.similarity_search(query, k=20)
+        vectorstore = get_major_category_vectorstore()
+        docs = vectorstore.similarity_search_by_vector(get_query_embedding(query), k=20)
 
-            vector_matched_names = [d.page_content for d in docs]
-            print(f"Vector Search found related categories: {vector_matched_names}")
-        except Exception as e:
-            print(f"   ⚠️  Vector Search failed: {e}")
+        vector_matched_names = [d.page_content for d in docs]
+        print(f"Vector Search found related categories: {vector_matched_names}")
+        return vector_matched_names
+    except Exception as e:
+        print(f"   ⚠️  Vector Search failed: {e}")
+        mark_result_degraded("category_vector failed")
+        return []
 
+
+async def _acategory_vector_names(query: str) -> List[str]:
+    """_category_vector_names의 비동기 버전"""
+    try:
+        docs = await asimilarity_search_by_vector_with_score(
+            MAJOR_CATEGORIES_NAMESPACE, await aget_query_embedding(query), k=20
+        )
+
+        vector_matched_names = [d.page_content for d, _ in docs]
+        print(f"Vector Search found related categories: {vector_matched_names}")
+        return vector_matched_names
+    except Exception as e:
+        print(f"   ⚠️  Vector Search failed: {e}")
+        mark_result_degraded("category_vector failed")
+        return []
+
+
+def _universities_for_department(
+    query: str, vector_matched_names: List[str]
+) -> List[Dict[str, str]]:
+    """카탈로그 키워드 검색 + 벡터 매칭 학과명으로 개설 대학 목록을 만듭니다."""
+    aggregated: List[Dict[str, str]] = []
+    seen = set()
+
+    try:
         # =========================================================
-        # 2. SQL 키워드 검색 (기본)
+        # 2. 카탈로그 키워드 검색 (기본)
         # =========================================================
-        # 2-1. 1차 검색: 정확한 포함 (LIKE %query%)
-        major_records = (
-            db.query(Major).filter(Major.major_name.like(f"%{query}%")).all()
-        )
+        catalog = get_major_catalog()
+
+        # 2-1. 1차 검색: 정확한 포함 (major_name에 query 포함)
+        major_records = catalog.filter_by_token(query)
         print(f"Primary Search found {len(major_records)} records")
+        existing_ids = {r.major_id for r in major_records}
 
         # 2-2. 2차 검색: 접미사 제거 후 확장 (Keyword Expansion)
         normalized_query = _normalize_major_key(query)
@@ -1427,95 +1797,46 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
 
         if len(keyword) >= 2 and keyword != query:
             print(f"Expanding search with keyword: '{keyword}'")
-            secondary_records = (
-                db.query(Major).filter(Major.major_name.like(f"%{keyword}%")).all()
-            )
+            secondary_records = catalog.filter_by_token(keyword)
             print(f"Secondary Search found {len(secondary_records)} records")
 
             # 중복 방지를 위해 기존 레코드에 추가
-            existing_ids = {r.id for r in major_records}
             for sr in secondary_records:
-                if sr.id not in existing_ids:
+                if sr.major_id not in existing_ids:
                     major_records.append(sr)
-                    existing_ids.add(sr.id)
+                    existing_ids.add(sr.major_id)
 
-        # 2-3. [New] Vector 매칭 결과 추가 (Semantic Expansion)
+        # 2-3. Vector 매칭 결과 추가 (Semantic Expansion)
         if vector_matched_names:
             print(f"Applying Vector matches: {vector_matched_names}")
-            # vector_matched_names에 있는 '표준 학과명'을 가진 Major 레코드를 조회
-            vector_records = (
-                db.query(Major).filter(Major.major_name.in_(vector_matched_names)).all()
-            )
-
-            existing_ids = {r.id for r in major_records}
-            for vr in vector_records:
-                if vr.id not in existing_ids:
+            # vector_matched_names에 있는 '표준 학과명'을 가진 레코드를 조회
+            for name in vector_matched_names:
+                vr = catalog.by_name.get(name)
+                if vr is not None and vr.major_id not in existing_ids:
                     major_records.append(vr)
-                    existing_ids.add(vr.id)
+                    existing_ids.add(vr.major_id)
 
         # =========================================================
-        # 3. 대학 정보 파싱 및 추출
+        # 3. 대학 정보 조회 (major_id → 개설 대학 역색인)
         # =========================================================
         for record in major_records:
-            if not record.university:
-                continue
-
-            try:
-                # JSON 컬럼 파싱 (record.university는 LONGTEXT로 저장된 JSON string)
-                univ_list = json.loads(record.university)
-                if not isinstance(univ_list, list):
+            for offering in catalog.universities.offerings_for_major(record.major_id):
+                # 중복 제거 (대학, 학과, 캠퍼스)
+                dedup_key = (offering.university, offering.department, offering.campus)
+                if dedup_key in seen:
                     continue
-
-                for item in univ_list:
-                    school = (item.get("schoolName") or "").strip()
-                    major_name = (item.get("majorName") or "").strip()
-                    campus = (
-                        item.get("campus_nm") or item.get("campusNm") or ""
-                    ).strip()
-                    area = (item.get("area") or "").strip()
-                    url = (item.get("schoolURL") or "").strip()
-
-                    if not school:
-                        continue
-
-                    # 학과명이 비어있으면 표준 학과명 사용
-                    dept_label = major_name if major_name else record.major_name
-
-                    # 중복 제거 (대학, 학과, 캠퍼스)
-                    dedup_key = (school, dept_label, campus)
-                    if dedup_key in seen:
-                        continue
-                    seen.add(dedup_key)
-
-                    entry = {
-                        "university": school,
-                        "college": campus or area or "",
-                        "department": dept_label,
-                        "url": url,
-                        "standard_major_name": record.major_name,
-                    }
-                    if area:
-                        entry["area"] = area
-                    if campus:
-                        entry["campus"] = campus
-
-                    aggregated.append(entry)
-
-            except json.JSONDecodeError:
-                print(f"⚠️  JSON Decode Error in Major ID {record.id}")
-                continue
+                seen.add(dedup_key)
+                aggregated.append(offering.to_entry(include_all=True))
 
     except Exception as e:
-        print(f"❌ SQL Query Error: {e}")
-        _log_tool_result("get_universities_by_department", f"SQL Error: {e}")
+        print(f"❌ Catalog Query Error: {e}")
+        _log_tool_result("get_universities_by_department", f"DB Error: {e}")
         return [
             {
                 "error": "db_error",
                 "message": "데이터베이스 조회 중 오류가 발생했습니다.",
             }
         ]
-    finally:
-        db.close()
 
     # 결과 제한
     MAX_UNIVERSITY_RESULTS = 1000  # 검색 결과 최대 개수
@@ -1523,7 +1844,7 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
 
     # 검색 결과가 없는 경우
     if not aggregated:
-        print(f"⚠️  WARNING: No universities found offering '{query}' in SQL DB")
+        print(f"⚠️  WARNING: No universities found offering '{query}' in catalog")
         result = [
             {
                 "error": "no_results",
@@ -1536,13 +1857,14 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
 
     _log_tool_result(
         "get_universities_by_department",
-        f"총 {len(aggregated)}건 대학 정보 반환 (SQL Source)",
+        f"총 {len(aggregated)}건 대학 정보 반환 (Catalog Source)",
     )
     print(f"✅ Retrieved {len(aggregated)} universities for '{query}'")
     return aggregated
 
 
 @tool
+@cached_tool(TOOL_CACHE_TTL_STATIC)
 def get_search_help() -> str:
     """
     사용자의 질문을 처리할 적절한 툴을 찾지 못했거나, 검색 결과가 없을 때 도움말을 제공하는 툴입니다.
@@ -1564,6 +1886,11 @@ def get_search_help() -> str:
 
 
 @tool
+@cached_tool(
+    TOOL_CACHE_TTL_STATIC,
+    datasets=(UNIVERSITIES_DATASET,),
+    normalizers={"university_name": lambda value: _normalize_major_key(value or "")},
+)
 def get_university_admission_info(university_name: str) -> Dict[str, Any]:
     """
     특정 대학의 '입시(입학) 정보'를 조회하는 툴입니다.
@@ -1641,3 +1968,8 @@ def get_university_admission_info(university_name: str) -> Dict[str, Any]:
         f"대학 입시 URL 반환: {university_info.get('url')}",
     )
     return result
+
+
+# 메모리 조회만 하는 툴은 비동기 그래프 실행에서도 스레드를 거치지 않고 바로 실행
+_run_inline(get_search_help)
+_run_inline(get_university_admission_info)
@@ -0,0 +1,181 @@
+"""
+대학 ↔ 학과 역색인(Inverted Index) 모듈
+
+Major.university(LONGTEXT JSON)를 매 요청마다 LIKE로 스캔하고 파싱하던 대신,
+전공 카탈로그를 로드할 때 university_major_offerings 테이블(시드 시 정규화)을 한 번 읽어
+두 방향의 딕셔너리로 보관합니다. 테이블이 비어 있으면 JSON을 직접 펼쳐서 만듭니다.
+
+- by_university: 정규화된 대학명 → 개설 학과 목록
+- by_major_id: 표준 major_id → 개설 대학 목록
+
+** 대학명 정규화 **
+공백을 제거하고, "[본교]", "(제2캠퍼스)" 같은 캠퍼스 접미사를 뗀 이름도 함께 색인하여
+"서울대", "서울 대학교", "서울대학교[본교]" 입력이 같은 키로 조회되도록 합니다.
+"""
+
+# backend/rag/university_index.py
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Tuple
+
+# 대학명 뒤의 캠퍼스 표기: "서울대학교[본교]", "고려대학교(세종)" 등
+_CAMPUS_SUFFIX_RE = re.compile(r"[\[\(][^\]\)]*[\]\)]\s*$")
+
+
+def normalize_university_name(name: str) -> str:
+    """공백을 제거한 대학명 (비교/색인용 키)"""
+    return re.sub(r"\s+", "", name or "")
+
+
+def strip_campus_suffix(name: str) -> str:
+    """캠퍼스 접미사를 제거한 정규화 대학명"""
+    normalized = normalize_university_name(name)
+    while True:
+        stripped = _CAMPUS_SUFFIX_RE.sub("", normalized)
+        if stripped == normalized:
+            return stripped
+        normalized = stripped
+
+
+@dataclass(frozen=True)
+class UniversityOffering:
+    """대학 하나에 개설된 학과 하나 (개설 정보 한 건)"""
+
+    university: str
+    department: str
+    campus: str
+    area: str
+    url: str
+    major_id: str
+    standard_major_name: str
+
+    def to_entry(self, include_all: bool = False) -> Dict[str, str]:
+        """
+        툴 응답용 딕셔너리로 변환합니다.
+
+        Args:
+            include_all: True면 url/standard_major_name을 값과 관계없이 항상 포함
+                (get_universities_by_department 응답 형식)
+        """
+        entry: Dict[str, str] = {
+            "university": self.university,
+            "college": self.campus or self.area or "",
+            "department": self.department,
+        }
+        if include_all:
+            entry["url"] = self.url
+            entry["standard_major_name"] = self.standard_major_name
+        if self.area:
+            entry["area"] = self.area
+        if self.campus:
+            entry["campus"] = self.campus
+        if not include_all:
+            if self.url:
+                entry["url"] = self.url
+            # 표준 학과명과 다르면 기록
+            if self.standard_major_name and self.standard_major_name != self.department:
+                entry["standard_major_name"] = self.standard_major_name
+        return entry
+
+
+def extract_offerings(record: Any) -> List[UniversityOffering]:
+    """
+    MajorRecord.university(JSON 리스트)에서 개설 정보를 추출합니다.
+
+    majorName이 비어 있으면 표준 학과명을 학과명으로 사용하며,
+    (대학, 학과, 캠퍼스) 조합 기준으로 중복을 제거합니다.
+    """
+    raw_list = getattr(record, "university", None)
+    if not isinstance(raw_list, list):
+        return []
+
+    offerings: List[UniversityOffering] = []
+    seen: set[Tuple[str, str, str]] = set()
+
+    for item in raw_list:
+        if not isinstance(item, dict):
+            continue
+
+        school = (item.get("schoolName") or "").strip()
+        if not school:
+            continue
+
+        campus = (item.get("campus_nm") or item.get("campusNm") or "").strip()
+        department = (item.get("majorName") or "").strip() or record.major_name
+
+        dedup_key = (school, department, campus)
+        if dedup_key in seen:
+            continue
+        seen.add(dedup_key)
+
+        offerings.append(
+            UniversityOffering(
+                university=school,
+                department=department,
+                campus=campus,
+                area=(item.get("area") or "").strip(),
+                url=(item.get("schoolURL") or "").strip(),
+                major_id=record.major_id,
+                standard_major_name=record.major_name,
+            )
+        )
+
+    return offerings
+
+
+class UniversityIndex:
+    """대학명 ↔ 학과 개설 정보 양방향 색인"""
+
+    def __init__(self) -> None:
+        self.by_university: Dict[str, List[UniversityOffering]] = {}
+        self.by_base_name: Dict[str, List[str]] = {}
+        self.by_major_id: Dict[str, List[UniversityOffering]] = {}
+
+    @classmethod
+    def build(cls, records: List[Any]) -> "UniversityIndex":
+        """MajorRecord.university JSON을 펼쳐서 색인을 만듭니다. (테이블이 없을 때의 폴백)"""
+        return cls.from_offerings(
+            offering for record in records for offering in extract_offerings(record)
+        )
+
+    @classmethod
+    def from_offerings(cls, offerings: Iterable[UniversityOffering]) -> "UniversityIndex":
+        """university_major_offerings 테이블에서 읽은 개설 정보로 색인을 만듭니다."""
+        index = cls()
+        for offering in offerings:
+            index.add(offering)
+        return index
+
+    def add(self, offering: UniversityOffering) -> None:
+        key = normalize_university_name(offering.university)
+        if key not in self.by_university:
+            self.by_university[key] = []
+            self.by_base_name.setdefault(strip_campus_suffix(key), []).append(key)
+        self.by_university[key].append(offering)
+        self.by_major_id.setdefault(offering.major_id, []).append(offering)
+
+    def __len__(self) -> int:
+        return len(self.by_university)
+
+    def offerings_for_major(self, major_id: str) -> List[UniversityOffering]:
+        return self.by_major_id.get(major_id, [])
+
+    def _resolve_keys(self, university_name: str) -> List[str]:
+        # 1) 캠퍼스 접미사를 뗀 이름이 같은 모든 캠퍼스 → 2) 부분 일치(대학명 키 목록만 스캔)
+        target = normalize_university_name(university_name)
+        if not target:
+            return []
+
+        base_keys = self.by_base_name.get(strip_campus_suffix(target))
+        if base_keys:
+            return list(base_keys)
+
+        return [key for key in self.by_university if target in key]
+
+    def offerings_for_university(self, university_name: str) -> List[UniversityOffering]:
+        offerings: List[UniversityOffering] = []
+        for key in self._resolve_keys(university_name):
+            offerings.extend(self.by_university[key])
+        return offerings
@@ -11,39 +11,193 @@ Pinecone을 사용하여 전공 정보를 벡터로 저장하고 검색하는 
 
 ** 주요 기능 **
 1. get_major_vectorstore(): 전공 추천을 위한 Pinecone 벡터 스토어 반환
-2. index_major_docs(): 전공 문서를 Pinecone에 인덱싱
+2. index_major_docs(): 전공 문서를 Pinecone에 인덱싱 (ingestion.py의 배치/병렬 엔진 사용)
 3. clear_major_index(): Pinecone 인덱스 초기화
+4. sync_major_docs(): 바뀐 문서만 다시 임베딩하는 증분 동기화 (index_sync.py)
+5. reset(): 레지스트리/공유 핸들 초기화 (테스트, 설정 변경 후 재구성용)
+6. asimilarity_search_by_vector_with_score(): 비동기 경로(async 그래프/툴)용 벡터 검색
+
+** 공유 핸들 **
+Pinecone 클라이언트와 인덱스 핸들(HTTP 연결 풀 포함)은 프로세스당 하나만 만들고,
+VectorStore는 네임스페이스별 레지스트리에 한 번만 생성하여 모든 get_*_vectorstore()가 재사용합니다.
+
+** 벡터 백엔드 선택 **
+VECTOR_BACKEND=local이면 get_*_vectorstore() 함수들이 Pinecone 대신
+로컬 NumPy 스냅샷(local_vectorstore.py)을 사용하는 LocalVectorStore를 반환합니다.
 """
 
 # backend/rag/vectorstore.py
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
+import asyncio
+import functools
 import threading
+import weakref
 
-from langchain_pinecone import PineconeVectorStore
-from pinecone import Pinecone, ServerlessSpec
-from pinecone.exceptions import NotFoundException
-
-from backend.config import get_settings
+from backend.config import get_settings, resolve_path
 from .embeddings import get_embeddings
 from .loader import MajorDoc
 
-# Pinecone (majors) caches
-_MAJOR_VECTORSTORE_CACHE = None
-_MAJOR_VECTORSTORE_LOCK = threading.Lock()
+# Pinecone SDK는 pinecone 백엔드를 실제로 사용할 때 import합니다. (local 백엔드/관리 명령은 로드하지 않음)
+if TYPE_CHECKING:
+    from pinecone import Pinecone
+
+# Pinecone 공유 핸들 (클라이언트 1개 + 인덱스 핸들 1개, _PINECONE_LOCK으로 보호)
+_PINECONE_CLIENT = None
 _MAJOR_INDEX_CACHE = None
+_PINECONE_LOCK = threading.RLock()
+
+# VectorStore 레지스트리: (backend, namespace) -> PineconeVectorStore | LocalVectorStore
+_VECTORSTORES: dict[tuple[str, str], Any] = {}
+_VECTORSTORE_LOCK = threading.Lock()
+
+# 이벤트 루프 -> IndexAsyncio (루프마다 aiohttp 세션 하나를 열어 두고 그 루프의 비동기 검색이 공유)
+_ASYNC_INDEXES: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+UNIVERSITY_MAJORS_NAMESPACE = "university_majors"
+MAJOR_CATEGORIES_NAMESPACE = "major_categories"
+DEFAULT_LOCAL_NAMESPACE = "__default__"
+
+
+# ==================== Backend Selection ====================
+
+
+def _use_local_backend() -> bool:
+    # VECTOR_BACKEND 설정값을 검증하고 local 백엔드 사용 여부를 반환합니다.
+    backend = get_settings().vector_backend.lower()
+    if backend not in ("pinecone", "local"):
+        raise ValueError(
+            f"Unsupported VECTOR_BACKEND: {backend}. Use one of ['pinecone', 'local']."
+        )
+    return backend == "local"
+
+
+def _get_registered_vectorstore(backend: str, namespace: str | None, factory):
+    """
+    (backend, namespace)별 VectorStore를 레지스트리에서 반환하고, 없으면 factory로 한 번만 생성합니다.
+
+    동시에 들어온 첫 요청들은 락에서 기다렸다가 먼저 만든 인스턴스를 함께 사용합니다.
+    반환된 스토어는 모든 요청이 공유하므로 요청별 상태를 담으면 안 됩니다.
+    (Pinecone 스토어의 비동기 검색은 SharedPineconeVectorStore가 이벤트 루프별 인덱스로 보냄)
+    """
+    key = (backend, namespace or DEFAULT_LOCAL_NAMESPACE)
+    store = _VECTORSTORES.get(key)
+    if store is not None:
+        return store
+
+    with _VECTORSTORE_LOCK:
+        store = _VECTORSTORES.get(key)
+        if store is None:
+            store = factory(namespace)
+            _VECTORSTORES[key] = store
+        return store
+
+
+def _build_local_vectorstore(namespace: str | None):
+    from .local_vectorstore import LocalVectorStore
+
+    return LocalVectorStore(
+        namespace=namespace or DEFAULT_LOCAL_NAMESPACE,
+        embedding=get_embeddings(),
+        snapshot_dir=resolve_path(get_settings().vector_snapshot_dir),
+    )
+
+
+def _get_local_vectorstore(namespace: str | None):
+    """
+    네임스페이스별 LocalVectorStore를 싱글톤으로 반환합니다.
+
+    스냅샷 행렬은 프로세스당 한 번만 로드되며, 이후 검색은 메모리에서 수행됩니다.
+    """
+    return _get_registered_vectorstore("local", namespace, _build_local_vectorstore)
+
+
+def _get_vectorstore(namespace: str | None):
+    # VECTOR_BACKEND에 맞는 네임스페이스별 VectorStore (get_*_vectorstore() 공용)
+    if _use_local_backend():
+        return _get_local_vectorstore(namespace)
+    return _get_registered_vectorstore("pinecone", namespace, _build_pinecone_vectorstore)
+
+
+def reset() -> None:
+    """
+    VectorStore 레지스트리와 Pinecone 공유 클라이언트/인덱스 핸들을 비웁니다.
+
+    테스트에서 설정(VECTOR_BACKEND, 인덱스 이름 등)을 바꾼 뒤 호출하면
+    다음 get_*_vectorstore() 호출 시 새 설정으로 다시 구성합니다. 임베딩 모델 캐시는 유지합니다.
+    이벤트 루프별 IndexAsyncio는 닫지 않고 버리므로, 열려 있는 세션은 aclose_async_index()로 먼저 닫습니다.
+    """
+    global _PINECONE_CLIENT, _MAJOR_INDEX_CACHE
+    with _VECTORSTORE_LOCK:
+        _VECTORSTORES.clear()
+    with _PINECONE_LOCK:
+        _PINECONE_CLIENT = None
+        _MAJOR_INDEX_CACHE = None
+        _ASYNC_INDEXES.clear()
+
+
+def reset_after_fork() -> None:
+    """
+    fork된 워커에서 호출: 부모(gunicorn master)의 Pinecone HTTP 연결 풀을 워커 전용으로 교체합니다.
+
+    워밍업 중 인덱스 확인/추천 엔진 로드로 연결 풀에 keep-alive 소켓이 남을 수 있으므로
+    클라이언트와 인덱스 핸들을 새로 만듭니다. 인덱스 호스트는 이미 알고 있으므로 describe_index
+    호출 없이 핸들만 다시 만들고, local 스냅샷 스토어(공유 메모리 행렬)는 그대로 둡니다.
+    부모의 이벤트 루프별 IndexAsyncio는 워커의 루프에서 쓸 수 없으므로 버립니다.
+    """
+    global _PINECONE_CLIENT, _MAJOR_INDEX_CACHE
+    with _PINECONE_LOCK:
+        inherited = _MAJOR_INDEX_CACHE
+        _PINECONE_CLIENT = None
+        _MAJOR_INDEX_CACHE = None
+        _ASYNC_INDEXES.clear()
+        if inherited is not None:
+            _MAJOR_INDEX_CACHE = _open_index(_get_pinecone_client(), host=inherited.config.host)
+
+    with _VECTORSTORE_LOCK:
+        for key in [key for key in _VECTORSTORES if key[0] == "pinecone"]:
+            del _VECTORSTORES[key]
+
+
+def mark_vector_index_changed() -> None:
+    """
+    벡터 네임스페이스 내용이 바뀌었음을 data_versions에 기록한다.
+
+    툴 결과 캐시(tool_cache.py)는 이 버전을 키에 포함하므로 인덱싱 이후 이전 결과를 쓰지 않는다.
+    """
+    from backend.db.data_version import VECTOR_INDEX_DATASET, bump_data_version
+
+    bump_data_version(VECTOR_INDEX_DATASET)
 
 
 # ==================== Pinecone Vector Store for Majors ====================
 
 
 def _get_pinecone_client() -> Pinecone:
-    # Pinecone API 클라이언트를 초기화하고 키 누락 시 명확한 에러를 발생시킵니다.
+    # 프로세스 공용 Pinecone API 클라이언트 (처음 호출할 때 생성, 키 누락 시 명확한 에러)
+    global _PINECONE_CLIENT
+    with _PINECONE_LOCK:
+        if _PINECONE_CLIENT is None:
+            from pinecone import Pinecone
+
+            settings = get_settings()
+            if not settings.pinecone_api_key:
+                raise ValueError("PINECONE_API_KEY is not set in environment or .env file.")
+            _PINECONE_CLIENT = Pinecone(
+                api_key=settings.pinecone_api_key,
+                pool_threads=settings.pinecone_pool_threads or None,
+            )
+        return _PINECONE_CLIENT
+
+
+def _open_index(client: Pinecone, name: str = "", host: str = ""):
+    # 연결 풀 설정을 적용한 인덱스 핸들 (host를 알면 describe_index 호출 없이 생성)
     settings = get_settings()
-    if not settings.pinecone_api_key:
-        raise ValueError("PINECONE_API_KEY is not set in environment or .env file.")
-    return Pinecone(api_key=settings.pinecone_api_key)
+    kwargs: dict[str, Any] = {}
+    if settings.pinecone_connection_pool_maxsize:
+        kwargs["connection_pool_maxsize"] = settings.pinecone_connection_pool_maxsize
+    return client.Index(name=name, host=host, **kwargs)
 
 
 def _list_index_names(client: Pinecone) -> list[str]:
@@ -102,27 +256,34 @@ def _get_region_and_cloud(settings):
 
 def _ensure_major_index(embeddings):
     # Pinecone 인덱스가 없으면 생성하고 있으면 핸들을 재사용
+    # (동시에 들어온 첫 요청이 list_indexes/차원 확인을 중복 실행하지 않도록 락 안에서 한 번만 수행)
     global _MAJOR_INDEX_CACHE
     if _MAJOR_INDEX_CACHE is not None:
         return _MAJOR_INDEX_CACHE
 
-    settings = get_settings()
-    client = _get_pinecone_client()
-    index_name = settings.pinecone_index_name
-    existing = _list_index_names(client)
-    dimension = _infer_embedding_dimension(embeddings)
-
-    if index_name not in existing:
-        region, cloud = _get_region_and_cloud(settings)
-        client.create_index(
-            name=index_name,
-            dimension=dimension,
-            metric="cosine",
-            spec=ServerlessSpec(cloud=cloud, region=region),
-        )
+    with _PINECONE_LOCK:
+        if _MAJOR_INDEX_CACHE is not None:
+            return _MAJOR_INDEX_CACHE
 
-    _MAJOR_INDEX_CACHE = client.Index(index_name)
-    return _MAJOR_INDEX_CACHE
+        settings = get_settings()
+        client = _get_pinecone_client()
+        index_name = settings.pinecone_index_name
+        existing = _list_index_names(client)
+
+        if index_name not in existing:
+            from pinecone import ServerlessSpec
+
+            dimension = _infer_embedding_dimension(embeddings)
+            region, cloud = _get_region_and_cloud(settings)
+            client.create_index(
+                name=index_name,
+                dimension=dimension,
+                metric="cosine",
+                spec=ServerlessSpec(cloud=cloud, region=region),
+            )
+
+        _MAJOR_INDEX_CACHE = _open_index(client, name=index_name)
+        return _MAJOR_INDEX_CACHE
 
 
 def _get_major_namespace() -> str | None:
@@ -140,6 +301,40 @@ def get_major_index():
     return _ensure_major_index(embeddings)
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_pinecone_store_class():
+    # langchain_pinecone을 pinecone 백엔드를 쓸 때만 import하기 위해 클래스를 처음 사용할 때 정의
+    from langchain_pinecone import PineconeVectorStore
+
+    class SharedPineconeVectorStore(PineconeVectorStore):
+        """
+        레지스트리에서 여러 요청이 공유하는 PineconeVectorStore.
+
+        기본 구현은 비동기 검색마다 스토어에 캐싱한 IndexAsyncio의 세션을 닫으므로, 공유 스토어에서
+        요청이 겹치면 다른 호출이 실패한다. 비동기 검색(asimilarity_search* 계열)은 모두 이 메서드를
+        거치므로 이벤트 루프별 IndexAsyncio(_apinecone_search)로 보낸다.
+        """
+
+        async def asimilarity_search_by_vector_with_score(self, embedding, *, k=4, **kwargs):
+            namespace = kwargs.get("namespace")
+            if namespace is None:
+                namespace = self._namespace
+            return await _apinecone_search(namespace, embedding, k, kwargs.get("filter"))
+
+    return SharedPineconeVectorStore
+
+
+def _build_pinecone_vectorstore(namespace: str | None):
+    # 공유 인덱스 핸들 위에 네임스페이스만 다른 PineconeVectorStore를 구성
+    embeddings = get_embeddings()
+    return _shared_pinecone_store_class()(
+        index=_ensure_major_index(embeddings),
+        embedding=embeddings,
+        text_key="text",
+        namespace=namespace,
+    )
+
+
 def get_major_vectorstore():
     """
     전공 추천에 특화된 Pinecone 기반 LangChain VectorStore를 싱글톤으로 반환한다.
@@ -147,22 +342,90 @@ def get_major_vectorstore():
     Index 핸들, 임베딩 모델, namespace 설정을 한 번만 구성한 뒤 재사용하여
     불필요한 API 호출을 줄이고 스레드 안정성을 확보한다.
     """
-    # LangChain VectorStore 인터페이스를 재사용하기 위해 싱글톤으로 구성
-    global _MAJOR_VECTORSTORE_CACHE
-    with _MAJOR_VECTORSTORE_LOCK:
-        if _MAJOR_VECTORSTORE_CACHE is not None:
-            return _MAJOR_VECTORSTORE_CACHE
-
-        embeddings = get_embeddings()
-        index = _ensure_major_index(embeddings)
-        namespace = _get_major_namespace()
-        _MAJOR_VECTORSTORE_CACHE = PineconeVectorStore(
-            index=index,
-            embedding=embeddings,
-            text_key="text",
-            namespace=namespace,
+    return _get_vectorstore(_get_major_namespace())
+
+
+# ==================== Async Search ====================
+
+
+async def _get_async_index():
+    # 현재 이벤트 루프 전용 IndexAsyncio (처음 호출할 때 공유 인덱스 핸들의 host로 생성, 닫지 않고 재사용)
+    loop = asyncio.get_running_loop()
+    index = _ASYNC_INDEXES.get(loop)
+    if index is not None:
+        return index
+
+    # 인덱스 확인(list_indexes)은 동기 호출이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    host = (await asyncio.to_thread(get_major_index)).config.host
+
+    from pinecone import PineconeAsyncio
+
+    with _PINECONE_LOCK:
+        index = _ASYNC_INDEXES.get(loop)
+        if index is None:
+            settings = get_settings()
+            kwargs: dict[str, Any] = {}
+            if settings.pinecone_connection_pool_maxsize:
+                kwargs["connection_pool_maxsize"] = settings.pinecone_connection_pool_maxsize
+            client = PineconeAsyncio(api_key=settings.pinecone_api_key)
+            index = client.IndexAsyncio(host=host, **kwargs)
+            _ASYNC_INDEXES[loop] = index
+    return index
+
+
+async def aclose_async_index() -> None:
+    """현재 이벤트 루프의 IndexAsyncio(aiohttp 세션)를 닫습니다. (asyncio.run 스크립트/테스트 종료 시)"""
+    index = _ASYNC_INDEXES.pop(asyncio.get_running_loop(), None)
+    if index is not None:
+        await index.close()
+
+
+async def asimilarity_search_by_vector_with_score(
+    namespace: str | None,
+    embedding: list[float],
+    k: int = 4,
+    filter: dict | None = None,
+) -> list[tuple[Any, float]]:
+    """
+    네임스페이스에서 벡터와 가장 유사한 문서를 (Document, score) 목록으로 비동기 조회한다.
+
+    langchain_pinecone의 비동기 검색은 스토어에 IndexAsyncio 하나를 캐싱하고 호출이 끝날 때마다
+    aiohttp 세션을 닫기 때문에, 공유 스토어에서 요청이 겹치면 다른 호출의 세션이 닫혀 실패한다.
+    그래서 Pinecone 백엔드는 이벤트 루프마다 하나 연 IndexAsyncio로 직접 조회하고,
+    local 백엔드는 LocalVectorStore의 메모리 검색을 그대로 사용한다.
+    """
+    if _use_local_backend():
+        store = await asyncio.to_thread(_get_local_vectorstore, namespace)
+        return await store.asimilarity_search_by_vector_with_score(embedding, k=k, filter=filter)
+    return await _apinecone_search(namespace, embedding, k, filter)
+
+
+async def _apinecone_search(
+    namespace: str | None, embedding: list[float], k: int, filter: dict | None
+) -> list[tuple[Any, float]]:
+    # 이벤트 루프별 IndexAsyncio로 조회 (세션을 닫지 않으므로 겹치는 요청이 안전하게 공유)
+    from langchain_core.documents import Document
+
+    index = await _get_async_index()
+    response = await index.query(
+        vector=embedding,
+        top_k=k,
+        include_metadata=True,
+        namespace=namespace,
+        filter=filter,
+    )
+
+    # langchain_pinecone과 같은 규칙으로 변환 (text 메타데이터 → page_content, 없으면 건너뜀)
+    docs: list[tuple[Any, float]] = []
+    for match in response["matches"]:
+        metadata = dict(match.get("metadata") or {})
+        text = metadata.pop("text", None)
+        if text is None:
+            continue
+        docs.append(
+            (Document(id=match.get("id"), page_content=text, metadata=metadata), match["score"])
         )
-        return _MAJOR_VECTORSTORE_CACHE
+    return docs
 
 
 def clear_major_index(namespace: str | None = None):
@@ -173,9 +436,20 @@ def clear_major_index(namespace: str | None = None):
         namespace: 비우고 싶은 네임스페이스. None이면 기본값을 사용.
     """
     # 인덱스를 재구축하기 전 기존 벡터를 깨끗하게 제거
+    from .index_sync import clear_manifest
+
+    namespace = namespace if namespace is not None else _get_major_namespace()
+    # 비워진 네임스페이스와 매니페스트가 어긋나지 않도록 함께 삭제
+    clear_manifest(namespace)
+    if _use_local_backend():
+        _get_local_vectorstore(namespace).delete(delete_all=True)
+        mark_vector_index_changed()
+        return
+
+    from pinecone.exceptions import NotFoundException
+
     index = get_major_index()
     delete_kwargs: dict[str, Any] = {"deleteAll": True}
-    namespace = namespace if namespace is not None else _get_major_namespace()
     if namespace:
         delete_kwargs["namespace"] = namespace
     try:
@@ -183,20 +457,13 @@ def clear_major_index(namespace: str | None = None):
     except NotFoundException:
         # 삭제 대상 네임스페이스가 없으면 무시 (이미 비어있는 상태)
         pass
+    mark_vector_index_changed()
 
 
-def index_major_docs(docs: list[MajorDoc]) -> int:
-    """
-    MajorDoc 리스트를 Pinecone 인덱스에 업서트하고 실제로 업로드한 문서 수를 반환한다.
-
-    Args:
-        docs: Pinecone에 저장할 전공 문서(요약, 과목, 진로 등) 목록
-
-    Returns:
-        업서트된 문서 수 (int)
-    """
-    vectorstore = get_major_vectorstore()
-
+def _major_doc_payload(
+    docs: list[MajorDoc],
+) -> tuple[list[str], list[str], list[dict[str, Any]]]:
+    # MajorDoc → (ids, texts, metadatas) 변환 (전체 재구축/증분 동기화 공용)
     texts: list[str] = []
     metadatas: list[dict[str, Any]] = []
     ids: list[str] = []
@@ -234,35 +501,14 @@ def index_major_docs(docs: list[MajorDoc]) -> int:
 
         metadatas.append(meta)
 
-    vectorstore.add_texts(texts=texts, metadatas=metadatas, ids=ids)
-    return len(docs)
-
-
-def index_university_majors(docs: list[Any]) -> int:
-    """
-    UniversityMajorDoc 리스트를 Pinecone의 university_majors 네임스페이스에 인덱싱한다.
+    return ids, texts, metadatas
 
-    Args:
-        docs: UniversityMajorDoc 리스트 (loader.py에서 정의됨)
-    """
-    # 순환 참조 방지를 위해 여기서 임포트하거나 Any로 받음
-    # docs: list[UniversityMajorDoc]
-
-    # 별도 네임스페이스 사용
-    # settings.pinecone_namespace가 "majors"라면, "university_majors"를 직접 하드코딩하거나 설정에서 가져옴
-    target_namespace = "university_majors"
-
-    embeddings = get_embeddings()
-    index = _ensure_major_index(embeddings)
-
-    # 별도의 VectorStore 인스턴스 생성 (네임스페이스가 다르므로)
-    vectorstore = PineconeVectorStore(
-        index=index,
-        embedding=embeddings,
-        text_key="text",
-        namespace=target_namespace,
-    )
 
+def _university_doc_payload(
+    docs: list[Any],
+) -> tuple[list[str], list[str], list[dict[str, Any]]]:
+    # UniversityMajorDoc → (ids, texts, metadatas) 변환
+    # 순환 참조 방지를 위해 Any로 받음 (docs: list[UniversityMajorDoc])
     texts: list[str] = []
     metadatas: list[dict[str, Any]] = []
     ids: list[str] = []
@@ -280,33 +526,114 @@ def index_university_majors(docs: list[Any]) -> int:
         }
         metadatas.append(meta)
 
-    vectorstore.add_texts(texts=texts, metadatas=metadatas, ids=ids)
-    return len(docs)
+    return ids, texts, metadatas
 
 
-def get_university_majors_vectorstore() -> PineconeVectorStore:
+def index_major_docs(docs: list[MajorDoc], resume: bool = True) -> int:
     """
-    대학-학과 검색용 VectorStore 반환 (Namespace: university_majors)
+    MajorDoc 리스트를 Pinecone 인덱스에 업서트하고 실제로 업로드한 문서 수를 반환한다.
+
+    배치 임베딩/병렬 업서트/재시도/체크포인트는 ingestion.ingest_documents()가 처리한다.
+    완료 후에는 증분 동기화의 기준이 되는 매니페스트를 저장한다.
+
+    Args:
+        docs: Pinecone에 저장할 전공 문서(요약, 과목, 진로 등) 목록
+        resume: 중단된 이전 실행의 체크포인트가 있으면 이어서 진행할지 여부
+
+    Returns:
+        업서트된 문서 수 (int)
     """
-    embeddings = get_embeddings()
-    index = _ensure_major_index(embeddings)
-    return PineconeVectorStore(
-        index=index,
-        embedding=embeddings,
-        text_key="text",
-        namespace="university_majors",
+    from .index_sync import record_manifest
+    from .ingestion import ingest_documents
+
+    namespace = _get_major_namespace()
+    ids, texts, metadatas = _major_doc_payload(docs)
+    stats = ingest_documents("majors", namespace, ids, texts, metadatas, resume=resume)
+    record_manifest(namespace, ids, texts, metadatas)
+    mark_vector_index_changed()
+    return stats.indexed_docs + stats.skipped_docs
+
+
+def major_checkpoint_matches(docs: list[MajorDoc]) -> bool:
+    """
+    중단된 전체 재구축의 체크포인트가 지금 docs(문서 ID/내용)로 기록된 것인지 확인한다.
+
+    다르면 이어서 진행할 수 없으므로 네임스페이스를 비우고 처음부터 다시 업서트해야 한다.
+    """
+    from .ingestion import checkpoint_matches
+
+    ids, texts, metadatas = _major_doc_payload(docs)
+    return checkpoint_matches("majors", _get_major_namespace(), ids, texts, metadatas)
+
+
+def sync_major_docs(docs: list[MajorDoc], dry_run: bool = False):
+    """
+    MajorDoc 리스트를 매니페스트와 비교하여 변경/신규 문서만 업서트하고 사라진 문서는 삭제한다.
+
+    인덱스를 비우지 않으므로 동기화 중에도 기존 벡터로 검색이 가능하다.
+
+    Returns:
+        index_sync.SyncResult (추가/변경/유지/삭제 문서 수)
+    """
+    from .index_sync import sync_documents
+
+    ids, texts, metadatas = _major_doc_payload(docs)
+    return sync_documents(
+        "majors", _get_major_namespace(), ids, texts, metadatas, dry_run=dry_run
     )
 
 
-def get_major_category_vectorstore() -> PineconeVectorStore:
+def index_university_majors(docs: list[Any], resume: bool = True) -> int:
     """
-    대분류(표준 학과명) 검색용 VectorStore 반환 (Namespace: major_categories)
+    UniversityMajorDoc 리스트를 Pinecone의 university_majors 네임스페이스에 인덱싱한다.
+
+    Args:
+        docs: UniversityMajorDoc 리스트 (loader.py에서 정의됨)
     """
-    embeddings = get_embeddings()
-    index = _ensure_major_index(embeddings)
-    return PineconeVectorStore(
-        index=index,
-        embedding=embeddings,
-        text_key="text",
-        namespace="major_categories",
+    from .index_sync import record_manifest
+    from .ingestion import ingest_documents
+
+    ids, texts, metadatas = _university_doc_payload(docs)
+    # 별도 네임스페이스(university_majors)에 업서트
+    stats = ingest_documents(
+        "university_majors",
+        UNIVERSITY_MAJORS_NAMESPACE,
+        ids,
+        texts,
+        metadatas,
+        resume=resume,
+    )
+    record_manifest(UNIVERSITY_MAJORS_NAMESPACE, ids, texts, metadatas)
+    mark_vector_index_changed()
+    return stats.indexed_docs + stats.skipped_docs
+
+
+def sync_university_majors(docs: list[Any], dry_run: bool = False):
+    """
+    UniversityMajorDoc 리스트를 university_majors 네임스페이스와 증분 동기화한다.
+    """
+    from .index_sync import sync_documents
+
+    ids, texts, metadatas = _university_doc_payload(docs)
+    return sync_documents(
+        "university_majors",
+        UNIVERSITY_MAJORS_NAMESPACE,
+        ids,
+        texts,
+        metadatas,
+        dry_run=dry_run,
     )
+
+
+def get_university_majors_vectorstore():
+    """
+    대학-학과 검색용 VectorStore 반환 (Namespace: university_majors)
+    """
+    return _get_vectorstore(UNIVERSITY_MAJORS_NAMESPACE)
+
+
+def get_major_category_vectorstore():
+    """
+    대분류(표준 학과명) 검색용 VectorStore 반환 (Namespace: major_categories)
+    """
+    return _get_vectorstore(MAJOR_CATEGORIES_NAMESPACE)
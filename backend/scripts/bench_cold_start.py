@@ -0,0 +1,165 @@
+"""
+콜드 스타트 / import 시간 벤치마크
+
+대상마다 새 파이썬 프로세스를 `python -X importtime`으로 실행해
+프로세스 전체 실행 시간(중앙값)과 import 시간이 큰 최상위 모듈을 보고합니다.
+무거운 의존성(langgraph, LLM SDK, Pinecone, SQLAlchemy 엔진 등)이
+어느 진입점에서 로드되는지도 함께 표시합니다.
+
+사용 예:
+    python backend/scripts/bench_cold_start.py
+    python backend/scripts/bench_cold_start.py --runs 5 --top 15
+    python backend/scripts/bench_cold_start.py --target views --json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+DJANGO_ROOT = os.path.join(PROJECT_ROOT, "unigo")
+
+_DJANGO_SETUP = (
+    "import os, django; "
+    "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'unigo.settings'); "
+    "django.setup(); "
+)
+
+# 이름 → (실행할 코드, 설명)
+TARGETS = {
+    "config": ("import backend.config", "설정 모듈"),
+    "db": ("import backend.db.connection", "DB 연결 모듈 (시드/CLI 스크립트)"),
+    "backend": ("import backend.main", "백엔드 엔트리포인트"),
+    "django": (_DJANGO_SETUP, "Django 앱 로드 (manage.py 명령 공통)"),
+    "views": (_DJANGO_SETUP + "import unigo_app.views", "Django 뷰 로드 (첫 요청 전)"),
+    "chat": (
+        _DJANGO_SETUP + "import backend.main; from backend.graph.nodes import get_llm_with_tools; "
+        "get_llm_with_tools()",
+        "채팅 첫 요청에 필요한 전체 로드 (그래프 + LLM)",
+    ),
+}
+
+# 로드 여부를 추적할 무거운 의존성 (importtime 출력의 모듈 이름)
+HEAVY_MODULES = [
+    "langgraph",
+    "langchain_openai",
+    "langchain_pinecone",
+    "pinecone",
+    "openai",
+    "numpy",
+    "sqlalchemy.ext.asyncio",
+    "backend.main",
+    "backend.db.connection",
+]
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _env():
+    env = dict(os.environ)
+    paths = [DJANGO_ROOT, PROJECT_ROOT]
+    if env.get("PYTHONPATH"):
+        paths.append(env["PYTHONPATH"])
+    env["PYTHONPATH"] = os.pathsep.join(paths)
+    env.setdefault("PYTHONDONTWRITEBYTECODE", "1")
+    return env
+
+
+def parse_importtime(stderr: str):
+    """`-X importtime` 출력 → [(모듈, self_us, cumulative_us, depth), ...]"""
+    rows = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def run_target(name: str, runs: int = 3, top: int = 10) -> dict:
+    code, description = TARGETS[name]
+    walls = []
+    rows = []
+    error = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=DJANGO_ROOT,
+            env=_env(),
+            capture_output=True,
+            text=True,
+        )
+        walls.append(time.perf_counter() - started)
+        rows = parse_importtime(proc.stderr)
+        if proc.returncode != 0:
+            # importtime 이외의 마지막 줄(예외 메시지)을 보고
+            other = [l for l in proc.stderr.splitlines() if not l.startswith("import time:")]
+            error = other[-1] if other else f"exit code {proc.returncode}"
+            break
+
+    loaded = {module for module, _, _, _ in rows}
+    # 최상위 import와 그 직계 하위 모듈 중 누적 시간이 큰 순서
+    top_level = sorted(
+        (row for row in rows if row[3] <= 1), key=lambda row: row[2], reverse=True
+    )
+    return {
+        "target": name,
+        "description": description,
+        "wall_seconds": round(statistics.median(walls), 3),
+        "import_seconds": round(sum(row[1] for row in rows) / 1e6, 3),
+        "modules": len(rows),
+        "heavy_loaded": [module for module in HEAVY_MODULES if module in loaded],
+        "top_imports": [
+            {"module": module, "cumulative_ms": round(cumulative / 1000, 1)}
+            for module, _, cumulative, _ in top_level[:top]
+        ],
+        "error": error,
+    }
+
+
+def print_report(results: list) -> None:
+    print(f"{'target':<10} {'wall(s)':>8} {'import(s)':>10} {'modules':>8}  heavy deps loaded")
+    print("-" * 80)
+    for result in results:
+        heavy = ", ".join(result["heavy_loaded"]) or "-"
+        print(
+            f"{result['target']:<10} {result['wall_seconds']:>8.3f} "
+            f"{result['import_seconds']:>10.3f} {result['modules']:>8}  {heavy}"
+        )
+        if result["error"]:
+            print(f"{'':<10} ⚠️ {result['error']}")
+
+    for result in results:
+        print(f"\n📦 {result['target']} - {result['description']}")
+        for item in result["top_imports"]:
+            print(f"   {item['cumulative_ms']:>9.1f} ms  {item['module']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure cold-start wall time and import cost per entry point."
+    )
+    parser.add_argument(
+        "--target",
+        action="append",
+        choices=list(TARGETS),
+        help="측정할 대상 (여러 번 지정 가능, 기본값: 전체)",
+    )
+    parser.add_argument("--runs", type=int, default=3, help="대상별 실행 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 상위 import 모듈 수")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    results = [run_target(name, args.runs, args.top) for name in (args.target or TARGETS)]
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print_report(results)
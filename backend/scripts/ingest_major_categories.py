@@ -8,8 +8,11 @@ sys.path.append(
 
 from backend.db.connection import get_db
 from backend.db.models import Major
-from backend.rag.vectorstore import get_major_category_vectorstore
-from backend.rag.embeddings import get_embeddings
+from backend.rag.ingestion import ingest_documents
+from backend.rag.vectorstore import (
+    MAJOR_CATEGORIES_NAMESPACE,
+    mark_vector_index_changed,
+)
 
 
 def ingest_major_categories():
@@ -27,12 +30,9 @@ def ingest_major_categories():
             print("⚠️ No majors found. Exiting.")
             return
 
-        # 2. VectorStore 준비
-        vectorstore = get_major_category_vectorstore()
-
         import hashlib
 
-        # 3. 데이터 준비 (Text itself is the major name)
+        # 2. 데이터 준비 (Text itself is the major name)
         texts = major_names
         metadatas = [
             {"major_name": name, "doc_type": "category"} for name in major_names
@@ -40,13 +40,19 @@ def ingest_major_categories():
         # Pinecone IDs must be ASCII (safe). Use MD5 hash of the name.
         ids = [hashlib.md5(name.encode("utf-8")).hexdigest() for name in major_names]
 
-        # 4. 업로드 (배치 처리 권장하지만 300개라 한 번에 가능)
+        # 3. 업로드 (배치 임베딩 + 병렬 업서트, 중단 시 체크포인트부터 재개)
         print(
             "Wait... Embedding and Uploading to Pinecone (namespace='major_categories')..."
         )
-        vectorstore.add_texts(texts=texts, metadatas=metadatas, ids=ids)
+        stats = ingest_documents(
+            "major_categories", MAJOR_CATEGORIES_NAMESPACE, ids, texts, metadatas
+        )
+        # 툴 결과 캐시가 이전 인덱스 기준 결과를 쓰지 않도록 버전 갱신
+        mark_vector_index_changed()
 
-        print(f"🎉 Successfully indexed {len(texts)} major categories.")
+        print(
+            f"🎉 Successfully indexed {stats.indexed_docs + stats.skipped_docs} major categories."
+        )
 
     except Exception as e:
         print(f"❌ Error during ingestion: {e}")
@@ -1,3 +1,4 @@
+import argparse
 import sys
 import os
 from pathlib import Path
@@ -8,11 +9,12 @@ project_root = current_dir.parent.parent
 sys.path.append(str(project_root))
 
 from backend.rag.loader import load_major_detail, build_university_major_docs
-from backend.rag.vectorstore import index_university_majors
+from backend.rag.vectorstore import index_university_majors, sync_university_majors
 
 
-def main():
-    print("🚀 Starting University-Major Ingestion (Full)...")
+def main(full: bool = False):
+    mode = "Full" if full else "Sync"
+    print(f"🚀 Starting University-Major Ingestion ({mode})...")
 
     # 1. Load Data
     print("📥 Loading major details...")
@@ -32,8 +34,13 @@ def main():
     if all_univ_docs:
         print(f"📤 Indexing to Pinecone (Namespace: university_majors)...")
         try:
-            count = index_university_majors(all_univ_docs)
-            print(f"✨ Successfully indexed {count} documents.")
+            if full:
+                count = index_university_majors(all_univ_docs)
+                print(f"✨ Successfully indexed {count} documents.")
+            else:
+                # 매니페스트와 비교하여 바뀐 대학-학과 문서만 업서트, 사라진 문서는 삭제
+                result = sync_university_majors(all_univ_docs)
+                print(f"✨ Successfully synced documents ({result.summary()}).")
         except Exception as e:
             print(f"❌ Indexing Failed: {e}")
             import traceback
@@ -44,4 +51,11 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Index university-major documents.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="매니페스트와 비교하지 않고 모든 문서를 다시 업서트",
+    )
+    args = parser.parse_args()
+    main(full=args.full)
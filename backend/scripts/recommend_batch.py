@@ -0,0 +1,72 @@
+"""
+학급 단위 온보딩 답변 파일(CSV / JSONL)로 전공 추천을 일괄 실행하는 스크립트.
+
+학생별 결과를 처리되는 대로 한 줄씩 JSONL로 출력합니다.
+
+사용 예:
+    python backend/scripts/recommend_batch.py roster.csv
+    python backend/scripts/recommend_batch.py roster.jsonl --output results.jsonl --top 5
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# 프로젝트 루트 경로 추가
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from backend.main import run_major_recommendation_batch
+from backend.onboarding_batch import detect_format, parse_onboarding_records
+
+
+def recommend_batch(input_path: str, output, fmt: str | None = None, top: int = 10) -> int:
+    with open(input_path, "r", encoding="utf-8") as f:
+        records = parse_onboarding_records(f.read(), fmt or detect_format(input_path))
+    print(f"🚀 Recommending majors for {len(records)} students...", file=sys.stderr)
+
+    started = time.perf_counter()
+    cached = 0
+    for result in run_major_recommendation_batch([answers for _, answers in records]):
+        student_id = records[result["index"]][0]
+        cached += int(result.get("from_cache", False))
+        line = {
+            "student_id": student_id,
+            "user_profile_text": result.get("user_profile_text"),
+            "recommended_majors": [
+                {"major_name": major.get("major_name"), "score": major.get("score")}
+                for major in result.get("recommended_majors", [])[:top]
+            ],
+            "from_cache": result.get("from_cache", False),
+        }
+        output.write(json.dumps(line, ensure_ascii=False) + "\n")
+        output.flush()
+
+    print(
+        f"✅ Done: {len(records)} students in {time.perf_counter() - started:.2f}s "
+        f"({cached} from cache)",
+        file=sys.stderr,
+    )
+    return len(records)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run onboarding major recommendations for a CSV/JSONL roster."
+    )
+    parser.add_argument("input", help="온보딩 답변 파일 (.csv 또는 .jsonl)")
+    parser.add_argument("--output", help="결과 JSONL 파일 경로 (기본값: 표준 출력)")
+    parser.add_argument(
+        "--format", choices=["csv", "jsonl"], help="입력 형식 (기본값: 확장자로 판단)"
+    )
+    parser.add_argument("--top", type=int, default=10, help="학생별 출력할 추천 전공 수")
+    args = parser.parse_args()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            recommend_batch(args.input, out, args.format, args.top)
+    else:
+        recommend_batch(args.input, sys.stdout, args.format, args.top)
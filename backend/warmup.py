@@ -0,0 +1,237 @@
+"""
+gunicorn preload용 워밍업 모듈
+
+워커가 첫 요청을 받을 때마다 치르던 초기화 비용(langchain/pinecone import, 그래프 컴파일,
+임베딩 모델/Pinecone 인덱스 확인, MySQL에서 전공 카테고리/카탈로그 로드, LLM 클라이언트 생성)을
+gunicorn master에서 fork 이전에 한 번만 수행합니다.
+
+** 동작 순서 (unigo/gunicorn.conf.py) **
+1. when_ready (master): warm_up() → 각 단계를 실행하고 gc.freeze()로 워밍업된 힙을 고정
+   - 고정된 객체는 이후 GC가 순회하지 않으므로 워커에서 GC가 돌아도 페이지가 복사되지 않아
+     N개의 워커가 읽기 전용 캐시(그래프, 카탈로그, 추천 엔진 행렬 등) 한 벌을 공유합니다.
+2. post_fork (worker): after_fork() → 부모에게서 물려받은 DB/HTTP/SQLite 연결을 워커 전용으로 교체
+
+** 준비 상태 **
+get_warmup_status()가 단계별 성공 여부/소요 시간을 반환하며, Django의 api/health가 이를 노출합니다.
+CLI로 실행하면 같은 보고서를 출력하고 실패한 단계가 있으면 종료 코드 1을 반환합니다.
+
+    python -m backend.warmup
+"""
+
+# backend/warmup.py
+from __future__ import annotations
+
+import gc
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+_STATUS_LOCK = threading.Lock()
+_STATUS: Dict[str, Any] = {
+    "ready": False,
+    "warmed_pid": None,
+    "started_at": None,
+    "total_seconds": None,
+    "frozen_objects": 0,
+    "steps": {},
+}
+
+
+# ==================== 워밍업 단계 ====================
+# 각 단계는 프로세스 전역 싱글톤/캐시를 채우는 함수이며, 반환값(문자열)은 보고서에 요약으로 남습니다.
+
+
+def _warm_imports() -> str:
+    # langgraph / langchain / pinecone 등 무거운 모듈을 한 번에 import
+    import backend.main  # noqa: F401
+
+    return f"{len(sys.modules)} modules loaded"
+
+
+def _warm_llm() -> str:
+    from backend.graph.nodes import get_llm_with_tools, get_node_llm
+
+    get_llm_with_tools()
+    return type(get_node_llm()).__name__
+
+
+def _warm_graphs() -> str:
+    from backend.main import get_graph
+
+    get_graph("react")
+    get_graph("major")
+    return "react, major"
+
+
+def _warm_embeddings() -> str:
+    from backend.rag.embeddings import get_embeddings
+
+    return type(get_embeddings()).__name__
+
+
+def _warm_vectorstores() -> str:
+    # Pinecone 백엔드는 공유 클라이언트/인덱스 핸들(list_indexes)과 네임스페이스별 스토어까지, local 백엔드는 스냅샷 행렬을 로드
+    from backend.rag.vectorstore import (
+        get_major_category_vectorstore,
+        get_major_vectorstore,
+        get_university_majors_vectorstore,
+    )
+
+    get_major_vectorstore()
+    get_university_majors_vectorstore()
+    get_major_category_vectorstore()
+    return "majors, university_majors, major_categories"
+
+
+def _warm_main_categories() -> str:
+    from backend.rag import tools
+
+    # 로드 실패 시 빈 결과는 캐싱되지 않으므로 워커가 첫 사용 시 다시 시도함
+    categories = tools.warm_main_categories()
+    if not categories:
+        raise RuntimeError("no major categories loaded from DB")
+    return f"{len(categories)} categories"
+
+
+def _warm_major_catalog() -> str:
+    from backend.rag.major_catalog import get_major_catalog
+
+    get_major_catalog()
+    return "loaded"
+
+
+def _warm_career_info() -> str:
+    from backend.rag.career_info_store import get_career_info_store
+
+    return f"{len(get_career_info_store())} majors"
+
+
+def _warm_recommendation_engine() -> str:
+    from backend.config import get_settings
+    from backend.rag.recommendation_engine import get_recommendation_engine
+
+    if get_settings().recommendation_engine.lower() != "exact":
+        return "disabled (RECOMMENDATION_ENGINE=vector)"
+    if get_recommendation_engine() is None:
+        raise RuntimeError("corpus unavailable, falling back to vector search")
+    return "loaded"
+
+
+WARMUP_STEPS: List[Tuple[str, Callable[[], str]]] = [
+    ("imports", _warm_imports),
+    ("llm", _warm_llm),
+    ("graphs", _warm_graphs),
+    ("embeddings", _warm_embeddings),
+    ("vectorstores", _warm_vectorstores),
+    ("main_categories", _warm_main_categories),
+    ("major_catalog", _warm_major_catalog),
+    ("career_info", _warm_career_info),
+    ("recommendation_engine", _warm_recommendation_engine),
+]
+
+
+def warm_up(freeze: bool = True) -> Dict[str, Any]:
+    """
+    모든 워밍업 단계를 실행하고 준비 상태 보고서를 반환합니다.
+
+    한 단계가 실패해도(MySQL/Pinecone 일시 장애 등) 나머지 단계는 계속 실행하며,
+    실패한 항목은 워커가 첫 사용 시 기존처럼 지연 초기화합니다.
+
+    Args:
+        freeze: True면 마지막에 gc.collect() 후 gc.freeze()로 워밍업된 힙을 고정 (fork 직전 호출용)
+    """
+    started = time.perf_counter()
+    steps: Dict[str, Dict[str, Any]] = {}
+
+    for name, step in WARMUP_STEPS:
+        step_started = time.perf_counter()
+        try:
+            detail = step()
+            steps[name] = {"ok": True, "detail": detail}
+        except Exception as e:
+            message = str(e).strip().splitlines()[0] if str(e).strip() else ""
+            steps[name] = {"ok": False, "error": f"{type(e).__name__}: {message}"}
+        steps[name]["seconds"] = round(time.perf_counter() - step_started, 3)
+
+        mark = "✅" if steps[name]["ok"] else "⚠️"
+        print(
+            f"{mark} Warmup {name}: "
+            f"{steps[name].get('detail') or steps[name].get('error')} "
+            f"({steps[name]['seconds']:.2f}s)"
+        )
+
+    frozen = 0
+    if freeze:
+        gc.collect()
+        gc.freeze()
+        frozen = gc.get_freeze_count()
+
+    failed = [name for name, step in steps.items() if not step["ok"]]
+    with _STATUS_LOCK:
+        _STATUS.update(
+            ready=not failed,
+            warmed_pid=os.getpid(),
+            started_at=time.time(),
+            total_seconds=round(time.perf_counter() - started, 3),
+            frozen_objects=frozen,
+            steps=steps,
+        )
+
+    print(
+        f"🔥 Warmup finished in {_STATUS['total_seconds']:.2f}s "
+        f"({len(steps) - len(failed)}/{len(steps)} steps ok, {frozen} objects frozen)"
+    )
+    return get_warmup_status()
+
+
+def after_fork() -> None:
+    """
+    gunicorn post_fork 훅에서 호출: 부모 프로세스에서 만든 연결을 워커 전용으로 교체합니다.
+
+    아직 import되지 않은 모듈은 건드리지 않으므로 워밍업 없이 실행된 경우에도 안전합니다.
+    LLM 클라이언트(get_llm 레지스트리)는 인스턴스를 유지한 채 공유 커넥션 풀만 워커 전용으로 새로 만듭니다.
+    """
+    connection = sys.modules.get("backend.db.connection")
+    if connection is not None:
+        connection.reset_after_fork()
+
+    config = sys.modules.get("backend.config")
+    if config is not None:
+        config.reset_llm_connections()
+
+    embeddings = sys.modules.get("backend.rag.embeddings")
+    if embeddings is not None:
+        embeddings.reset_embedding_connections()
+
+    # 임베딩/툴 결과/LLM 검증/답변 캐시 등 열려 있는 SQLite 디스크 캐시 연결
+    sqlite_store = sys.modules.get("backend.rag.sqlite_store")
+    if sqlite_store is not None:
+        sqlite_store.reopen_all_stores()
+
+    vectorstore = sys.modules.get("backend.rag.vectorstore")
+    if vectorstore is not None:
+        vectorstore.reset_after_fork()
+
+
+def get_warmup_status() -> Dict[str, Any]:
+    """
+    워밍업 준비 상태 (api/health 응답용)
+
+    - ready: 워밍업이 실행되었고 모든 단계가 성공했는지
+    - warmed_pid: 워밍업을 실행한 프로세스 (preload 시 gunicorn master의 PID)
+    - pid: 현재 프로세스 PID
+    """
+    with _STATUS_LOCK:
+        status = json.loads(json.dumps(_STATUS))
+    status["pid"] = os.getpid()
+    status["preloaded"] = status["warmed_pid"] not in (None, status["pid"])
+    return status
+
+
+if __name__ == "__main__":
+    report = warm_up(freeze=False)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    sys.exit(0 if report["ready"] else 1)
@@ -0,0 +1,37 @@
+"""
+Gunicorn 설정 (unigo/ 디렉토리에서 실행하면 자동으로 로드됨)
+
+    gunicorn unigo.asgi:application
+
+GUNICORN_PRELOAD=true(기본값)이면 master가 fork 전에 Django 앱과 백엔드(backend.warmup)를
+미리 로드하므로, 새 워커도 첫 요청부터 정상 지연 시간으로 응답하고 워커끼리 읽기 전용 캐시를 공유합니다.
+"""
+
+import os
+import sys
+
+# backend 패키지 import를 위해 프로젝트 루트를 경로에 추가 (views.py와 동일)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("GUNICORN_WORKERS", "2"))
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+
+
+def when_ready(server):
+    # master에서 워커를 fork하기 직전에 한 번 실행
+    if not server.cfg.preload_app:
+        return
+    from backend.warmup import warm_up
+
+    warm_up(freeze=True)
+
+
+def post_fork(server, worker):
+    # 부모(master)에게서 물려받은 DB/HTTP/SQLite 연결을 워커 전용으로 교체
+    from backend.warmup import after_fork
+
+    after_fork()
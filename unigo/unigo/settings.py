@@ -149,6 +149,18 @@ LOGOUT_REDIRECT_URL = "unigo_app:chat"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR.parent / "media"
 
+# SSE 스트리밍 설정 (토큰 delta 프레임 병합)
+SSE_COALESCE_WINDOW_MS = int(os.getenv("SSE_COALESCE_WINDOW_MS", "40"))  # 0이면 병합하지 않음
+SSE_COALESCE_MAX_BYTES = int(os.getenv("SSE_COALESCE_MAX_BYTES", "2048"))
+
+# 온보딩 일괄 추천 API 제한 (api/onboarding/batch, 스태프 계정 전용)
+ONBOARDING_BATCH_MAX_UPLOAD_BYTES = int(
+    os.getenv("ONBOARDING_BATCH_MAX_UPLOAD_BYTES", str(2 * 1024 * 1024))
+)  # 업로드 파일 크기 상한
+ONBOARDING_BATCH_RECORDS_PER_HOUR = int(
+    os.getenv("ONBOARDING_BATCH_RECORDS_PER_HOUR", "2000")
+)  # 사용자별 1시간 처리 학생 수 (0이면 제한하지 않음)
+
 # Logging Configuration
 LOGS_DIR = BASE_DIR / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
@@ -6,6 +6,7 @@ from .models import (
     Major,
     MajorCategory,
     University,
+    UniversityMajorOffering,
 )
 
 
@@ -66,8 +67,14 @@ class MessageAdmin(admin.ModelAdmin):
 
 @admin.register(MajorRecommendation)
 class MajorRecommendationAdmin(admin.ModelAdmin):
-    list_display = ("id", "get_user_display", "get_preferred_majors", "created_at")
-    list_filter = ("created_at",)
+    list_display = (
+        "id",
+        "get_user_display",
+        "get_preferred_majors",
+        "served_from_cache",
+        "created_at",
+    )
+    list_filter = ("served_from_cache", "created_at")
     search_fields = ("session_id", "user__username")
     readonly_fields = ("created_at",)
 
@@ -119,3 +126,9 @@ class MajorCategoryAdmin(admin.ModelAdmin):
 class UniversityAdmin(admin.ModelAdmin):
     list_display = ("name", "code", "url")
     search_fields = ("name", "code")
+
+
+@admin.register(UniversityMajorOffering)
+class UniversityMajorOfferingAdmin(admin.ModelAdmin):
+    list_display = ("school", "department", "campus", "area")
+    search_fields = ("school", "department")
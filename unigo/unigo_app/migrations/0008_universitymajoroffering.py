@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-18 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('unigo_app', '0007_major_majorcategory_university'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UniversityMajorOffering',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('school', models.CharField(help_text='대학명', max_length=255)),
+                ('department', models.CharField(help_text='개설 학과명', max_length=255)),
+                ('campus', models.CharField(blank=True, help_text='캠퍼스', max_length=100, null=True)),
+                ('area', models.CharField(blank=True, help_text='지역', max_length=100, null=True)),
+                ('url', models.CharField(blank=True, help_text='대학 URL', max_length=500, null=True)),
+            ],
+            options={
+                'verbose_name': '학과 개설 정보 (Offering)',
+                'verbose_name_plural': '학과 개설 정보 목록',
+                'db_table': 'university_major_offerings',
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.9 on 2026-10-18 01:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('unigo_app', '0008_universitymajoroffering'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MajorAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias_normalized', models.CharField(help_text='정규화된 별칭 (공백 제거, 소문자)', max_length=255, unique=True)),
+                ('alias', models.CharField(help_text='별칭 원본 표기', max_length=255)),
+                ('source', models.CharField(help_text='출처 (alias/category)', max_length=20)),
+            ],
+            options={
+                'verbose_name': '학과 별칭 (Alias)',
+                'verbose_name_plural': '학과 별칭 목록',
+                'db_table': 'major_aliases',
+                'managed': False,
+            },
+        ),
+    ]
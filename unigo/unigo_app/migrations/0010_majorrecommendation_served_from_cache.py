@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 01:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('unigo_app', '0009_majoralias'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='majorrecommendation',
+            name='served_from_cache',
+            field=models.BooleanField(default=False, help_text='같은 답변 조합의 캐시된 추천 결과를 사용했는지 여부'),
+        ),
+    ]
@@ -119,6 +119,9 @@ class MajorRecommendation(models.Model):
         help_text="온보딩 질문 답변 (subjects, interests, desired_salary, preferred_majors)"
     )
     recommended_majors = models.JSONField(help_text="추천된 전공 목록 및 점수")
+    served_from_cache = models.BooleanField(
+        default=False, help_text="같은 답변 조합의 캐시된 추천 결과를 사용했는지 여부"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -225,6 +228,66 @@ class University(models.Model):
         return self.name
 
 
+class UniversityMajorOffering(models.Model):
+    """
+    대학별 학과 개설 정보 모델 (SQLAlchemy 관리 테이블)
+    Table: university_major_offerings
+    """
+
+    major = models.ForeignKey(
+        Major,
+        to_field="major_id",
+        db_column="major_id",
+        on_delete=models.DO_NOTHING,
+        related_name="offerings",
+        help_text="표준 전공",
+    )
+    school = models.CharField(max_length=255, help_text="대학명")
+    department = models.CharField(max_length=255, help_text="개설 학과명")
+    campus = models.CharField(max_length=100, null=True, blank=True, help_text="캠퍼스")
+    area = models.CharField(max_length=100, null=True, blank=True, help_text="지역")
+    url = models.CharField(max_length=500, null=True, blank=True, help_text="대학 URL")
+
+    class Meta:
+        managed = False
+        db_table = "university_major_offerings"
+        verbose_name = "학과 개설 정보 (Offering)"
+        verbose_name_plural = "학과 개설 정보 목록"
+
+    def __str__(self):
+        return f"{self.school} {self.department}"
+
+
+class MajorAlias(models.Model):
+    """
+    학과 별칭 → 표준 전공 매핑 모델 (SQLAlchemy 관리 테이블)
+    Table: major_aliases
+    """
+
+    alias_normalized = models.CharField(
+        max_length=255, unique=True, help_text="정규화된 별칭 (공백 제거, 소문자)"
+    )
+    alias = models.CharField(max_length=255, help_text="별칭 원본 표기")
+    major = models.ForeignKey(
+        Major,
+        to_field="major_id",
+        db_column="major_id",
+        on_delete=models.DO_NOTHING,
+        related_name="aliases",
+        help_text="표준 전공",
+    )
+    source = models.CharField(max_length=20, help_text="출처 (alias/category)")
+
+    class Meta:
+        managed = False
+        db_table = "major_aliases"
+        verbose_name = "학과 별칭 (Alias)"
+        verbose_name_plural = "학과 별칭 목록"
+
+    def __str__(self):
+        return self.alias
+
+
 # ============================================
 # User Profile
 # ============================================
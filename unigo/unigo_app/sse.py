@@ -0,0 +1,125 @@
+"""
+SSE 프레임 병합(Coalescing) 유틸리티
+
+LangGraph "messages" 스트림은 토큰 조각마다 청크를 내보내므로, 조각마다 `data:` 프레임을 쓰면
+답변 하나에 수천 번의 작은 write가 gunicorn/nginx를 거치게 됩니다.
+SSECoalescer는 delta 조각을 모아 두었다가 시간 창(SSE_COALESCE_WINDOW_MS) 또는
+크기(SSE_COALESCE_MAX_BYTES)를 넘으면 하나의 delta 프레임으로 내보냅니다.
+
+- 프론트엔드는 delta의 content를 이어 붙이기만 하므로 병합해도 화면 결과는 같습니다.
+- status / error 등 delta가 아닌 이벤트와 스트림 종료 시에는 모아 둔 delta를 먼저 즉시 내보냅니다.
+- 프레임/바이트 수는 인스턴스와 프로세스 전체(get_sse_stats)로 집계합니다.
+"""
+
+import json
+import threading
+import time
+
+from django.conf import settings
+
+# 프로세스 전체 누적 카운터 (모니터링용)
+_STATS_LOCK = threading.Lock()
+_STATS = {"streams": 0, "deltas_in": 0, "frames_out": 0, "bytes_out": 0}
+
+
+def format_sse(payload: dict) -> str:
+    """SSE data 프레임 문자열 (기존 뷰와 같은 json.dumps 기본 옵션 사용)"""
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def get_sse_stats() -> dict:
+    """프로세스 전체 SSE 프레임/바이트 누적 값"""
+    with _STATS_LOCK:
+        stats = dict(_STATS)
+    stats["deltas_per_frame"] = (
+        round(stats["deltas_in"] / stats["frames_out"], 2) if stats["frames_out"] else 0.0
+    )
+    return stats
+
+
+class SSECoalescer:
+    """
+    delta 조각을 모아 SSE 프레임으로 내보내는 버퍼 (스트림 하나당 인스턴스 하나).
+
+    각 메서드는 지금 내보내야 할 프레임 문자열 목록을 반환합니다.
+
+        coalescer = SSECoalescer()
+        for frame in coalescer.delta("안녕"):
+            yield frame
+        for frame in coalescer.event({"type": "status", "content": "..."}):
+            yield frame
+        for frame in coalescer.close():
+            yield frame
+    """
+
+    def __init__(self, window_ms=None, max_bytes=None, clock=time.monotonic):
+        if window_ms is None:
+            window_ms = getattr(settings, "SSE_COALESCE_WINDOW_MS", 40)
+        if max_bytes is None:
+            max_bytes = getattr(settings, "SSE_COALESCE_MAX_BYTES", 2048)
+        self.window = max(window_ms, 0) / 1000
+        self.max_bytes = max_bytes
+        self._clock = clock
+
+        self._parts = []
+        self._pending_bytes = 0
+        self._started_at = None
+        self._closed = False
+
+        # 스트림 단위 카운터
+        self.deltas_in = 0
+        self.frames_out = 0
+        self.bytes_out = 0
+
+    def _emit(self, payload: dict) -> str:
+        frame = format_sse(payload)
+        self.frames_out += 1
+        self.bytes_out += len(frame.encode("utf-8"))
+        return frame
+
+    def flush(self) -> list:
+        """모아 둔 delta를 하나의 프레임으로 내보냅니다."""
+        if not self._parts:
+            return []
+        content = "".join(self._parts)
+        self._parts = []
+        self._pending_bytes = 0
+        self._started_at = None
+        return [self._emit({"type": "delta", "content": content})]
+
+    def delta(self, content: str) -> list:
+        """delta 조각을 버퍼에 추가하고, 시간 창/크기를 넘었으면 프레임을 반환합니다."""
+        if not content:
+            return []
+        self.deltas_in += 1
+        now = self._clock()
+        if self._started_at is None:
+            self._started_at = now
+        self._parts.append(content)
+        self._pending_bytes += len(content.encode("utf-8"))
+
+        if (
+            self.window == 0
+            or now - self._started_at >= self.window
+            or self._pending_bytes >= self.max_bytes
+        ):
+            return self.flush()
+        return []
+
+    def event(self, payload: dict) -> list:
+        """delta가 아닌 이벤트(status/error 등): 버퍼를 먼저 비우고 즉시 내보냅니다."""
+        frames = self.flush()
+        frames.append(self._emit(payload))
+        return frames
+
+    def close(self) -> list:
+        """스트림 종료: 남은 delta를 내보내고 누적 카운터에 반영합니다."""
+        frames = self.flush()
+        if not self._closed:
+            self._closed = True
+            with _STATS_LOCK:
+                _STATS["streams"] += 1
+                _STATS["deltas_in"] += self.deltas_in
+                _STATS["frames_out"] += self.frames_out
+                _STATS["bytes_out"] += self.bytes_out
+        return frames
@@ -1,3 +1,692 @@
-from django.test import TestCase
+import asyncio
+import json
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import AsyncRequestFactory, RequestFactory, SimpleTestCase, override_settings
+
+# views import 시 backend 패키지 경로가 sys.path에 추가됨
+from . import views  # noqa: F401
+
+
+class _FakeAsyncIndex:
+    """겹치는 호출 중 세션이 닫히면 실패하는 IndexAsyncio 대역"""
+
+    def __init__(self):
+        self.closed = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def query(self, vector, top_k, include_metadata, namespace, filter):
+        if self.closed:
+            raise RuntimeError("Session is closed")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if self.closed:
+            raise RuntimeError("Session is closed")
+        return {
+            "matches": [
+                {"id": f"{namespace}-1", "score": 0.9, "metadata": {"text": "컴퓨터공학과", "major_id": "1"}}
+            ]
+        }
+
+    async def close(self):
+        self.closed = True
+
+
+class AsyncVectorSearchTests(SimpleTestCase):
+    def setUp(self):
+        from backend.rag import vectorstore
+
+        self.vectorstore = vectorstore
+        self.created = []
+
+        def open_index(**kwargs):
+            index = _FakeAsyncIndex()
+            self.created.append(index)
+            return index
+
+        fake_client = SimpleNamespace(IndexAsyncio=lambda host, **kwargs: open_index())
+        patches = [
+            mock.patch.object(vectorstore, "_use_local_backend", return_value=False),
+            mock.patch.object(
+                vectorstore,
+                "get_major_index",
+                return_value=SimpleNamespace(config=SimpleNamespace(host="majors.svc")),
+            ),
+            mock.patch("pinecone.PineconeAsyncio", return_value=fake_client),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(vectorstore.reset)
+
+    async def test_overlapping_searches_share_one_open_index(self):
+        search = self.vectorstore.asimilarity_search_by_vector_with_score
+        results = await asyncio.gather(
+            *(search(f"ns{i}", [0.1, 0.2], k=3) for i in range(5))
+        )
+
+        self.assertEqual(len(self.created), 1)
+        index = self.created[0]
+        self.assertFalse(index.closed)
+        self.assertGreater(index.max_in_flight, 1)
+        for i, docs in enumerate(results):
+            doc, score = docs[0]
+            self.assertEqual(doc.page_content, "컴퓨터공학과")
+            self.assertEqual(doc.metadata, {"major_id": "1"})
+            self.assertEqual(doc.id, f"ns{i}-1")
+            self.assertEqual(score, 0.9)
+
+        await self.vectorstore.aclose_async_index()
+        self.assertTrue(index.closed)
+
+    async def test_shared_registry_store_async_search_does_not_close_index(self):
+        from langchain_core.embeddings import FakeEmbeddings
+
+        sync_index = SimpleNamespace(config=SimpleNamespace(host="majors.svc", api_key="k"))
+        with mock.patch.object(self.vectorstore, "_ensure_major_index", return_value=sync_index), \
+                mock.patch.object(self.vectorstore, "get_embeddings", return_value=FakeEmbeddings(size=2)):
+            store = self.vectorstore.get_major_category_vectorstore()
+            self.assertIs(store, self.vectorstore.get_major_category_vectorstore())
+            results = await asyncio.gather(
+                *(store.asimilarity_search_by_vector([0.1, 0.2], k=3) for _ in range(5))
+            )
+
+        self.assertEqual(len(self.created), 1)
+        self.assertFalse(self.created[0].closed)
+        self.assertEqual([docs[0].id for docs in results], ["major_categories-1"] * 5)
+
+    def test_each_event_loop_gets_its_own_index(self):
+        search = self.vectorstore.asimilarity_search_by_vector_with_score
+
+        async def run():
+            await search("majors", [0.1], k=1)
+            await self.vectorstore.aclose_async_index()
+
+        asyncio.run(run())
+        asyncio.run(run())
+        self.assertEqual(len(self.created), 2)
+
+
+class ToolResultCacheTests(SimpleTestCase):
+    def setUp(self):
+        from backend.rag import tool_cache
+        from backend.rag.kv_cache import TTLCache
+
+        self.tool_cache = tool_cache
+        self.shared = TTLCache("test_tool_results")
+        patches = [
+            mock.patch.object(tool_cache, "_get_shared_cache", return_value=self.shared),
+            mock.patch.object(tool_cache, "get_cached_data_versions", return_value={"majors": 1}),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _counting_tool(self, result_for):
+        calls = []
+
+        @self.tool_cache.cached_tool(60, datasets=("majors",))
+        def lookup(query: str):
+            calls.append(query)
+            return result_for(query)
+
+        return lookup, calls
+
+    def test_successful_and_no_result_answers_are_shared(self):
+        lookup, calls = self._counting_tool(
+            lambda query: [{"error": "no_results"}] if query == "없음" else ["컴퓨터공학과"]
+        )
+        for _ in range(2):
+            lookup("컴퓨터")
+            lookup("없음")
+        self.assertEqual(calls, ["컴퓨터", "없음"])
+
+    def test_transient_errors_are_not_shared(self):
+        lookup, calls = self._counting_tool(lambda query: [{"error": "db_error"}])
+        lookup("컴퓨터")
+        lookup("컴퓨터")
+        self.assertEqual(calls, ["컴퓨터", "컴퓨터"])
+
+    def test_degraded_results_are_not_shared(self):
+        def degraded(query):
+            self.tool_cache.mark_result_degraded("major_vector skipped")
+            return []
+
+        lookup, calls = self._counting_tool(degraded)
+        lookup("컴퓨터")
+        lookup("컴퓨터")
+        self.assertEqual(calls, ["컴퓨터", "컴퓨터"])
+
+        # 툴 실행 밖의 표시는 무시됨
+        self.tool_cache.mark_result_degraded("outside")
+
+    def test_concurrent_counter_updates_are_not_lost(self):
+        lookup, _ = self._counting_tool(lambda query: {"error": "timeout"})
+        before = self.tool_cache.get_tool_cache_stats()
+
+        def run():
+            # 스레드마다 새 실행 스코프: 첫 호출은 오류 결과(미저장), 이후는 실행 단위 메모 적중
+            with self.tool_cache.tool_run_scope():
+                for _ in range(300):
+                    lookup("컴퓨터")
+
+        with mock.patch("builtins.print"):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                for future in [pool.submit(run) for _ in range(4)]:
+                    future.result()
+
+        after = self.tool_cache.get_tool_cache_stats()
+        self.assertEqual(after["run_memo_hits"] - before["run_memo_hits"], 4 * 299)
+        self.assertEqual(after["uncached_results"] - before["uncached_results"], 4)
+
+
+class OnboardingBatchStreamTests(SimpleTestCase):
+    def setUp(self):
+        self.received = []
+        self.produced_after_first_line = None
+
+        def run_batch(answers_list):
+            yield {"index": 0, "recommended_majors": [{"major_name": "컴퓨터공학과"}]}
+            # 버퍼링되면 첫 줄이 클라이언트에 도착하기 전에 다음 결과를 계산하게 됨
+            self.produced_after_first_line = bool(self.received)
+            yield {"index": 1, "recommended_majors": []}
+
+        patcher = mock.patch.object(views, "_backend", return_value=run_batch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(cache.clear)
+
+    async def test_asgi_streams_each_student_as_it_is_ready(self):
+        request = AsyncRequestFactory().post(
+            "/api/onboarding/batch",
+            data="student_id,interests\ns1,코딩\ns2,음악\n",
+            content_type="text/csv",
+        )
+        request.user = SimpleNamespace(is_authenticated=True, is_staff=True, pk=1)
+        response = await sync_to_async(views.onboarding_batch_api)(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        async for chunk in response.streaming_content:
+            self.received.append(json.loads(chunk))
+
+        self.assertTrue(self.produced_after_first_line)
+        self.assertEqual([line["student_id"] for line in self.received], ["s1", "s2"])
+
+
+class OnboardingBatchAccessTests(SimpleTestCase):
+    CSV = "student_id,interests\ns1,코딩\ns2,음악\ns3,미술\n"
+
+    def setUp(self):
+        self.run_batch = mock.Mock(
+            side_effect=lambda answers_list: iter(
+                {"index": i} for i in range(len(answers_list))
+            )
+        )
+        patcher = mock.patch.object(views, "_backend", return_value=self.run_batch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(cache.clear)
+
+    def _post(self, is_staff, user_id=1):
+        request = RequestFactory().post(
+            "/api/onboarding/batch", data=self.CSV, content_type="text/csv"
+        )
+        request.user = SimpleNamespace(is_authenticated=True, is_staff=is_staff, pk=user_id)
+        response = views.onboarding_batch_api(request)
+        if response.streaming:
+            b"".join(response.streaming_content)
+        return response
+
+    def test_non_staff_user_is_forbidden(self):
+        response = self._post(is_staff=False)
+
+        self.assertEqual(response.status_code, 403)
+        self.run_batch.assert_not_called()
+
+    @override_settings(ONBOARDING_BATCH_RECORDS_PER_HOUR=5)
+    def test_hourly_record_limit_is_per_user(self):
+        self.assertEqual(self._post(is_staff=True).status_code, 200)
+        self.assertEqual(self._post(is_staff=True).status_code, 429)
+        self.assertEqual(self._post(is_staff=True, user_id=2).status_code, 200)
+        self.assertEqual(self.run_batch.call_count, 2)
+
+
+class FindMajorsStageDeadlineTests(SimpleTestCase):
+    def setUp(self):
+        from backend.rag import tool_cache, tools
+
+        self.tools = tools
+        self.degraded = []
+        token = tool_cache._DEGRADED.set(self.degraded)
+        self.addCleanup(tool_cache._DEGRADED.reset, token)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        patcher = mock.patch.object(tools, "_STAGE_EXECUTOR", executor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_late_stage_is_cancelled_and_marked_degraded(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        queued = mock.Mock(return_value=["late"])
+        deadline = time.monotonic() + 0.05
+
+        self.tools._submit_stage(deadline, release.wait, 5)
+        future = self.tools._submit_stage(deadline, queued)
+        result = self.tools._stage_result(future, deadline, "major_vector", [])
+
+        self.assertEqual(result, [])
+        self.assertTrue(future.cancelled())
+        queued.assert_not_called()
+        self.assertEqual(self.degraded, ["major_vector missed the deadline"])
+
+    async def test_late_async_stage_is_cancelled(self):
+        task = asyncio.ensure_future(asyncio.sleep(5))
+        result = await self.tools._await_stage(
+            task, time.monotonic() + 0.01, "llm_verify", None
+        )
+
+        self.assertIsNone(result)
+        self.assertTrue(task.cancelled())
+        self.assertEqual(self.degraded, ["llm_verify missed the deadline"])
+
+
+class EnsureFieldsTests(SimpleTestCase):
+    def _record(self, major_id):
+        from backend.rag.loader import MajorRecord
+
+        return MajorRecord(
+            major_id=major_id, major_name=f"전공{major_id}", cluster=None, summary="",
+            interest="", property="", relate_subject=None, job="", enter_field=None,
+            salary=None, loaded_columns=frozenset(),
+        )
+
+    def test_slow_fetch_does_not_block_other_majors(self):
+        from backend.rag import major_catalog
+
+        release = threading.Event()
+        self.addCleanup(release.set)
+        fetching = threading.Event()
+
+        def execute(statement):
+            if not fetching.is_set():
+                fetching.set()
+                release.wait(5)
+            return SimpleNamespace(first=lambda: ("개발자", '["IT"]'))
+
+        session = SimpleNamespace(execute=execute, close=lambda: None)
+        slow, fast = self._record("1"), self._record("2")
+        with mock.patch.object(major_catalog, "SessionLocal", return_value=session):
+            worker = threading.Thread(target=major_catalog.ensure_fields, args=(slow, "jobs"))
+            worker.start()
+            fetching.wait(5)
+            major_catalog.ensure_fields(fast, "jobs")
+            self.assertFalse(slow.loaded_columns)
+            release.set()
+            worker.join(5)
+
+        for record in (slow, fast):
+            self.assertEqual(record.job, "개발자")
+            self.assertEqual(record.enter_field, ["IT"])
+            self.assertEqual(record.loaded_columns, frozenset({"job", "enter_field"}))
+
+
+class MajorIndexCheckpointTests(SimpleTestCase):
+    DOC = (["major-1"], ["컴퓨터공학과 요약"], [{"major_id": "1"}])
+
+    def setUp(self):
+        from backend.rag import build_major_index, ingestion
+
+        self.ingestion = ingestion
+        self.build = build_major_index
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "majors.json"
+        patcher = mock.patch.object(ingestion, "get_checkpoint_path", return_value=self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _leave_checkpoint(self, ids, texts, metadatas):
+        fingerprint = self.ingestion._fingerprint(
+            "majors", ids, texts, metadatas, self.ingestion._resolve_batch_size(None)
+        )
+        self.ingestion.IngestCheckpoint(self.path, fingerprint).mark([0])
+
+    def test_checkpoint_fingerprint_covers_document_content(self):
+        ids, texts, metadatas = self.DOC
+        self._leave_checkpoint(ids, texts, metadatas)
+
+        self.assertTrue(self.ingestion.checkpoint_matches("majors", "majors", ids, texts, metadatas))
+        self.assertFalse(
+            self.ingestion.checkpoint_matches("majors", "majors", ids, ["바뀐 요약"], metadatas)
+        )
+
+    def _rebuild(self, matches):
+        module = self.build
+        with mock.patch.object(module, "load_major_detail", return_value=[]), \
+                mock.patch.object(module, "build_all_major_docs", return_value=[]), \
+                mock.patch.object(module, "get_major_vectorstore"), \
+                mock.patch.object(module, "major_checkpoint_matches", return_value=matches), \
+                mock.patch.object(module, "index_major_docs", return_value=0), \
+                mock.patch.object(module, "clear_major_index") as clear_index:
+            module.rebuild_major_index()
+        return clear_index
+
+    def test_rebuild_resumes_matching_checkpoint(self):
+        self._leave_checkpoint(*self.DOC)
+
+        self._rebuild(matches=True).assert_not_called()
+        self.assertTrue(self.path.exists())
+
+    def test_rebuild_clears_namespace_for_stale_checkpoint(self):
+        self._leave_checkpoint(*self.DOC)
+
+        self._rebuild(matches=False).assert_called_once()
+        self.assertFalse(self.path.exists())
+
+
+class LLMConnectionResetTests(SimpleTestCase):
+    def setUp(self):
+        from backend import config
+
+        self.config = config
+        for registry in (config._LLM_CLIENTS, config._LLM_HTTP_CLIENTS):
+            patcher = mock.patch.dict(registry, clear=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_after_fork_swaps_pools_but_keeps_llm_instances(self):
+        from backend import warmup
+
+        with mock.patch.dict("os.environ", {"LLM_PROVIDER": "openai", "OPENAI_API_KEY": "x"}):
+            llm = self.config.get_llm()
+            parent_client = llm.http_client
+            warmup.after_fork()
+
+            self.assertIs(self.config.get_llm(), llm)
+            self.assertIsNot(llm.http_client, parent_client)
+            self.assertIs(llm.http_client, self.config._LLM_HTTP_CLIENTS[""][0])
+            self.assertIs(llm.root_client._client, llm.http_client)
+
+    def test_health_reports_llm_client_stats(self):
+        response = views.health(RequestFactory().get("/api/health"))
+
+        self.assertIn("connection_reuse_rate", json.loads(response.content)["llm_clients"])
+
+
+class SQLiteStoreTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def test_stores_share_eviction_and_reopen(self):
+        from backend.rag import sqlite_store
+        from backend.rag.embedding_cache import SQLiteEmbeddingStore
+        from backend.rag.kv_cache import SQLiteKVStore
+
+        kv = SQLiteKVStore(self.dir / "kv.sqlite3", max_entries=10)
+        vectors = SQLiteEmbeddingStore(self.dir / "emb.sqlite3", max_entries=10)
+        for i in range(11):
+            kv.put(f"k{i}", {"i": i}, time.time() + 60)
+            vectors.put_many({f"k{i}": [float(i)]})
+
+        self.assertEqual((len(kv), kv.evictions), (9, 2))
+        self.assertEqual((len(vectors), vectors.evictions), (9, 2))
+
+        parent_conn = kv._conn
+        sqlite_store.reopen_all_stores()
+        self.assertIsNot(kv._conn, parent_conn)
+        self.assertIn(parent_conn, kv._inherited_conns)
+        self.assertEqual(kv.get("k10")[0], {"i": 10})
+        self.assertEqual(vectors.get_many(["k10"]), {"k10": [10.0]})
+
+
+class AnswerCacheGatingTests(SimpleTestCase):
+    def setUp(self):
+        from backend.rag import answer_cache
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.answer_cache = answer_cache
+        self.cache = answer_cache.AnswerCache(
+            Path(tmp.name) / "answers.sqlite3", threshold=0.9, ttl_seconds=60, max_entries=10
+        )
+        patches = [
+            mock.patch.object(answer_cache, "get_answer_cache", return_value=self.cache),
+            mock.patch.object(answer_cache, "get_cached_data_versions", return_value={"majors": 1}),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_sync_and_stream_entry_points_share_one_predicate(self):
+        open_session = self.answer_cache.AnswerCacheSession.open
+        first = [{"role": "user", "content": "컴퓨터공학과 전망"}]
+        later = first + [{"role": "assistant", "content": "..."}, {"role": "user", "content": "연봉은?"}]
+
+        self.assertIsNotNone(open_session("컴퓨터공학과 전망", first, "react"))
+        self.assertIsNone(open_session("연봉은?", later, "react"))
+        self.assertIsNone(open_session("컴퓨터공학과 전망", first, "major"))
+        self.assertIsNone(open_session("컴퓨터공학과 전망", first, "react", interests="코딩"))
+        self.assertEqual(self.cache.stats_snapshot()["bypassed"], 3)
+
+    def test_concurrent_stat_updates_are_not_lost(self):
+        def bump():
+            for _ in range(2000):
+                self.cache.record("misses")
+
+        workers = [threading.Thread(target=bump) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(self.cache.stats_snapshot()["misses"], 8000)
+
+
+class AnswerCacheDegradedRunTests(SimpleTestCase):
+    def setUp(self):
+        from backend.rag import answer_cache, tool_cache, tools
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tool_cache = tool_cache
+        self.tools = tools
+        self.cache = answer_cache.AnswerCache(
+            Path(tmp.name) / "answers.sqlite3", threshold=0.9, ttl_seconds=60, max_entries=10
+        )
+        self.session = answer_cache.AnswerCacheSession(self.cache, "컴퓨터공학과 전망", "v1")
+        self.session._set_vector([1.0, 0.0, 0.0])
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        patches = [
+            mock.patch.object(tools, "_STAGE_EXECUTOR", executor),
+            mock.patch.object(tool_cache, "_get_shared_cache", return_value=None),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run_tool(self, stage_seconds):
+        @self.tool_cache.cached_tool(60, datasets=("majors",))
+        def find(query: str):
+            deadline = time.monotonic() + 0.05
+            future = self.tools._submit_stage(deadline, time.sleep, stage_seconds)
+            self.tools._stage_result(future, deadline, "major_vector", None)
+            return ["컴퓨터공학과"]
+
+        return find("컴퓨터")
+
+    def test_answer_built_from_deadline_missed_stage_is_not_stored(self):
+        with self.tool_cache.tool_run_scope():
+            self._run_tool(stage_seconds=0.3)
+            self.assertTrue(self.tool_cache.is_run_degraded())
+            self.session.store("검색이 지연되어 일부 결과만 안내드려요.")
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertFalse(self.tool_cache.is_run_degraded())
+
+    def test_answer_from_complete_run_is_stored(self):
+        with self.tool_cache.tool_run_scope():
+            self._run_tool(stage_seconds=0)
+            self.session.store("컴퓨터공학과는 전망이 밝아요.")
+
+        self.assertEqual(len(self.cache), 1)
+
+
+class RecommendationCacheKeyTests(SimpleTestCase):
+    def setUp(self):
+        from backend.rag import recommendation_cache
+
+        self.recommendation_cache = recommendation_cache
+        patches = [
+            mock.patch.object(recommendation_cache, "_get_cache", return_value=object()),
+            mock.patch.object(
+                recommendation_cache, "get_cached_data_versions", return_value={"majors": 1}
+            ),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _key(self, engine="exact", weights=None):
+        settings = SimpleNamespace(
+            embedding_provider="openai",
+            embedding_model_name="text-embedding-3-small",
+            recommendation_engine=engine,
+        )
+        with mock.patch.object(self.recommendation_cache, "get_settings", return_value=settings):
+            return self.recommendation_cache.recommendation_cache_key(
+                {"q1": "수학"}, weights or {"summary": 0.8, "interest": 1.3}
+            )
+
+    def test_key_changes_with_engine_and_doc_weights(self):
+        base = self._key()
+        self.assertEqual(base, self._key())
+        self.assertNotEqual(base, self._key(engine="vector"))
+        self.assertNotEqual(base, self._key(weights={"summary": 1.0, "interest": 1.3}))
+
+
+class SeedCategoriesTransactionTests(SimpleTestCase):
+    def setUp(self):
+        from sqlalchemy import create_engine, text
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+
+        from backend.db import seed_categories
+
+        self.seed_categories = seed_categories
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        # major_categories는 MySQL 전용 타입(LONGTEXT)을 쓰므로 직접 생성
+        # (major_aliases / data_versions는 seed_categories가 생성해야 함)
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE major_categories (id INTEGER PRIMARY KEY, category_name TEXT, "
+                    "major_names TEXT, created_at DATETIME, updated_at DATETIME)"
+                )
+            )
+        self.Session = sessionmaker(bind=self.engine)
+        for patcher in (
+            mock.patch.object(seed_categories, "engine", self.engine),
+            mock.patch.object(seed_categories, "SessionLocal", self.Session),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _state(self):
+        from backend.db.models import DataVersion, MajorCategory
+
+        session = self.Session()
+        try:
+            versions = {row.name: row.version for row in session.query(DataVersion).all()}
+            return versions, session.query(MajorCategory).count()
+        finally:
+            session.close()
+
+    def test_categories_aliases_and_versions_commit_together(self):
+        with mock.patch.object(self.seed_categories, "rebuild_major_aliases", return_value=1):
+            self.seed_categories.seed_categories()
+        versions, count = self._state()
+        self.assertEqual(versions, {"major_categories": 1, "majors": 1})
+        self.assertGreater(count, 0)
+
+    def test_alias_failure_rolls_back_and_propagates(self):
+        with mock.patch.object(
+            self.seed_categories, "rebuild_major_aliases", side_effect=RuntimeError("boom")
+        ):
+            with self.assertRaises(RuntimeError):
+                self.seed_categories.seed_categories()
+        self.assertEqual(self._state(), ({}, 0))
+
+
+class MajorCatalogRefreshTests(SimpleTestCase):
+    def setUp(self):
+        from backend.rag import major_catalog
+
+        self.major_catalog = major_catalog
+        saved = (major_catalog._CATALOG, major_catalog._LAST_VERSION_CHECK)
+
+        def restore():
+            major_catalog._CATALOG, major_catalog._LAST_VERSION_CHECK = saved
+
+        self.addCleanup(restore)
+        self.old = SimpleNamespace(version=1)
+        major_catalog._CATALOG = self.old
+        major_catalog._LAST_VERSION_CHECK = 0.0
+        patcher = mock.patch.object(
+            major_catalog,
+            "get_settings",
+            return_value=SimpleNamespace(major_catalog_refresh_seconds=60),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reload_runs_outside_lock_and_readers_keep_current_catalog(self):
+        new = SimpleNamespace(version=2)
+        loading = threading.Event()
+        release = threading.Event()
+        version_checks = []
+
+        def slow_load(version):
+            loading.set()
+            release.wait(5)
+            return new
+
+        def data_version(name):
+            version_checks.append(name)
+            return 2
+
+        with (
+            mock.patch.object(self.major_catalog, "get_data_version", side_effect=data_version),
+            mock.patch.object(self.major_catalog.MajorCatalog, "load", side_effect=slow_load),
+        ):
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                refresher = pool.submit(self.major_catalog.get_major_catalog)
+                self.assertTrue(loading.wait(5))
+
+                # 재로드 중에도 다른 호출은 기다리지 않고 기존 카탈로그를 받음 (버전 확인도 한 번만)
+                self.major_catalog._LAST_VERSION_CHECK = 0.0
+                self.assertIs(self.major_catalog.get_major_catalog(), self.old)
+                self.assertEqual(len(version_checks), 1)
+
+                release.set()
+                self.assertIs(refresher.result(5), new)
+
+        self.assertIs(self.major_catalog._CATALOG, new)
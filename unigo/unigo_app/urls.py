@@ -50,5 +50,11 @@ urlpatterns = [
         views.delete_conversation,
         name="delete_conversation",
     ),
+    path("api/health", views.health, name="health"),
     path("api/onboarding", views.onboarding_api, name="onboarding_api"),
+    path(
+        "api/onboarding/batch",
+        views.onboarding_batch_api,
+        name="onboarding_batch_api",
+    ),
 ]
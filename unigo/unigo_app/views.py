@@ -2,18 +2,25 @@ from django.shortcuts import render, redirect
 from django.http import JsonResponse, StreamingHttpResponse
 from django.contrib.auth import authenticate, login, logout, update_session_auth_hash
 from django.contrib.auth.models import User
+import functools
+import importlib
 import json
 import sys
 import os
 import uuid
 import logging
 import time
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from asgiref.sync import sync_to_async
 
 logger = logging.getLogger("unigo_app")
 
 # 모델
 from .models import Conversation, Message, MajorRecommendation, UserProfile
+from .sse import SSECoalescer, format_sse
 
 # 백엔드 임포트를 위해 프론트엔드 루트를 경로에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -23,14 +30,33 @@ frontend_dir = os.path.dirname(
 if frontend_dir not in sys.path:
     sys.path.append(frontend_dir)
 
-try:
-    from backend.main import run_mentor_stream, run_major_recommendation
-    from backend.rag.tools import summarize_conversation_history
-except ImportError as e:
-    logger.error(f"Backend import failed: {e}")
-    run_mentor_stream = None
-    run_major_recommendation = None
-    summarize_conversation_history = None
+from backend.onboarding_batch import detect_format, parse_onboarding_records
+
+# 백엔드 함수 이름 → 모듈 (처음 사용할 때 import)
+_BACKEND_FUNCTIONS = {
+    "astream_mentor": "backend.main",
+    "run_mentor_stream": "backend.main",
+    "run_major_recommendation": "backend.main",
+    "run_major_recommendation_batch": "backend.main",
+    "summarize_conversation_history": "backend.rag.tools",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _backend(name):
+    """
+    백엔드 함수를 처음 사용할 때 import하여 반환합니다. (import 실패 시 None)
+
+    backend.main은 langgraph, LLM/Pinecone SDK, DB 엔진까지 불러오므로 모듈 로드 시점에 import하면
+    manage.py migrate/collectstatic과 채팅 외 화면까지 그 비용을 치르게 됩니다.
+    gunicorn preload(backend.warmup)로 실행하면 워커 fork 전에 이미 로드되어 있습니다.
+    """
+    try:
+        module = importlib.import_module(_BACKEND_FUNCTIONS[name])
+    except ImportError as e:
+        logger.error(f"Backend import failed: {e}")
+        return None
+    return getattr(module, name)
 
 
 # ============================================
@@ -556,17 +582,84 @@ def delete_account(request):
 # ============================================
 
 
+def _message_text(content):
+    """AIMessageChunk.content(문자열 또는 블록 리스트)를 문자열로 변환"""
+    # [2025-12-16] Fix: Handle list-type content (e.g. from Anthropic/OpenAI multimodal outputs)
+    # to prevent "[object Object]" in frontend.
+    if isinstance(content, list):
+        content_str = ""
+        for block in content:
+            if isinstance(block, str):
+                content_str += block
+            elif isinstance(block, dict) and "text" in block:
+                content_str += block["text"]
+        return content_str
+    return str(content)
+
+
+def _frames_for_chunk(mode, chunk, coalescer):
+    """
+    그래프 스트림 청크 하나를 SSE 프레임으로 변환합니다.
+    (동기 stream_chat_responses / 비동기 astream_chat_responses 공용)
+
+    Returns:
+        (frames, final_content): 내보낼 프레임 목록, DB에 저장할 최종 답변 (없으면 None)
+    """
+    # 1. 메시지 스트리밍 (토큰 단위)
+    if mode == "messages":
+        message, metadata = chunk
+        # 에이전트 노드에서 생성된 AIMessageChunk인 경우에만 처리
+        if (
+            metadata.get("langgraph_node") == "agent"
+            and hasattr(message, "content")
+            and message.content
+        ):
+            # 빈 문자열이면 coalescer가 스킵 (불필요한 패킷 방지)
+            return coalescer.delta(_message_text(message.content)), None
+
+    # 2. 상태 업데이트 (툴 호출 등 확인)
+    elif mode == "updates":
+        step_name = list(chunk.keys())[0]
+
+        if step_name == "agent":
+            agent_messages = chunk["agent"].get("messages", [])
+            if agent_messages:
+                last_ai_message = agent_messages[-1]
+                frames = []
+
+                # 도구 사용 결정 시 상태 업데이트
+                if hasattr(last_ai_message, "tool_calls") and last_ai_message.tool_calls:
+                    tool_names = [call["name"] for call in last_ai_message.tool_calls]
+                    status_message = f"Tool: {', '.join(tool_names)}"
+                    frames = coalescer.event({"type": "status", "content": status_message})
+
+                # [중요] DB 저장을 위해 최종 답변 업데이트 (마지막 메시지 기준)
+                return frames, last_ai_message.content or None
+
+    return [], None
+
+
+def _log_stream_stats(coalescer):
+    logger.debug(
+        f"SSE stream: {coalescer.deltas_in} deltas -> "
+        f"{coalescer.frames_out} frames ({coalescer.bytes_out} bytes)"
+    )
+
+
 def stream_chat_responses(conversation, message_text, chat_history_for_ai):
-    """채팅 응답을 스트리밍하는 제너레이터"""
+    """채팅 응답을 스트리밍하는 제너레이터 (WSGI / runserver용)"""
 
+    run_mentor_stream = _backend("run_mentor_stream")
     if not run_mentor_stream:
         error_msg = "챗봇 백엔드가 연결되지 않았습니다. 관리자에게 문의하세요."
 
-        yield f"data: {json.dumps({'type': 'error', 'content': error_msg})}\n\n"
+        yield format_sse({"type": "error", "content": error_msg})
 
         return
 
     full_response_content = ""
+    # 토큰 조각을 짧은 시간 창 단위로 모아 프레임 수를 줄임 (SSE_COALESCE_WINDOW_MS)
+    coalescer = SSECoalescer()
 
     try:
         # [수정] stream_mode=["messages", "updates"] 로 토큰 스트리밍과 상태 업데이트를 모두 받음
@@ -578,69 +671,24 @@ def stream_chat_responses(conversation, message_text, chat_history_for_ai):
         )
 
         for mode, chunk in stream:
-            # 1. 메시지 스트리밍 (토큰 단위)
-            if mode == "messages":
-                message, metadata = chunk
-                # 에이전트 노드에서 생성된 AIMessageChunk인 경우에만 처리
-                if (
-                    metadata.get("langgraph_node") == "agent"
-                    and hasattr(message, "content")
-                    and message.content
-                ):
-                    # 토큰 전송
-                    # [2025-12-16] Fix: Handle list-type content (e.g. from Anthropic/OpenAI multimodal outputs)
-                    # to prevent "[object Object]" in frontend.
-                    content_str = ""
-                    if isinstance(message.content, list):
-                        for block in message.content:
-                            if isinstance(block, str):
-                                content_str += block
-                            elif isinstance(block, dict) and "text" in block:
-                                content_str += block["text"]
-                    else:
-                        content_str = str(message.content)
-
-                    # 빈 문자열이면 스킵 (불필요한 패킷 방지)
-                    if not content_str:
-                        continue
-
-                    data = {"type": "delta", "content": content_str}
-                    yield f"data: {json.dumps(data)}\n\n"
-
-            # 2. 상태 업데이트 (툴 호출 등 확인)
-            elif mode == "updates":
-                step_name = list(chunk.keys())[0]
-
-                if step_name == "agent":
-                    agent_messages = chunk["agent"].get("messages", [])
-                    if agent_messages:
-                        last_ai_message = agent_messages[-1]
-
-                        # 도구 사용 결정 시 상태 업데이트
-                        if (
-                            hasattr(last_ai_message, "tool_calls")
-                            and last_ai_message.tool_calls
-                        ):
-                            tool_names = [
-                                call["name"] for call in last_ai_message.tool_calls
-                            ]
-                            status_message = f"Tool: {', '.join(tool_names)}"
-                            data = {"type": "status", "content": status_message}
-                            yield f"data: {json.dumps(data)}\n\n"
-
-                        # [중요] DB 저장을 위해 최종 답변 업데이트 (마지막 메시지 기준)
-                        if last_ai_message.content:
-                            full_response_content = last_ai_message.content
+            frames, final_content = _frames_for_chunk(mode, chunk, coalescer)
+            yield from frames
+            if final_content:
+                full_response_content = final_content
 
     except Exception as e:
         logger.error(f"AI Stream Error: {e}", exc_info=True)
 
-        data = {"type": "error", "content": "AI 서버에서 오류가 발생했습니다."}
-
-        yield f"data: {json.dumps(data)}\n\n"
+        yield from coalescer.event(
+            {"type": "error", "content": "AI 서버에서 오류가 발생했습니다."}
+        )
+        yield from coalescer.close()
 
         return
 
+    yield from coalescer.close()
+    _log_stream_stats(coalescer)
+
     # 전체 응답 DB 저장
 
     if full_response_content:
@@ -651,13 +699,78 @@ def stream_chat_responses(conversation, message_text, chat_history_for_ai):
         logger.info(f"Streamed response saved to DB for conversation {conversation.id}")
 
 
-def chat_api(request):
+async def astream_chat_responses(conversation, message_text, chat_history_for_ai):
+    """
+    채팅 응답을 스트리밍하는 async 제너레이터 (ASGI 워커용)
+
+    그래프를 astream_mentor()로 소비하고 DB 저장도 async ORM으로 처리하므로,
+    LLM 응답을 기다리는 동안 워커 스레드를 점유하지 않습니다.
+    프레임 형식은 stream_chat_responses와 같습니다.
+    """
+
+    astream_mentor = _backend("astream_mentor")
+    if not astream_mentor:
+        error_msg = "챗봇 백엔드가 연결되지 않았습니다. 관리자에게 문의하세요."
+
+        yield format_sse({"type": "error", "content": error_msg})
+
+        return
+
+    full_response_content = ""
+    coalescer = SSECoalescer()
+
+    try:
+        stream = astream_mentor(
+            question=message_text,
+            chat_history=chat_history_for_ai,
+            mode="react",
+            stream_mode=["messages", "updates"],
+        )
+
+        async for mode, chunk in stream:
+            frames, final_content = _frames_for_chunk(mode, chunk, coalescer)
+            for frame in frames:
+                yield frame
+            if final_content:
+                full_response_content = final_content
+
+    except Exception as e:
+        logger.error(f"AI Stream Error: {e}", exc_info=True)
+
+        for frame in coalescer.event(
+            {"type": "error", "content": "AI 서버에서 오류가 발생했습니다."}
+        ):
+            yield frame
+        for frame in coalescer.close():
+            yield frame
+
+        return
+
+    for frame in coalescer.close():
+        yield frame
+    _log_stream_stats(coalescer)
+
+    # 전체 응답 DB 저장
+
+    if full_response_content:
+        await Message.objects.acreate(
+            conversation=conversation, role="assistant", content=full_response_content
+        )
+
+        logger.info(f"Streamed response saved to DB for conversation {conversation.id}")
+
+
+async def chat_api(request):
     """
     챗봇 대화 API (DB 저장 및 RAG 답변 생성)
 
-    사용자의 메시지를 받아 DB에 저장하고, Backend RAG 엔진(`run_mentor`)을 호출하여
+    사용자의 메시지를 받아 DB에 저장하고, Backend RAG 엔진을 호출하여
     답변을 생성한 뒤, 이를 다시 DB에 저장하고 프론트엔드에 반환합니다.
 
+    async 뷰이므로 ASGI 워커(gunicorn -k uvicorn.workers.UvicornWorker)에서는
+    astream_chat_responses로 스트리밍하여 응답 하나가 워커를 점유하지 않습니다.
+    WSGI(runserver 등)에서는 async 이터레이터가 버퍼링되므로 동기 제너레이터를 사용합니다.
+
     Args:
         request (HttpRequest): JSON 바디를 포함한 POST 요청
             - message (str): 사용자 질문
@@ -685,53 +798,61 @@ def chat_api(request):
             return JsonResponse({"error": "Empty message"}, status=400)
 
         # 1. 대화 세션 찾기 또는 생성
+        user = await request.auser()
         conversation = None
-        if request.user.is_authenticated:
+        if user.is_authenticated:
             if conversation_id:
                 try:
-                    conversation = Conversation.objects.get(
-                        id=conversation_id, user=request.user
+                    conversation = await Conversation.objects.aget(
+                        id=conversation_id, user=user
                     )
                 except Conversation.DoesNotExist:
-                    conversation = Conversation.objects.create(
-                        user=request.user,
+                    conversation = await Conversation.objects.acreate(
+                        user=user,
                         session_id=str(uuid.uuid4()),
                         title=message_text[:20],
                     )
             else:
-                conversation = Conversation.objects.create(
-                    user=request.user,
+                conversation = await Conversation.objects.acreate(
+                    user=user,
                     session_id=str(uuid.uuid4()),
                     title=message_text[:20],
                 )
         else:
             if not session_id:
                 session_id = str(uuid.uuid4())
-            conversation, _ = Conversation.objects.get_or_create(
+            conversation, _ = await Conversation.objects.aget_or_create(
                 session_id=session_id, defaults={"title": message_text[:20]}
             )
 
         # 2. 사용자 메시지 DB 저장
-        Message.objects.create(
+        await Message.objects.acreate(
             conversation=conversation, role="user", content=message_text
         )
 
         # 3. DB 기반 히스토리 구성
         db_messages = conversation.messages.order_by("created_at").all()
         chat_history_for_ai = [
-            {"role": msg.role, "content": msg.content} for msg in db_messages
+            {"role": msg.role, "content": msg.content} async for msg in db_messages
         ]
 
-        # 4. 스트리밍 응답 생성 및 반환
-        response = StreamingHttpResponse(
-            stream_chat_responses(conversation, message_text, chat_history_for_ai),
-            content_type="text/event-stream",
-        )
+        # 4. 스트리밍 응답 생성 및 반환 (ASGI면 async 제너레이터)
+        if isinstance(request, ASGIRequest):
+            stream = astream_chat_responses(
+                conversation, message_text, chat_history_for_ai
+            )
+        else:
+            stream = stream_chat_responses(
+                conversation, message_text, chat_history_for_ai
+            )
+        response = StreamingHttpResponse(stream, content_type="text/event-stream")
         response["Cache-Control"] = "no-cache"
+        # nginx가 SSE 응답을 버퍼링하지 않도록 함
+        response["X-Accel-Buffering"] = "no"
 
         # conversation_id를 헤더로 전달 (클라이언트가 첫 메시지 후 ID를 알 수 있도록)
         response["X-Conversation-Id"] = conversation.id
-        if not request.user.is_authenticated:
+        if not user.is_authenticated:
             response["X-Session-Id"] = conversation.session_id
 
         return response
@@ -969,6 +1090,7 @@ def onboarding_api(request):
         if not answers:
             return JsonResponse({"error": "Empty answers"}, status=400)
 
+        run_major_recommendation = _backend("run_major_recommendation")
         if not run_major_recommendation:
             return JsonResponse({"error": "Backend not available"}, status=503)
 
@@ -1055,6 +1177,7 @@ def onboarding_api(request):
             session_id=session_id if not user else "",
             onboarding_answers=answers,
             recommended_majors=result.get("recommended_majors", []),
+            served_from_cache=result.get("from_cache", False),
         )
 
         result["session_id"] = session_id
@@ -1068,6 +1191,141 @@ def onboarding_api(request):
         return JsonResponse({"error": str(e)}, status=500)
 
 
+def stream_batch_recommendations(records):
+    """일괄 추천 결과를 학생별 NDJSON 한 줄씩 내보내는 제너레이터"""
+    try:
+        for result in _backend("run_major_recommendation_batch")(
+            [answers for _, answers in records]
+        ):
+            line = {
+                "student_id": records[result["index"]][0],
+                "user_profile_text": result.get("user_profile_text"),
+                "recommended_majors": result.get("recommended_majors", []),
+                "major_scores": result.get("major_scores", {}),
+                "from_cache": result.get("from_cache", False),
+            }
+            yield json.dumps(line, ensure_ascii=False) + "\n"
+    except Exception as e:
+        logger.error(f"Batch Recommendation Error: {e}", exc_info=True)
+        yield json.dumps({"error": "AI 서버에서 오류가 발생했습니다."}) + "\n"
+
+
+async def astream_batch_recommendations(records):
+    """
+    stream_batch_recommendations를 ASGI 워커에서 한 줄씩 흘려보내는 async 제너레이터
+
+    ASGI 핸들러는 동기 이터레이터를 sync_to_async(list)로 모두 모은 뒤 보내므로,
+    학생 수백 명 분량의 일괄 추천이 끝날 때까지 첫 줄도 나가지 않습니다.
+    다음 줄 계산(임베딩/채점)만 스레드에서 실행하고 줄마다 바로 내보냅니다.
+    """
+    lines = stream_batch_recommendations(records)
+    next_line = sync_to_async(next, thread_sensitive=False)
+    try:
+        while True:
+            line = await next_line(lines, None)
+            if line is None:
+                break
+            yield line
+    finally:
+        # 클라이언트 연결이 끊겨도 남은 배치를 계산하지 않도록 제너레이터 정리
+        await sync_to_async(lines.close, thread_sensitive=False)()
+
+
+def _reserve_batch_quota(user_id, count):
+    """
+    사용자별 일괄 추천 처리량(1시간 학생 수)에서 count만큼 예약합니다.
+
+    Django 캐시(CACHES)에 사용자별 카운터를 두므로, 워커 간에 한도를 공유하려면
+    공유 캐시 백엔드(Redis 등)를 설정해야 합니다. (기본 LocMemCache는 워커별)
+
+    Returns:
+        bool: 한도 안이면 True (예약됨), 넘으면 False (예약하지 않음)
+    """
+    limit = settings.ONBOARDING_BATCH_RECORDS_PER_HOUR
+    if limit <= 0:
+        return True
+
+    key = f"onboarding_batch_quota:{user_id}"
+    cache.add(key, 0, timeout=3600)
+    try:
+        used = cache.incr(key, count)
+    except ValueError:
+        # add와 incr 사이에 만료된 경우 새 창으로 시작
+        cache.set(key, count, timeout=3600)
+        used = count
+
+    if used > limit:
+        cache.decr(key, count)
+        return False
+    return True
+
+
+@login_required
+def onboarding_batch_api(request):
+    """
+    온보딩 답변 일괄 추천 API (상담 교사/협력 학교용)
+
+    학급 단위 온보딩 답변 파일을 받아 `run_major_recommendation_batch`로 한꺼번에 추천하고,
+    학생별 결과를 처리되는 대로 NDJSON(한 줄에 JSON 하나)으로 스트리밍합니다.
+    ASGI 워커에서는 astream_batch_recommendations로 줄마다 바로 내보냅니다.
+    개별 학생 계정이 없으므로 MajorRecommendation 기록은 남기지 않습니다.
+
+    학생 수만큼 임베딩/LLM 비용이 드므로 스태프 계정만 사용할 수 있고(403),
+    업로드 크기(ONBOARDING_BATCH_MAX_UPLOAD_BYTES, 413)와
+    사용자별 1시간 처리 학생 수(ONBOARDING_BATCH_RECORDS_PER_HOUR, 429)를 제한합니다.
+
+    Args:
+        request (HttpRequest):
+            - multipart/form-data의 file 필드 (.csv 또는 .jsonl), 또는
+            - 요청 바디 자체 (Content-Type: text/csv 또는 application/x-ndjson)
+
+    Returns:
+        StreamingHttpResponse (application/x-ndjson):
+            {"student_id", "user_profile_text", "recommended_majors", "major_scores", "from_cache"}
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "Method not allowed"}, status=405)
+
+    if not request.user.is_staff:
+        return JsonResponse({"error": "Staff account required"}, status=403)
+
+    if not _backend("run_major_recommendation_batch"):
+        return JsonResponse({"error": "Backend not available"}, status=503)
+
+    try:
+        upload = request.FILES.get("file")
+        if upload is not None:
+            if upload.size > settings.ONBOARDING_BATCH_MAX_UPLOAD_BYTES:
+                return JsonResponse({"error": "Upload too large"}, status=413)
+            text = upload.read().decode("utf-8")
+            fmt = detect_format(upload.name, upload.content_type)
+        else:
+            text = request.body.decode("utf-8")
+            fmt = detect_format(None, request.content_type)
+
+        records = parse_onboarding_records(text, fmt)
+        if not records:
+            return JsonResponse({"error": "Empty upload"}, status=400)
+    except (UnicodeDecodeError, ValueError) as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    if not _reserve_batch_quota(request.user.pk, len(records)):
+        return JsonResponse(
+            {"error": "Hourly batch limit exceeded. Try again later."}, status=429
+        )
+
+    # ASGI면 async 제너레이터 (동기 이터레이터는 ASGI 핸들러가 끝까지 버퍼링함)
+    if isinstance(request, ASGIRequest):
+        stream = astream_batch_recommendations(records)
+    else:
+        stream = stream_batch_recommendations(records)
+    response = StreamingHttpResponse(stream, content_type="application/x-ndjson")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    response["X-Record-Count"] = len(records)
+    return response
+
+
 # ============================================
 # Chat Summarization API
 # ============================================
@@ -1087,6 +1345,7 @@ def summarize_conversation(request):
         if not chat_history:
             return JsonResponse({"error": "Empty chat history"}, status=400)
 
+        summarize_conversation_history = _backend("summarize_conversation_history")
         if not summarize_conversation_history:
             return JsonResponse({"error": "Backend not available"}, status=503)
 
@@ -1096,3 +1355,39 @@ def summarize_conversation(request):
     except Exception as e:
         logger.error(f"Error in summarize_chat: {e}", exc_info=True)
         return JsonResponse({"error": str(e)}, status=500)
+
+
+# ============================================
+# Health API
+# ============================================
+
+
+def health(request):
+    """
+    헬스 체크 API (Public)
+
+    gunicorn preload 워밍업(backend.warmup) 결과와 이 워커의 LLM 클라이언트 재사용/연결 지표를 함께 반환합니다.
+    ?strict=1이면 워밍업이 모든 단계를 마친 경우에만 200, 아니면 503 (readiness probe용)
+    """
+    try:
+        from backend.config import get_llm_client_stats
+        from backend.warmup import get_warmup_status
+
+        warmup = get_warmup_status()
+    except ImportError as e:
+        return JsonResponse({"status": "error", "error": str(e)}, status=503)
+
+    if warmup["ready"]:
+        state = "ok"
+    elif warmup["warmed_pid"] is None:
+        state = "cold"  # 워밍업 없이 실행 (runserver 등): 첫 요청 시 지연 초기화
+    else:
+        state = "degraded"  # 일부 단계 실패: 해당 항목은 첫 사용 시 다시 초기화
+
+    status = 200
+    if request.GET.get("strict") == "1" and not warmup["ready"]:
+        status = 503
+    return JsonResponse(
+        {"status": state, "warmup": warmup, "llm_clients": get_llm_client_stats()},
+        status=status,
+    )